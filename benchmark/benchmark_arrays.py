@@ -0,0 +1,44 @@
+import montepy
+
+import numpy as np
+import time
+
+FAIL_THRESHOLD = 60
+SIZE = 100_000
+PROPERTIES = [
+    "number",
+    "material",
+    "atom_density",
+    "importance.neutron",
+    "universe",
+    "volume",
+]
+
+problem = montepy.MCNP_Problem(None)
+problem.cells.create_many(range(1, SIZE + 1))
+
+start = time.time()
+arrays = problem.cells.to_arrays(PROPERTIES)
+stop = time.time()
+print(f"Getting {len(PROPERTIES)} arrays for {SIZE} cells took {stop - start} seconds")
+total = stop - start
+
+start = time.time()
+for _ in range(100):
+    problem.cells.to_arrays(PROPERTIES)
+stop = time.time()
+print(f"Getting the cached arrays 100 times took {stop - start} seconds")
+total += stop - start
+
+start = time.time()
+problem.cells.set_arrays(
+    {"atom_density": np.linspace(0.01, 1.0, SIZE), "importance.neutron": np.ones(SIZE)}
+)
+stop = time.time()
+print(f"Setting 2 arrays for {SIZE} cells took {stop - start} seconds")
+total += stop - start
+
+if total > FAIL_THRESHOLD:
+    raise RuntimeError(
+        f"Benchmark took too long to complete. It must be faster than: {FAIL_THRESHOLD} s."
+    )
@@ -0,0 +1,52 @@
+import montepy
+
+import random
+import time
+
+FAIL_THRESHOLD = 120
+MAX_SLOW_DOWN = 10
+SIZES = [10_000, 100_000, 1_000_000]
+OPERATIONS = 10_000
+
+random.seed(42)
+total = 0
+per_op = {}
+for size in SIZES:
+    problem = montepy.MCNP_Problem(None)
+    surfs = problem.surfaces
+    start = time.time()
+    objs = surfs.create_many(range(1, size + 1))
+    stop = time.time()
+    total += stop - start
+    print(f"Creating {size} surfaces took {stop - start} seconds")
+
+    samples = random.sample(objs, OPERATIONS)
+    start = time.time()
+    for surf in samples:
+        assert surf in surfs
+        assert surfs.get(surf.number) is surf
+        surfs.check_number(size + 1)
+    for surf in samples[: OPERATIONS // 2]:
+        surfs.remove(surf)
+    for surf in samples[OPERATIONS // 2 :]:
+        del surfs[surf.number]
+    stop = time.time()
+    total += stop - start
+    per_op[size] = (stop - start) / OPERATIONS
+    print(
+        f"Contains, get, check_number, remove, and delete for {OPERATIONS} objects "
+        f"of {size} took {stop - start} seconds"
+    )
+    del problem, surfs, objs, samples
+
+slow_down = per_op[SIZES[-1]] / per_op[SIZES[0]]
+print(f"Operations were {slow_down} times slower for {SIZES[-1]} than {SIZES[0]}")
+
+if total > FAIL_THRESHOLD:
+    raise RuntimeError(
+        f"Benchmark took too long to complete. It must be faster than: {FAIL_THRESHOLD} s."
+    )
+if slow_down > MAX_SLOW_DOWN:
+    raise RuntimeError(
+        f"Collection operations don't scale. They must be less than {MAX_SLOW_DOWN} times slower."
+    )
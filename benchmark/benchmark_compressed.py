@@ -0,0 +1,50 @@
+import montepy
+from montepy.input_parser.input_file import MCNP_InputFile
+
+import gc
+import os
+import tempfile
+import time
+import warnings
+
+FAIL_THRESHOLD = 40
+STREAM_REPEATS = 5
+
+warnings.simplefilter("ignore", montepy.errors.LineExpansionWarning)
+problem = montepy.read_input("benchmark/big_model.imcnp")
+total = 0
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    for extension in ["", ".gz", ".bz2", ".xz"]:
+        out_file = os.path.join(tmp_dir, f"big_model.imcnp{extension}")
+        gc.collect()
+        start = time.time()
+        problem.write_problem(out_file)
+        write_time = time.time() - start
+        size = os.path.getsize(os.path.join(tmp_dir, "big_model.imcnp")) / 1e6
+        # stream the lines like they are read, with non-ASCII characters replaced
+        gc.collect()
+        start = time.time()
+        for _ in range(STREAM_REPEATS):
+            with MCNP_InputFile(out_file).open("rb") as fh:
+                for line in fh:
+                    pass
+        stream_time = (time.time() - start) / STREAM_REPEATS
+        total += write_time + stream_time * STREAM_REPEATS
+        print(
+            f"{extension or 'uncompressed'}: "
+            f"{os.path.getsize(out_file) / 1e6:.3f} MB on disk, "
+            f"writing took {write_time:.3f} seconds, "
+            f"streaming the lines took {stream_time:.3f} seconds ({size / stream_time:.1f} MB/s)"
+        )
+    gc.collect()
+    start = time.time()
+    montepy.read_input(os.path.join(tmp_dir, "big_model.imcnp.gz"))
+    stop = time.time()
+    total += stop - start
+    print(f"Reading the gzip compressed problem took {stop - start} seconds")
+
+if total > FAIL_THRESHOLD:
+    raise RuntimeError(
+        f"Benchmark took too long to complete. It must be faster than: {FAIL_THRESHOLD} s."
+    )
@@ -0,0 +1,73 @@
+import montepy
+
+import gc
+import os
+import tempfile
+import time
+import warnings
+
+FAIL_THRESHOLD = 40
+VARIANTS = 10
+EDITS = 10
+
+warnings.simplefilter("ignore", montepy.errors.LineExpansionWarning)
+problem = montepy.read_input("benchmark/big_model.imcnp")
+numbers = [cell.number for cell in problem.cells if cell.material is not None]
+edited = numbers[:: len(numbers) // EDITS]
+
+
+def format_edited(problem):
+    return [
+        problem.cells[number].format_for_mcnp_input(problem.mcnp_version)
+        for number in edited
+    ]
+
+
+original_lines = format_edited(problem)
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    base_file = os.path.join(tmp_dir, "base.imcnp")
+    problem.write_problem(base_file)
+
+    gc.collect()
+    start = time.time()
+    full_clone = problem.clone()
+    full_time = time.time() - start
+    print(f"A full clone took {full_time} seconds")
+    total = full_time
+
+    clone_time = edit_time = write_time = 0
+    for variant in range(VARIANTS):
+        gc.collect()
+        start = time.time()
+        new_problem = problem.clone(copy_on_write=True)
+        clone_time += time.time() - start
+        start = time.time()
+        for number in edited:
+            new_problem.cells[number].atom_density = 0.05 + variant / 100
+        edit_time += time.time() - start
+        start = time.time()
+        new_problem.write_patch(os.path.join(tmp_dir, f"variant_{variant}.imcnp"))
+        write_time += time.time() - start
+    total += clone_time + edit_time + write_time
+    print(
+        f"{VARIANTS} copy on write clones with {len(edited)} edits each: "
+        f"cloning took {clone_time / VARIANTS} seconds, "
+        f"editing took {edit_time / VARIANTS} seconds, "
+        f"and patching took {write_time / VARIANTS} seconds per variant"
+    )
+
+    for number in edited:
+        full_clone.cells[number].atom_density = 0.05 + (VARIANTS - 1) / 100
+    full_file = os.path.join(tmp_dir, "full.imcnp")
+    full_clone.write_problem(full_file)
+    last_file = os.path.join(tmp_dir, f"variant_{VARIANTS - 1}.imcnp")
+    with open(full_file, "rb") as full, open(last_file, "rb") as patched:
+        assert full.read() == patched.read()
+    # the problem that was cloned is unchanged
+    assert format_edited(problem) == original_lines
+
+if total > FAIL_THRESHOLD:
+    raise RuntimeError(
+        f"Benchmark took too long to complete. It must be faster than: {FAIL_THRESHOLD} s."
+    )
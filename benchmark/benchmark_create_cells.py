@@ -0,0 +1,18 @@
+import montepy
+
+import time
+
+FAIL_THRESHOLD = 60
+SIZE = 100_000
+
+problem = montepy.MCNP_Problem(None)
+
+start = time.time()
+cells = problem.cells.create_many(range(1, SIZE + 1))
+stop = time.time()
+print(f"Creating {SIZE} cells took {stop - start} seconds")
+
+if stop - start > FAIL_THRESHOLD:
+    raise RuntimeError(
+        f"Benchmark took too long to complete. It must be faster than: {FAIL_THRESHOLD} s."
+    )
@@ -0,0 +1,49 @@
+import montepy
+from montepy.input_parser import mcnp_input, block_type
+from montepy.surfaces.surface_builder import surface_builder
+
+import os
+import tempfile
+import time
+import tracemalloc
+
+FAIL_THRESHOLD = 60
+SIZE = 10_000
+
+surfaces = [
+    surface_builder(mcnp_input.Input([line], block_type.BlockType.SURFACE))
+    for line in ["1 so 1", "2 so 2"]
+]
+
+
+def make_cells(start, stop):
+    for number in range(start, stop):
+        cell = montepy.Cell()
+        cell.number = number
+        cell.geometry = +surfaces[0] & -surfaces[1]
+        cell.importance.neutron = 1.0
+        yield cell
+
+
+tracemalloc.start()
+start = time.time()
+with tempfile.TemporaryDirectory() as tmp_dir:
+    out_file = os.path.join(tmp_dir, "streamed.imcnp")
+    with montepy.DeckWriter(out_file, title="streamed") as writer:
+        writer.add_cells(make_cells(1, SIZE // 10))
+        print(
+            f"Peak memory after {SIZE // 10} cells: {tracemalloc.get_traced_memory()[1]/1024/1024} MB"
+        )
+        writer.add_cells(make_cells(SIZE // 10, SIZE + 1))
+        writer.add_surfaces(surfaces)
+    print(f"Wrote {os.path.getsize(out_file) / 1024 / 1024} MB")
+stop = time.time()
+print(
+    f"Peak memory after {SIZE} cells: {tracemalloc.get_traced_memory()[1]/1024/1024} MB"
+)
+print(f"Streaming {SIZE} cells took {stop - start} seconds")
+
+if stop - start > FAIL_THRESHOLD:
+    raise RuntimeError(
+        f"Benchmark took too long to complete. It must be faster than: {FAIL_THRESHOLD} s."
+    )
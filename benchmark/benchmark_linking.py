@@ -0,0 +1,36 @@
+import io
+import montepy
+
+import time
+
+FAIL_THRESHOLD = 60
+SIZE = 5_000
+
+lines = ["Linking benchmark"]
+for i in range(1, SIZE + 1):
+    lines.append(f"{i} {i} -1.0 -{i} imp:n=1")
+lines.append("")
+for i in range(1, SIZE + 1):
+    lines.append(f"{i} {i} so {i}.0")
+lines.append("")
+lines.append("mode n")
+for i in range(1, SIZE + 1):
+    lines.append(f"tr{i} {i}.0 0.0 0.0")
+for i in range(1, SIZE + 1):
+    lines.append(f"m{i} 1001.80c 1.0")
+    lines.append(f"mt{i} lwtr.10t")
+deck = "\n".join(lines) + "\n"
+
+start = time.time()
+problem = montepy.read_input(io.StringIO(deck))
+stop = time.time()
+print(
+    f"Reading {SIZE} cells, surfaces, transforms, and materials took {stop - start} seconds"
+)
+assert problem.surfaces[SIZE].transform is problem.transforms[SIZE]
+assert problem.materials[SIZE].thermal_scattering is not None
+
+if stop - start > FAIL_THRESHOLD:
+    raise RuntimeError(
+        f"Benchmark took too long to complete. It must be faster than: {FAIL_THRESHOLD} s."
+    )
@@ -0,0 +1,36 @@
+import io
+import montepy
+
+import os
+import time
+import warnings
+
+FAIL_THRESHOLD = 30
+
+warnings.simplefilter("ignore", montepy.errors.LineExpansionWarning)
+problem = montepy.read_input("benchmark/big_model.imcnp")
+workers = max(os.cpu_count(), 2)
+
+outputs = []
+total = 0
+for run_workers in [1, workers]:
+    # renumber so that every cell has to be formatted again
+    problem.renumber(cells=1)
+    start = time.time()
+    with io.StringIO() as fh:
+        problem.write_problem(fh, workers=run_workers)
+        outputs.append(fh.getvalue())
+    stop = time.time()
+    total += stop - start
+    print(
+        f"Writing the renumbered model with {run_workers} workers took {stop - start} seconds"
+    )
+    problem.renumber(cells=-1)
+
+if outputs[0] != outputs[1]:
+    raise RuntimeError("The parallel write doesn't match the serial write.")
+
+if total > FAIL_THRESHOLD:
+    raise RuntimeError(
+        f"Benchmark took too long to complete. It must be faster than: {FAIL_THRESHOLD} s."
+    )
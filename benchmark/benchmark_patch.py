@@ -0,0 +1,52 @@
+import montepy
+
+import gc
+import os
+import tempfile
+import time
+import warnings
+
+FAIL_THRESHOLD = 30
+EDITS = 10
+
+warnings.simplefilter("ignore", montepy.errors.LineExpansionWarning)
+problem = montepy.read_input("benchmark/big_model.imcnp")
+cells = [cell for cell in problem.cells if cell.material is not None]
+edited = cells[:: len(cells) // EDITS]
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    base_file = os.path.join(tmp_dir, "base.imcnp")
+    patch_file = os.path.join(tmp_dir, "patched.imcnp")
+    full_file = os.path.join(tmp_dir, "full.imcnp")
+    start = time.time()
+    problem.write_problem(base_file)
+    stop = time.time()
+    total = stop - start
+    print(f"Writing the base file took {stop - start} seconds")
+
+    for run, density in enumerate([0.05, 0.06, 0.07]):
+        for cell in edited:
+            cell.atom_density = density
+        gc.collect()
+        start = time.time()
+        problem.write_patch(patch_file, overwrite=True)
+        patch_time = time.time() - start
+        for cell in edited:
+            cell.atom_density = density + 0.5
+        gc.collect()
+        start = time.time()
+        problem.write_problem(full_file, overwrite=True)
+        full_time = time.time() - start
+        total += patch_time + full_time
+        print(
+            f"Run {run}: patching {len(edited)} edits took {patch_time} seconds, "
+            f"writing the whole problem took {full_time} seconds"
+        )
+    problem.write_patch(patch_file, overwrite=True)
+    with open(patch_file, "rb") as patched, open(full_file, "rb") as full:
+        assert patched.read() == full.read()
+
+if total > FAIL_THRESHOLD:
+    raise RuntimeError(
+        f"Benchmark took too long to complete. It must be faster than: {FAIL_THRESHOLD} s."
+    )
@@ -0,0 +1,71 @@
+import montepy
+
+import time
+
+FAIL_THRESHOLD = 30
+SIZE = 10_000
+LOOPS = 20
+
+problem = montepy.MCNP_Problem(None)
+cells = problem.cells.create_many(range(1, SIZE + 1))
+material = problem.materials.create_many([1])[0]
+surfaces = [
+    montepy.surfaces.surface_builder.surface_builder(
+        montepy.input_parser.mcnp_input.Input(
+            [f"{i} PZ {i}.0"], montepy.input_parser.block_type.BlockType.SURFACE
+        )
+    )
+    for i in range(1, SIZE + 1)
+]
+
+total = 0
+for name, access in [
+    ("number", lambda cell: cell.number),
+    ("material", lambda cell: cell.material),
+    ("importance", lambda cell: cell.importance),
+    ("universe", lambda cell: cell.universe),
+    ("atom_density", lambda cell: cell.atom_density),
+    ("old_number", lambda cell: cell.old_number),
+    ("geometry", lambda cell: cell.geometry),
+    ("surfaces", lambda cell: cell.surfaces),
+]:
+    start = time.time()
+    for _ in range(LOOPS):
+        for cell in cells:
+            access(cell)
+    stop = time.time()
+    total += stop - start
+    print(f"Getting cell.{name} took {(stop - start) / LOOPS / SIZE * 1e9:.0f} ns")
+
+start = time.time()
+for _ in range(LOOPS):
+    for cell in cells:
+        cell.number += SIZE
+stop = time.time()
+total += stop - start
+print(f"Setting cell.number took {(stop - start) / LOOPS / SIZE * 1e9:.0f} ns")
+
+start = time.time()
+for _ in range(LOOPS):
+    for surface in surfaces:
+        surface.surface_constants
+stop = time.time()
+total += stop - start
+print(
+    f"Getting surface.surface_constants took {(stop - start) / LOOPS / SIZE * 1e9:.0f} ns"
+)
+
+start = time.time()
+for _ in range(LOOPS):
+    for surface in surfaces:
+        surface.location = surface.location
+stop = time.time()
+total += stop - start
+print(
+    f"Getting and setting surface.location took {(stop - start) / LOOPS / SIZE * 1e9:.0f} ns"
+)
+
+if total > FAIL_THRESHOLD:
+    raise RuntimeError(
+        f"Benchmark took too long to complete. It must be faster than: {FAIL_THRESHOLD} s."
+    )
@@ -0,0 +1,37 @@
+import montepy
+
+import numpy as np
+import time
+
+FAIL_THRESHOLD = 60
+SIZE = 100_000
+QUERIES = 1_000
+
+problem = montepy.MCNP_Problem(None)
+problem.materials.create_many(range(1, 101))
+problem.cells.create_many(range(1, SIZE + 1))
+rng = np.random.default_rng(42)
+problem.cells.set_arrays(
+    {
+        "material": rng.integers(0, 101, SIZE),
+        "atom_density": rng.uniform(0.01, 2.0, SIZE),
+    }
+)
+
+start = time.time()
+problem.cells.where(material__in=[1, 2, 3], atom_density__lt=1.0)
+stop = time.time()
+print(f"Indexing, and querying {SIZE} cells took {stop - start} seconds")
+total = stop - start
+
+start = time.time()
+for i in range(QUERIES):
+    problem.cells._query(material=i % 100 + 1, atom_density__lt=1.0)
+stop = time.time()
+print(f"Querying {SIZE} cells {QUERIES} times took {stop - start} seconds")
+total += stop - start
+
+if total > FAIL_THRESHOLD:
+    raise RuntimeError(
+        f"Benchmark took too long to complete. It must be faster than: {FAIL_THRESHOLD} s."
+    )
@@ -0,0 +1,37 @@
+import montepy
+
+import time
+
+FAIL_THRESHOLD = 60
+MAX_SLOW_DOWN = 2
+SIZES = [100_000, 1_000_000]
+
+total = 0
+per_obj = {}
+for size in SIZES:
+    problem = montepy.MCNP_Problem(None)
+    problem.materials.create_many(range(1, size + 1))
+
+    start = time.time()
+    problem.renumber(materials=size)
+    problem.renumber(materials="compact")
+    problem.renumber(materials={1: size + 1})
+    stop = time.time()
+    total += stop - start
+    per_obj[size] = (stop - start) / size
+    print(f"Renumbering {size} materials three times took {stop - start} seconds")
+    del problem
+
+slow_down = per_obj[SIZES[-1]] / per_obj[SIZES[0]]
+print(
+    f"Renumbering was {slow_down} times slower per object for {SIZES[-1]} than {SIZES[0]}"
+)
+
+if total > FAIL_THRESHOLD:
+    raise RuntimeError(
+        f"Benchmark took too long to complete. It must be faster than: {FAIL_THRESHOLD} s."
+    )
+if slow_down > MAX_SLOW_DOWN:
+    raise RuntimeError(
+        f"Renumbering doesn't scale linearly. It must be less than {MAX_SLOW_DOWN} times slower per object."
+    )
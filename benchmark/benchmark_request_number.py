@@ -0,0 +1,33 @@
+import montepy
+
+import time
+
+FAIL_THRESHOLD = 30
+SIZE = 100_000
+REQUESTS = 10_000
+
+problem = montepy.MCNP_Problem(None)
+problem.surfaces.create_many(range(1, SIZE + 1))
+template = problem.surfaces[1]
+
+start = time.time()
+for _ in range(REQUESTS):
+    template.clone(1, 1)
+stop = time.time()
+print(
+    f"Cloning {REQUESTS} surfaces into a dense collection of {SIZE} took {stop - start} seconds"
+)
+total = stop - start
+
+start = time.time()
+for _ in range(REQUESTS):
+    problem.surfaces.reserve_numbers(10, 1)
+number = problem.surfaces.next_number()
+stop = time.time()
+print(f"Reserving {REQUESTS} blocks of numbers took {stop - start} seconds")
+total += stop - start
+
+if total > FAIL_THRESHOLD:
+    raise RuntimeError(
+        f"Benchmark took too long to complete. It must be faster than: {FAIL_THRESHOLD} s."
+    )
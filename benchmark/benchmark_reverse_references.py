@@ -0,0 +1,60 @@
+import montepy
+
+import time
+
+FAIL_THRESHOLD = 60
+SIZE = 100_000
+UPDATES = 10_000
+
+problem = montepy.MCNP_Problem(None)
+surfaces = problem.surfaces.create_many(range(1, SIZE + 2))
+materials = problem.materials.create_many(range(1, 11))
+universes = problem.universes.create_many(range(1, 11))
+cells = problem.cells.create_many(range(1, SIZE + 1))
+for i, cell in enumerate(cells):
+    cell.geometry = +surfaces[i] & -surfaces[i + 1]
+    cell.material = materials[i % len(materials)]
+    cell.universe = universes[i % len(universes)]
+
+start = time.time()
+found = 0
+for surface in surfaces:
+    found += len(list(surface.cells))
+for material in materials:
+    found += len(list(material.cells))
+for universe in universes:
+    found += len(list(universe.cells))
+lookup = time.time()
+print(f"Finding the {found} cells of every object took {lookup - start} seconds")
+
+for i in range(UPDATES):
+    j = i * (SIZE // UPDATES)
+    cell = cells[j]
+    cell.material = materials[(i + 1) % len(materials)]
+    cell.universe = universes[(i + 1) % len(universes)]
+    cell.geometry &= -surfaces[j + 2]
+    found += len(list(surfaces[j + 2].cells))
+changed = time.time()
+print(f"Changing and finding {UPDATES} cells took {changed - lookup} seconds")
+
+new_cells = []
+for i in range(UPDATES):
+    cell = montepy.Cell()
+    cell.number = SIZE + 1 + i
+    cell.geometry = -surfaces[i]
+    new_cells.append(cell)
+changed = time.time()
+# adding, and removing cells between lookups keeps the index
+for i, cell in enumerate(new_cells):
+    problem.cells.append(cell)
+    found += len(list(surfaces[i].cells))
+for i, cell in enumerate(new_cells):
+    problem.cells.remove(cell)
+    found += len(list(surfaces[i].cells))
+stop = time.time()
+print(f"Adding, removing, and finding {UPDATES} cells took {stop - changed} seconds")
+
+if stop - start > FAIL_THRESHOLD:
+    raise RuntimeError(
+        f"Benchmark took too long to complete. It must be faster than: {FAIL_THRESHOLD} s."
+    )
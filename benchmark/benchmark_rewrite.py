@@ -0,0 +1,48 @@
+import io
+import montepy
+
+import time
+import warnings
+
+FAIL_THRESHOLD = 5
+
+warnings.simplefilter("ignore", montepy.errors.LineExpansionWarning)
+problem = montepy.read_input("benchmark/big_model.imcnp")
+
+start = time.time()
+problem.write_problem(io.StringIO())
+stop = time.time()
+print(f"Writing the whole model took {stop - start} seconds")
+
+cell = next(iter(problem.cells))
+cell.importance.neutron = 2.0
+
+start = time.time()
+problem.write_problem(io.StringIO())
+stop = time.time()
+print(f"Writing the model again after editing one cell took {stop - start} seconds")
+total = stop - start
+
+# changing helpers, e.g., the parts of a geometry only formats their owner again
+cell = next(cell for cell in problem.cells if cell._geometry.right)
+geometry = cell.geometry
+with warnings.catch_warnings():
+    warnings.simplefilter("ignore", DeprecationWarning)
+    material = next(iter(problem.materials))
+    component = next(iter(material.material_components.values()))
+problem.write_problem(io.StringIO())
+geometry.operator = montepy.Operator.UNION
+component.fraction = component.fraction
+
+start = time.time()
+problem.write_problem(io.StringIO())
+stop = time.time()
+print(
+    f"Writing the model again after editing a geometry, and a material component took {stop - start} seconds"
+)
+total += stop - start
+
+if total > FAIL_THRESHOLD:
+    raise RuntimeError(
+        f"Benchmark took too long to complete. It must be faster than: {FAIL_THRESHOLD} s."
+    )
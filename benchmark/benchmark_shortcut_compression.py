@@ -0,0 +1,45 @@
+import copy
+from montepy.input_parser.block_type import BlockType
+from montepy.input_parser.data_parser import DataParser
+from montepy.input_parser.mcnp_input import Input
+
+import time
+
+FAIL_THRESHOLD = 30
+SIZE = 250_000
+
+input = Input(
+    [
+        f"imp:n 1 {SIZE - 1}R 0 {SIZE - 2}I 1 {SIZE}J 2 {SIZE - 1}R",
+    ],
+    BlockType.DATA,
+)
+list_node = DataParser().parse(input.tokenize())["data"]
+
+start = time.time()
+values = list(list_node)
+stop = time.time()
+print(f"Expanding {len(values)} values took {stop - start} seconds")
+total = 0
+
+# change one value in the middle of every shortcut
+changed = copy.deepcopy(list_node)
+new_values = list(changed)
+for idx in range(SIZE // 2, len(new_values), SIZE):
+    new_values[idx].value = 5.0
+
+for name, node, vals in [
+    ("unchanged", list_node, values),
+    ("changed", changed, new_values),
+]:
+    start = time.time()
+    node.update_with_new_values(vals)
+    stop = time.time()
+    total += stop - start
+    print(f"Compressing {len(vals)} {name} values took {stop - start} seconds")
+    print(node.format()[:80])
+
+if total > FAIL_THRESHOLD:
+    raise RuntimeError(
+        f"Benchmark took too long to complete. It must be faster than: {FAIL_THRESHOLD} s."
+    )
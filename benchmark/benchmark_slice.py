@@ -0,0 +1,28 @@
+import montepy
+
+import time
+
+FAIL_THRESHOLD = 10
+SIZE = 10_000
+STOP = 10_000_000
+REPEATS = 100
+
+problem = montepy.MCNP_Problem(None)
+# sparsely numbered cells
+problem.cells.create_many(range(1, STOP, STOP // SIZE))
+
+start = time.time()
+for _ in range(REPEATS):
+    assert len(problem.cells[1:STOP]) == SIZE
+    problem.cells[STOP // 2 : STOP // 2 + 10_000]
+    problem.cells[::-1000]
+    problem.cells.next_number()
+stop = time.time()
+print(
+    f"Slicing {SIZE} sparsely numbered cells {REPEATS} times took {stop - start} seconds"
+)
+
+if stop - start > FAIL_THRESHOLD:
+    raise RuntimeError(
+        f"Benchmark took too long to complete. It must be faster than: {FAIL_THRESHOLD} s."
+    )
@@ -0,0 +1,57 @@
+import montepy
+
+import gc
+import os
+import tempfile
+import time
+import warnings
+
+FAIL_THRESHOLD = 60
+VARIANTS = 20
+NAIVE_VARIANTS = 2
+WORKERS = 2
+
+warnings.simplefilter("ignore", montepy.errors.LineExpansionWarning)
+problem = montepy.read_input("benchmark/big_model.imcnp")
+numbers = [cell.number for cell in problem.cells if cell.material is not None]
+edited = numbers[:: len(numbers) // 10]
+
+
+def set_density(variant, density):
+    for number in edited:
+        variant.cells[number].atom_density = density
+
+
+densities = [0.05 + i / 1000 for i in range(VARIANTS)]
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    gc.collect()
+    start = time.time()
+    for i, density in enumerate(densities[:NAIVE_VARIANTS]):
+        variant = problem.clone()
+        set_density(variant, density)
+        variant.write_problem(os.path.join(tmp_dir, f"naive_{i}.imcnp"))
+    naive_time = (time.time() - start) / NAIVE_VARIANTS
+    print(f"Cloning, and writing a whole variant took {naive_time} seconds per variant")
+    total = naive_time * NAIVE_VARIANTS
+
+    for workers in [1, WORKERS]:
+        out_dir = os.path.join(tmp_dir, f"sweep_{workers}")
+        gc.collect()
+        start = time.time()
+        paths = montepy.sweep(problem, set_density, densities, out_dir, workers)
+        sweep_time = time.time() - start
+        total += sweep_time
+        print(
+            f"Sweeping {VARIANTS} variants with {workers} workers took {sweep_time} seconds, "
+            f"{sweep_time / VARIANTS} seconds per variant"
+        )
+    for i in range(NAIVE_VARIANTS):
+        naive_path = os.path.join(tmp_dir, f"naive_{i}.imcnp")
+        with open(naive_path, "rb") as naive, open(paths[i], "rb") as swept:
+            assert naive.read() == swept.read()
+
+if total > FAIL_THRESHOLD:
+    raise RuntimeError(
+        f"Benchmark took too long to complete. It must be faster than: {FAIL_THRESHOLD} s."
+    )
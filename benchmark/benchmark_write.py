@@ -0,0 +1,33 @@
+import montepy
+
+import os
+import tempfile
+import time
+import warnings
+
+FAIL_THRESHOLD = 30
+
+warnings.simplefilter("ignore", montepy.errors.LineExpansionWarning)
+problem = montepy.read_input("benchmark/big_model.imcnp")
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    out_file = os.path.join(tmp_dir, "big_model_out.imcnp")
+    total = 0
+    for run in ["formatting everything", "reusing unchanged objects"]:
+        start = time.time()
+        problem.write_problem(out_file, overwrite=True)
+        stop = time.time()
+        total += stop - start
+        with open(out_file, "rb") as fh:
+            data = fh.read()
+        lines = data.count(b"\n")
+        size = len(data) / 1024 / 1024
+        print(
+            f"Writing {lines} lines ({size:.1f} MB) {run} took {stop - start} seconds: "
+            f"{lines / (stop - start):.0f} lines/s, {size / (stop - start):.1f} MB/s"
+        )
+
+if total > FAIL_THRESHOLD:
+    raise RuntimeError(
+        f"Benchmark took too long to complete. It must be faster than: {FAIL_THRESHOLD} s."
+    )
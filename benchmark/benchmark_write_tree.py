@@ -0,0 +1,65 @@
+import montepy
+
+import os
+import tempfile
+import time
+import warnings
+
+FAIL_THRESHOLD = 60
+FILES = 20
+
+warnings.simplefilter("ignore", montepy.errors.LineExpansionWarning)
+warnings.simplefilter("ignore", montepy.errors.LineOverRunWarning)
+problem = montepy.read_input("benchmark/big_model.imcnp")
+version = problem.mcnp_version
+cells = list(problem.cells)
+chunk = len(cells) // FILES + 1
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    # split the cells of the big model into many files read by the top file
+    top_lines = [problem.title.title]
+    for i in range(FILES):
+        name = f"cells_{i}.imcnp"
+        with open(os.path.join(tmp_dir, name), "w") as fh:
+            for cell in cells[i * chunk : (i + 1) * chunk]:
+                fh.writelines(
+                    line + "\n" for line in cell.format_for_mcnp_input(version)
+                )
+        top_lines.append(f"read file={name}")
+    top_lines.append("")
+    for objects in (problem.surfaces, problem.data_inputs):
+        for obj in objects:
+            top_lines += obj.format_for_mcnp_input(version)
+        top_lines.append("")
+    top_file = os.path.join(tmp_dir, "top.imcnp")
+    with open(top_file, "w") as fh:
+        fh.writelines(line + "\n" for line in top_lines)
+
+    total = 0
+    edited = cells[len(cells) // 2].number
+    for method in ["write_tree", "write_problem"]:
+        start = time.time()
+        tree = montepy.read_input(top_file)
+        stop = time.time()
+        total += stop - start
+        print(f"Reading {FILES + 1} files took {stop - start} seconds")
+
+        tree.cells[edited].mass_density = 5.0
+        start = time.time()
+        if method == "write_tree":
+            written = tree.write_tree(top_file, overwrite=True)
+        else:
+            written = [os.path.join(tmp_dir, "flat.imcnp")]
+            tree.write_problem(written[0])
+        stop = time.time()
+        total += stop - start
+        size = sum(os.path.getsize(path) for path in written) / 1024 / 1024
+        print(
+            f"{method} after one edit took {stop - start} seconds, "
+            f"and wrote {len(written)} files ({size:.2f} MB)"
+        )
+
+if total > FAIL_THRESHOLD:
+    raise RuntimeError(
+        f"Benchmark took too long to complete. It must be faster than: {FAIL_THRESHOLD} s."
+    )
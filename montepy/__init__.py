@@ -13,6 +13,8 @@ import importlib.metadata
 from .input_parser.input_reader import read_input
 from montepy.cell import Cell
 from montepy.mcnp_problem import MCNP_Problem
+from montepy.deck_writer import DeckWriter
+from montepy.parameter_sweep import sweep
 from montepy.data_inputs.material import Material
 from montepy.data_inputs.transform import Transform
 from montepy.geometry_operators import Operator
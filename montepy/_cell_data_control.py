@@ -9,6 +9,7 @@ class CellDataPrintController:
 
     def __init__(self):
         self._print_data = {}
+        self._changes = 0
 
     def __getitem__(self, key):
         if not isinstance(key, str):
@@ -28,6 +29,7 @@ class CellDataPrintController:
             raise TypeError("Must be set to a boolean value")
         if key.upper() in montepy.Cell._ALLOWED_KEYWORDS:
             self._print_data[key.lower()] = value
+            self._changes += 1
         else:
             raise KeyError(f"{key} is not a supported cell modifier in MCNP")
 
@@ -3,21 +3,22 @@ import copy
 import itertools
 import numbers
 
-from montepy.cells import Cells
+from montepy.cells import Cells, _CellLinks
 from montepy.constants import BLANK_SPACE_CONTINUE
 from montepy.data_inputs import importance, fill, lattice_input, universe_input, volume
 from montepy.data_inputs.data_parser import PREFIX_MATCHES
 from montepy.input_parser.cell_parser import CellParser
 from montepy.input_parser import syntax_node
 from montepy.errors import *
+from montepy.mcnp_object import _cache_format
 from montepy.numbered_mcnp_object import Numbered_MCNP_Object
 from montepy.data_inputs.material import Material
 from montepy.geometry_operators import Operator
 from montepy.surfaces.half_space import HalfSpace, UnitHalfSpace
-from montepy.surfaces.surface import Surface
 from montepy.surface_collection import Surfaces
 from montepy.universe import Universe
 from montepy.utilities import *
+from montepy.utilities import _claim, _mark_modified
 
 
 def _link_geometry_to_cell(self, geom):
@@ -109,7 +110,7 @@ class Cell(Numbered_MCNP_Object):
         Parses the parameters to make the object and load as an attribute
         """
         found_class_prefixes = set()
-        for key, value in self.parameters.nodes.items():
+        for key, value in self._parameters.nodes.items():
             for input_class in PREFIX_MATCHES:
                 prefix = input_class._class_prefix()
                 if input_class in Cell._INPUTS_TO_PROPERTY and prefix in key.lower():
@@ -186,7 +187,8 @@ class Cell(Numbered_MCNP_Object):
     def universe(self, value):
         if not isinstance(value, Universe):
             raise TypeError("universe must be set to a Universe")
-        self._universe.universe = value
+        with _CellLinks.track_changes(self):
+            self._universe.universe = value
 
     @property
     def not_truncated(self):
@@ -220,6 +222,7 @@ class Cell(Numbered_MCNP_Object):
             raise TypeError("not_truncated_by_parent must be a bool")
         if self.universe.number == 0 and value:
             raise ValueError("can't specify if cell is truncated for universe 0")
+        _mark_modified(self._universe)
         self._universe._not_truncated = value
 
     @property
@@ -306,7 +309,7 @@ class Cell(Numbered_MCNP_Object):
         """
         pass
 
-    @make_prop_pointer("_material", (Material, type(None)), deletable=True)
+    @property
     def material(self):
         """
         The Material object for the cell.
@@ -315,7 +318,21 @@ class Cell(Numbered_MCNP_Object):
 
         :rtype: Material
         """
-        pass
+        return self._material
+
+    @material.setter
+    def material(self, material):
+        if not isinstance(material, (Material, type(None))):
+            raise TypeError(f"material must be of type: {(Material, type(None))}")
+        _mark_modified(self)
+        with _CellLinks.track_changes(self):
+            self._material = material
+
+    @material.deleter
+    def material(self):
+        _mark_modified(self)
+        with _CellLinks.track_changes(self):
+            self._material = None
 
     @make_prop_pointer("_geometry", HalfSpace, validator=_link_geometry_to_cell)
     def geometry(self):
@@ -404,11 +421,13 @@ class Cell(Numbered_MCNP_Object):
             raise TypeError("Atom density must be a number.")
         elif density < 0:
             raise ValueError("Atom density must be a positive number.")
+        _mark_modified(self)
         self._is_atom_dens = True
         self._density = float(density)
 
     @atom_density.deleter
     def atom_density(self):
+        _mark_modified(self)
         self._density = None
 
     @property
@@ -429,11 +448,13 @@ class Cell(Numbered_MCNP_Object):
             raise TypeError("Mass density must be a number.")
         elif density < 0:
             raise ValueError("Mass density must be a positive number.")
+        _mark_modified(self)
         self._is_atom_dens = False
         self._density = float(density)
 
     @mass_density.deleter
     def mass_density(self):
+        _mark_modified(self)
         self._density = None
 
     @property
@@ -478,12 +499,15 @@ class Cell(Numbered_MCNP_Object):
         :returns: a dictionary of the key-value pairs of the parameters.
         :rytpe: dict
         """
+        # the parameters can be changed in place
+        _mark_modified(self)
         return self._parameters
 
     @parameters.setter
     def parameters(self, params):
         if not isinstance(params, dict):
             raise TypeError("parameters must be a dict")
+        _mark_modified(self)
         self._parameters = params
 
     @property
@@ -504,10 +528,7 @@ class Cell(Numbered_MCNP_Object):
         :rtype: generator
         """
         if self._problem:
-            for cell in self._problem.cells:
-                if cell != self:
-                    if self in cell.complements:
-                        yield cell
+            yield from self._problem.cells._get_cells_linked_to("complements", self)
 
     def update_pointers(self, cells, materials, surfaces):
         """
@@ -520,19 +541,21 @@ class Cell(Numbered_MCNP_Object):
         :param surfaces: a surfaces collection of the surfaces in the problem
         :type surfaces: Surfaces
         """
-        self._surfaces = Surfaces()
-        self._complements = Cells()
-        if self.old_mat_number is not None:
-            if self.old_mat_number > 0:
-                try:
-                    self._material = materials[self.old_mat_number]
-                except KeyError:
-                    raise BrokenObjectLinkError(
-                        "Cell", self.number, "Material", self.old_mat_number
-                    )
-            else:
-                self._material = None
-        self._geometry.update_pointers(cells, surfaces, self)
+        _mark_modified(self)
+        with _CellLinks.track_changes(self):
+            self._surfaces = Surfaces()
+            self._complements = Cells()
+            if self.old_mat_number is not None:
+                if self.old_mat_number > 0:
+                    try:
+                        self._material = materials[self.old_mat_number]
+                    except KeyError:
+                        raise BrokenObjectLinkError(
+                            "Cell", self.number, "Material", self.old_mat_number
+                        )
+                else:
+                    self._material = None
+            self._geometry.update_pointers(cells, surfaces, self)
 
     def remove_duplicate_surfaces(self, deleting_dict):
         """Updates old surface numbers to prepare for deleting surfaces.
@@ -545,6 +568,7 @@ class Cell(Numbered_MCNP_Object):
             if dead_surface in self.surfaces:
                 new_deleting_dict[dead_surface] = new_surface
         if len(new_deleting_dict) > 0:
+            _mark_modified(self)
             self.geometry.remove_duplicate_surfaces(new_deleting_dict)
             for dead_surface in new_deleting_dict:
                 self.surfaces.remove(dead_surface)
@@ -556,6 +580,7 @@ class Cell(Numbered_MCNP_Object):
         else:
             mat_num = 0
         self._tree["material"]["mat_number"].value = mat_num
+        _claim(self._geometry, self)
         self._geometry._update_values()
         self._tree.nodes["geometry"] = self.geometry.node
         for input_class, (attr, _) in self._INPUTS_TO_PROPERTY.items():
@@ -647,11 +672,29 @@ class Cell(Numbered_MCNP_Object):
         base_node = UnitHalfSpace(self, True, True)
         return HalfSpace(base_node, Operator.COMPLEMENT)
 
+    def _formatting_state(self):
+        modifiers = tuple(
+            (modifier._modifications, modifier._formatting_state())
+            for modifier in (
+                getattr(self, attr, None)
+                for attr, _ in self._INPUTS_TO_PROPERTY.values()
+            )
+            if modifier is not None
+        )
+        problem = self._problem
+        print_changes = problem.print_in_data_block._changes if problem else None
+        return (modifiers, print_changes)
+
+    @_cache_format
     def format_for_mcnp_input(self, mcnp_version):
         """
         Creates a string representation of this MCNP_Object that can be
         written to file.
 
+        .. versionchanged:: 0.5.4
+            The lines are reused if this cell, its cell modifiers, and its geometry have not changed
+            since it was last formatted.
+
         :param mcnp_version: The tuple for the MCNP version that must be exported to.
         :type mcnp_version: tuple
         :return: a list of strings for the lines that this input will occupy.
@@ -705,6 +748,23 @@ class Cell(Numbered_MCNP_Object):
         ret = "\n".join([l for l in ret.splitlines() if l.strip()])
         return self.wrap_string_for_mcnp(ret, mcnp_version, True)
 
+    def _get_linked_objects(self):
+        """
+        Gets the objects from the problem that this cell links to through its modifiers.
+
+        These are the universes this cell is in, or is filled with, and the fill transform
+        if it is not defined in the cell.
+
+        :returns: a list of the linked objects.
+        :rtype: list
+        """
+        linked = [self._universe._universe, self._fill._universe]
+        if self._fill._universes is not None:
+            linked.extend(self._fill._universes.flat)
+        if self._fill._transform is not None and not self._fill._hidden_transform:
+            linked.append(self._fill._transform)
+        return [obj for obj in linked if obj is not None]
+
     def clone(
         self, clone_material=False, clone_region=False, starting_number=None, step=None
     ):
@@ -720,6 +780,10 @@ class Cell(Numbered_MCNP_Object):
 
         .. versionadded:: 0.5.0
 
+        .. versionchanged:: 0.5.4
+            The objects this cell links to (surfaces, complements, material, universes, and fill transforms)
+            are no longer copied unless requested. Only the parts this cell owns are copied.
+
         :param clone_material: Whether to create a new clone of the material.
         :type clone_material: bool
         :param clone_region: Whether to clone the underlying objects (Surfaces, Cells) of this cell's region.
@@ -757,6 +821,8 @@ class Cell(Numbered_MCNP_Object):
         keys = set(vars(self))
         keys.remove("_material")
         result = Cell.__new__(Cell)
+        # linked objects are put in the memo, so they are shared rather than copied
+        memo = {id(self): result}
         if clone_material:
             if self.material is not None:
                 result._material = self._material.clone()
@@ -764,44 +830,30 @@ class Cell(Numbered_MCNP_Object):
                 result._material = None
         else:
             result._material = self._material
+        if self._material is not None:
+            memo[id(self._material)] = result._material
+        for linked in self._get_linked_objects():
+            memo[id(linked)] = linked
 
         special_keys = {"_surfaces", "_complements"}
         keys -= special_keys
-        memo = {}
-        for key in keys:
-            attr = getattr(self, key)
-            setattr(result, key, copy.deepcopy(attr, memo))
-        if clone_region:
-            region_change_map = {}
-            # ensure the new geometry gets mapped to the new surfaces
-            for special in special_keys:
-                collection = getattr(self, special)
+        # ensure the new geometry gets mapped to the new surfaces
+        for special in special_keys:
+            collection = getattr(self, special)
+            if clone_region:
                 new_objs = []
                 for obj in collection:
                     new_obj = obj.clone()
-                    region_change_map[obj] = new_obj
+                    memo[id(obj)] = new_obj
                     new_objs.append(new_obj)
                 setattr(result, special, type(collection)(new_objs))
-
-        else:
-            region_change_map = {}
-            for special in special_keys:
-                setattr(result, special, copy.copy(getattr(self, special)))
-            leaves = result.geometry._get_leaf_objects()
-            # undo deepcopy of surfaces in cell.geometry
-            for geom_collect, collect in [
-                (leaves[0], self.complements),
-                (leaves[1], self.surfaces),
-            ]:
-                for surf in geom_collect:
-                    try:
-                        region_change_map[surf] = collect[
-                            surf.number if isinstance(surf, (Surface, Cell)) else surf
-                        ]
-                    except KeyError:
-                        # ignore empty surfaces on clone
-                        pass
-        result.geometry.remove_duplicate_surfaces(region_change_map)
+            else:
+                for obj in collection:
+                    memo[id(obj)] = obj
+                setattr(result, special, copy.copy(collection))
+        for key in keys:
+            attr = getattr(self, key)
+            setattr(result, key, copy.deepcopy(attr, memo))
         if self._problem:
             result.number = self._problem.cells.request_number(starting_number, step)
             self._problem.cells.append(result)
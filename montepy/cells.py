@@ -1,10 +1,230 @@
 # Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
+import bisect
+import contextlib
+import weakref
+
 import montepy
 from montepy.numbered_object_collection import NumberedObjectCollection
 from montepy.errors import *
 import warnings
 
 
+class _CellLinks:
+    """
+    An index of which cells use every surface, material, universe, and complemented cell.
+
+    This is what makes :func:`~montepy.surfaces.surface.Surface.cells` and similar
+    properties only take as long as the number of cells they find.
+    The cells for every object are kept in the order of the problem's cells.
+
+    The index is updated in place when cells are added to, or removed from the problem's cells,
+    when the surfaces, or complements of a cell are changed,
+    and when any other links of a cell are changed through :func:`track_changes`.
+
+    .. versionadded:: 0.5.4
+
+    :param cells: the cells of the problem in order.
+    :type cells: Cells
+    """
+
+    _KINDS = ("surfaces", "material", "universe", "complements")
+
+    def __init__(self, cells):
+        self._order = {}
+        self._links = {}
+        self._users = {kind: {} for kind in self._KINDS}
+        self._next_position = 0
+        self.add_cells(cells)
+
+    @staticmethod
+    def _get_links(cell):
+        """
+        Gets the ids of all objects the cell links to.
+
+        :returns: the ids for every kind of link.
+        :rtype: tuple
+        """
+        material = cell._material
+        universe = cell.universe
+        return (
+            tuple(cell._surfaces._objects),
+            (id(material),) if material is not None else (),
+            (id(universe),) if universe is not None else (),
+            tuple(key for key in cell._complements._objects if key != id(cell)),
+        )
+
+    @staticmethod
+    def update(cell):
+        """
+        Updates the index of the cell's problem after the links of the cell were changed.
+
+        :param cell: the cell whose links were changed.
+        :type cell: Cell
+        """
+        problem = cell._problem
+        if problem is not None:
+            links = problem.cells._current_links()
+            if links is not None:
+                links.update_cell(cell)
+
+    @staticmethod
+    @contextlib.contextmanager
+    def track_changes(cell):
+        """
+        Keeps the index of the cell's problem up to date while the links of the cell are changed.
+
+        .. code-block:: python
+
+            with _CellLinks.track_changes(cell):
+                cell._material = material
+
+        :param cell: the cell whose links will be changed.
+        :type cell: Cell
+        """
+        try:
+            yield
+        finally:
+            _CellLinks.update(cell)
+
+    @staticmethod
+    def collection_changed(collection):
+        """
+        Updates the index after the surfaces, or complements of an indexed cell were changed.
+
+        :param collection: the surfaces, or complements of the cell.
+        :type collection: NumberedObjectCollection
+        """
+        cell = collection._link_owner()
+        if cell is not None and (
+            cell._surfaces is collection or cell._complements is collection
+        ):
+            _CellLinks.update(cell)
+
+    def add_cells(self, cells):
+        """
+        Adds cells to the end of the index.
+
+        :param cells: the cells that were added to the end of the problem's cells.
+        :type cells: iterable
+        """
+        for cell in cells:
+            self.__index(cell, self._next_position)
+            self._next_position += 1
+
+    def remove_cells(self, cells):
+        """
+        Removes cells from the index.
+
+        :param cells: the cells that were removed from the problem's cells.
+        :type cells: iterable
+        """
+        for cell in cells:
+            self.__unindex(cell)
+
+    def replace_cell(self, original, copied):
+        """
+        Puts a cell in the place of another one in the index.
+
+        :param original: the cell that was replaced.
+        :type original: Cell
+        :param copied: the cell that replaced it.
+        :type copied: Cell
+        """
+        position = self.__unindex(original)
+        if position is not None:
+            self.__index(copied, position)
+
+    def __index(self, cell, position):
+        """
+        Adds the links of one cell at its position.
+
+        The surfaces, and complements of the cell are marked as owned by it,
+        so changing them updates this index.
+        """
+        links = self._get_links(cell)
+        self._order[id(cell)] = position
+        self._links[id(cell)] = links
+        for kind, keys in zip(self._KINDS, links):
+            users = self._users[kind]
+            for key in keys:
+                bisect.insort(users.setdefault(key, []), (position, cell))
+        owner = weakref.ref(cell)
+        cell._surfaces._link_owner = owner
+        cell._complements._link_owner = owner
+
+    def __unindex(self, cell):
+        """
+        Removes the links of one cell.
+
+        :returns: the position the cell had, or ``None`` if it wasn't in this index.
+        :rtype: int
+        """
+        position = self._order.pop(id(cell), None)
+        if position is None:
+            return None
+        for kind, keys in zip(self._KINDS, self._links.pop(id(cell))):
+            self.__remove_users(kind, keys, position)
+        return position
+
+    def __remove_users(self, kind, keys, position):
+        users = self._users[kind]
+        for key in keys:
+            found = users[key]
+            del found[bisect.bisect_left(found, (position,))]
+            if not found:
+                del users[key]
+
+    def update_cell(self, cell):
+        """
+        Updates the links of a single cell, which is the only thing that changed.
+
+        :param cell: the cell whose links changed.
+        :type cell: Cell
+        """
+        position = self._order.get(id(cell))
+        if position is None:
+            return
+        old_links = self._links[id(cell)]
+        new_links = self._get_links(cell)
+        for kind, old_keys, new_keys in zip(self._KINDS, old_links, new_links):
+            if old_keys == new_keys:
+                continue
+            old_keys = set(old_keys)
+            new_keys = set(new_keys)
+            self.__remove_users(kind, old_keys - new_keys, position)
+            users = self._users[kind]
+            for key in new_keys - old_keys:
+                bisect.insort(users.setdefault(key, []), (position, cell))
+        self._links[id(cell)] = new_links
+        owner = weakref.ref(cell)
+        cell._surfaces._link_owner = owner
+        cell._complements._link_owner = owner
+
+    def get_cells(self, kind, obj, *others):
+        """
+        Gets the cells that link to the given object.
+
+        .. versionchanged:: 0.5.4
+            More objects can be given, e.g., an object, and the copy of it in a copy-on-write clone.
+
+        :param kind: the kind of link, e.g., ``"surfaces"``.
+        :type kind: str
+        :param obj: the object to find the cells for.
+        :type obj: MCNP_Object
+        :param others: other objects to find the cells for as well.
+        :returns: the cells in the problem's order.
+        :rtype: list
+        """
+        users = self._users[kind]
+        found = users.get(id(obj), ())
+        if others:
+            found = dict(found)
+            for other in others:
+                found.update(users.get(id(other), ()))
+            found = sorted(found.items())
+        return [cell for _, cell in found]
+
+
 class Cells(NumberedObjectCollection):
     """A collections of multiple :class:`montepy.cell.Cell` objects.
 
@@ -14,17 +234,102 @@ class Cells(NumberedObjectCollection):
     :type problem: MCNP_Problem
     """
 
+    _ARRAY_POINTERS = {"material": "materials", "universe": "universes"}
+
     def __init__(self, cells=None, problem=None):
         self.__blank_modifiers = set()
+        self.__links = None
         super().__init__(montepy.Cell, cells, problem)
-        self.__setup_blank_cell_modifiers()
+
+    def __getstate__(self):
+        state = super().__getstate__()
+        # the index is by id, so it can't be copied
+        state["_Cells__links"] = None
+        return state
+
+    def _share(self, problem, copy_on_write):
+        result = super()._share(problem, copy_on_write)
+        result.__links = None
+        result.__blank_modifiers = set(self.__blank_modifiers)
+        return result
+
+    def _replace(self, original, copied):
+        super()._replace(original, copied)
+        if self.__links is not None:
+            self.__links.replace_cell(original, copied)
+
+    def _members_changed(self, added=(), removed=()):
+        super()._members_changed(added, removed)
+        links = self.__links
+        if links is not None:
+            links.remove_cells(removed)
+            links.add_cells(added)
+
+    def _get_cells_linked_to(self, kind, obj):
+        """
+        Gets the cells in this collection that link to the given object.
+
+        This uses an index of the links, which is built the first time it is needed,
+        and is kept up to date after that.
+
+        .. versionadded:: 0.5.4
+
+        :param kind: the kind of link: ``"surfaces"``, ``"material"``, ``"universe"``, or ``"complements"``.
+        :type kind: str
+        :param obj: the object to find the cells for.
+        :type obj: MCNP_Object
+        :returns: the cells in the order of this collection.
+        :rtype: list
+        """
+        if self.__links is None:
+            self.__links = _CellLinks(self._objects.values())
+        copy_on_write = self._copy_on_write
+        if copy_on_write is None:
+            return self.__links.get_cells(kind, obj)
+        # the cells that weren't copied yet still link to the original
+        others = []
+        original = copy_on_write.originals.get(id(obj))
+        if original is not None:
+            others.append(original)
+        cells = self.__links.get_cells(kind, obj, *others)
+        return [self._hand_out(cell) for cell in cells]
+
+    def _current_links(self):
+        """
+        Gets the index of the links of these cells, if it exists.
+
+        :rtype: _CellLinks
+        """
+        return self.__links
+
+    def __getattr__(self, attr):
+        """
+        Creates blank cell modifiers the first time they are needed.
+
+        Most ``Cells`` collections, e.g., the complements of every cell, never
+        use their data block cell modifiers, so they are not made until they are accessed.
+        """
+        for card_class, (modifier_attr, _) in montepy.Cell._INPUTS_TO_PROPERTY.items():
+            # blank modifiers can't be made before __init__, e.g., while unpickling
+            if attr == modifier_attr and "_Cells__blank_modifiers" in self.__dict__:
+                break
+        else:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{attr}'"
+            )
+        card = card_class()
+        self.__blank_modifiers.add(attr)
+        setattr(self, attr, card)
+        if self._problem is not None:
+            card.link_to_problem(self._problem)
+        return card
 
     def __setup_blank_cell_modifiers(self, problem=None, check_input=False):
         inputs_to_always_update = {"_universe", "_fill"}
         inputs_to_property = montepy.Cell._INPUTS_TO_PROPERTY
         for card_class, (attr, _) in inputs_to_property.items():
             try:
-                if not hasattr(self, attr):
+                if attr not in self.__dict__:
                     card = card_class()
                     self.__blank_modifiers.add(attr)
                     setattr(self, attr, card)
@@ -87,6 +392,9 @@ class Cells(NumberedObjectCollection):
     def allow_mcnp_volume_calc(self, value):
         if not isinstance(value, bool):
             raise TypeError("allow_mcnp_volume_calc must be set to a bool")
+        if self._copy_on_write is not None:
+            # the volume input is shared with the problem that was cloned until it is changed
+            self._copy_on_write.copy(self._volume)
         self._volume.is_mcnp_calculated = value
 
     def link_to_problem(self, problem):
@@ -100,7 +408,9 @@ class Cells(NumberedObjectCollection):
         super().link_to_problem(problem)
         inputs_to_property = montepy.Cell._INPUTS_TO_PROPERTY
         for attr, _ in inputs_to_property.values():
-            getattr(self, attr).link_to_problem(problem)
+            # blank modifiers that haven't been made yet are linked when they are made
+            if attr in self.__dict__:
+                getattr(self, attr).link_to_problem(problem)
 
     def update_pointers(
         self, cells, materials, surfaces, data_inputs, problem, check_input=False
@@ -132,12 +442,12 @@ class Cells(NumberedObjectCollection):
         inputs_to_property = montepy.Cell._INPUTS_TO_PROPERTY
         inputs_to_always_update = {"_universe", "_fill"}
         inputs_loaded = set()
+        merged = set()
         # start fresh for loading cell modifiers
         for attr in self.__blank_modifiers:
             delattr(self, attr)
         self.__blank_modifiers = set()
-        # make a copy of the list
-        for input in list(data_inputs):
+        for input in data_inputs:
             if type(input) in inputs_to_property:
                 input_class = type(input)
                 attr, cant_repeat = inputs_to_property[input_class]
@@ -149,17 +459,20 @@ class Cells(NumberedObjectCollection):
                         )
                     except MalformedInputError as e:
                         handle_error(e)
-                if not hasattr(self, attr):
+                if attr not in self.__dict__:
                     setattr(self, attr, input)
                     problem.print_in_data_block[input._class_prefix()] = True
                 else:
                     try:
                         getattr(self, attr).merge(input)
-                        data_inputs.remove(input)
+                        merged.add(id(input))
                     except MalformedInputError as e:
                         handle_error(e)
                 if cant_repeat:
                     inputs_loaded.add(type(input))
+        # remove all merged inputs in one pass
+        if merged:
+            data_inputs[:] = [input for input in data_inputs if id(input) not in merged]
         for cell in self:
             try:
                 cell.update_pointers(cells, materials, surfaces)
@@ -175,8 +488,15 @@ class Cells(NumberedObjectCollection):
 
     def _run_children_format_for_mcnp(self, data_inputs, mcnp_version):
         ret = []
+        # compare by identity, as comparing to materials hashes all of their components
+        data_ids = {id(data_input) for data_input in data_inputs}
         for attr, _ in montepy.Cell._INPUTS_TO_PROPERTY.values():
-            if getattr(self, attr) not in data_inputs:
-                if buf := getattr(self, attr).format_for_mcnp_input(mcnp_version):
+            modifier = getattr(self, attr)
+            if id(modifier) not in data_ids:
+                if self._copy_on_write is not None:
+                    buf = self._copy_on_write.format_modifier(modifier, mcnp_version)
+                else:
+                    buf = modifier.format_for_mcnp_input(mcnp_version)
+                if buf:
                     ret += buf
         return ret
@@ -5,6 +5,7 @@ from montepy.data_inputs.data_input import DataInputAbstract
 from montepy.input_parser import syntax_node
 from montepy.input_parser.block_type import BlockType
 from montepy.input_parser.mcnp_input import Input, Jump
+from montepy.utilities import _SharedObjects, _unshare
 import warnings
 
 
@@ -24,6 +25,12 @@ class CellModifierInput(DataInputAbstract):
     :type value: SyntaxNode
     """
 
+    _collected_values = None
+    """
+    The values to print in the data block, if they were collected from the cells before formatting,
+    e.g., for a copy-on-write clone.
+    """
+
     def __init__(self, input=None, in_cell_block=False, key=None, value=None):
         fast_parse = False
         if key and value:
@@ -203,6 +210,31 @@ class CellModifierInput(DataInputAbstract):
             ret.append(input._tree_value)
         return ret
 
+    def _get_new_values(self):
+        """
+        Gets the values to print in the data block,
+        which are collected with :func:`_collect_new_values` unless they were collected already.
+
+        .. versionadded:: 0.5.4
+
+        :returns: the values for all cells.
+        """
+        if self._collected_values is not None:
+            return self._collected_values
+        return self._collect_new_values()
+
+    def _unshare_data_tree(self):
+        """
+        Copies this for the copy-on-write clones that share it, before its data block syntax tree is updated.
+
+        The syntax tree is updated from the cells of the problem,
+        which the clones that share this may not have.
+
+        .. versionadded:: 0.5.4
+        """
+        if _SharedObjects.clones:
+            _unshare(self, while_reading=True)
+
     @abstractmethod
     def _update_cell_values(self):
         """
@@ -216,8 +248,9 @@ class CellModifierInput(DataInputAbstract):
         if self.in_cell_block:
             self._update_cell_values()
         else:
-            new_vals = self._collect_new_values()
-            self.data.update_with_new_values(new_vals)
+            new_vals = self._get_new_values()
+            self._unshare_data_tree()
+            self._tree["data"].update_with_new_values(new_vals)
 
     def _format_tree(self):
         """
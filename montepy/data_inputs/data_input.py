@@ -12,6 +12,7 @@ from montepy.input_parser.data_parser import (
 from montepy.input_parser.mcnp_input import Input
 from montepy.particle import Particle
 from montepy.mcnp_object import MCNP_Object
+from montepy.utilities import _mark_modified
 
 import re
 
@@ -153,6 +154,8 @@ class DataInputAbstract(MCNP_Object):
         :returns: The syntax tree with the information.
         :rtype: ListNode
         """
+        # the tree can be changed in place
+        _mark_modified(self)
         return self._tree["data"]
 
     @property
@@ -165,6 +168,7 @@ class DataInputAbstract(MCNP_Object):
         :returns: the classifier for this data_input.
         :rtype: ClassifierNode
         """
+        _mark_modified(self)
         return self._tree["classifier"]
 
     def validate(self):
@@ -52,6 +52,10 @@ class Element:
     def __repr__(self):
         return f"Z={self.Z}, symbol={self.symbol}, name={self.name}"
 
+    def __deepcopy__(self, memo):
+        # Elements are immutable, so they can be shared
+        return self
+
     def __hash__(self):
         return hash(self.Z)
 
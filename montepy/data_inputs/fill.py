@@ -9,6 +9,7 @@ from montepy.input_parser import syntax_node
 from montepy.mcnp_object import MCNP_Object
 from montepy.universe import Universe
 from montepy.utilities import *
+from montepy.utilities import _mark_modified
 import numpy as np
 
 
@@ -46,7 +47,7 @@ class Fill(CellModifierInput):
                 self._parse_cell_input(key, value)
         elif input:
             self._old_numbers = []
-            values = self.data
+            values = self._tree["data"]
             for value in values:
                 try:
                     value._convert_to_int()
@@ -226,10 +227,12 @@ class Fill(CellModifierInput):
             raise ValueError(
                 "A single universe can only be set when multiple_universes is False."
             )
+        _mark_modified(self)
         self._universe = value
 
     @universe.deleter
     def universe(self):
+        _mark_modified(self)
         self._universe = None
 
     @property
@@ -253,10 +256,12 @@ class Fill(CellModifierInput):
             raise ValueError(
                 "Multiple universes can only be set when multiple_universes is True."
             )
+        _mark_modified(self)
         self._universes = value
 
     @universes.deleter
     def universes(self):
+        _mark_modified(self)
         self._universes = None
 
     @property
@@ -297,6 +302,7 @@ class Fill(CellModifierInput):
     def multiple_universes(self, value):
         if not isinstance(value, bool):
             raise TypeError("Multiple_univeses must be set to a bool")
+        _mark_modified(self)
         self._multi_universe = value
 
     @make_prop_val_node("_old_number")
@@ -367,6 +373,7 @@ class Fill(CellModifierInput):
     def transform(self, value):
         if not isinstance(value, (Transform, type(None))):
             raise TypeError("Transform must be set to a Transform.")
+        _mark_modified(self)
         self._transform = value
         if value is not None:
             self._hidden_transform = value.hidden_transform
@@ -375,6 +382,7 @@ class Fill(CellModifierInput):
 
     @transform.deleter
     def transform(self):
+        _mark_modified(self)
         self._transform = None
 
     @make_prop_val_node("_old_transform_number")
@@ -471,6 +479,23 @@ class Fill(CellModifierInput):
             f"Min/Max: {str(self.min_index) + ' ' +str(self.max_index) if self._multi_universe == True  else 'None'}"
         )
 
+    def _formatting_state(self):
+        # the universes, and indices are arrays that can be changed in place.
+        universes = ()
+        if self._universes is not None:
+            universes = (
+                tuple(map(id, self._universes.flat)),
+                self._min_index.tobytes(),
+                self._max_index.tobytes(),
+            )
+        transform = ()
+        if self._transform is not None:
+            transform = (
+                self._transform._modifications,
+                self._transform._formatting_state(),
+            )
+        return universes + transform
+
     def _update_cell_values(self):
         # Todo update matrix fills
         new_vals = list(self._tree["data"])
@@ -9,6 +9,7 @@ from montepy.input_parser import syntax_node
 from montepy.mcnp_object import MCNP_Object
 from montepy.particle import Particle
 from montepy.utilities import *
+from montepy.utilities import _mark_modified
 import numbers
 
 #
@@ -125,6 +126,7 @@ class Importance(CellModifierInput):
             raise TypeError("Can only be merged with other Importance object")
         if self.in_cell_block != other.in_cell_block:
             raise ValueError("Can not mix cell-level and data-level Importance objects")
+        _mark_modified(self)
         if other.set_in_cell_block:
             self._set_in_cell_block = True
         for particle in other:
@@ -165,6 +167,7 @@ class Importance(CellModifierInput):
             raise TypeError("importance must be a number")
         if value < 0:
             raise ValueError("importance must be ≥ 0")
+        _mark_modified(self)
         if particle not in self._particle_importances:
             self._generate_default_cell_tree(particle)
         self._particle_importances[particle]["data"][0].value = value
@@ -172,6 +175,7 @@ class Importance(CellModifierInput):
     def __delitem__(self, particle):
         if not isinstance(particle, Particle):
             raise TypeError("Key must be a particle")
+        _mark_modified(self)
         del self._particle_importances[particle]
 
     def __str__(self):
@@ -262,6 +266,7 @@ class Importance(CellModifierInput):
         value = float(value)
         if value < 0.0:
             raise ValueError("Importance must be ≥ 0.0")
+        _mark_modified(self)
         if self._problem:
             for particle in self._problem.mode:
                 self._particle_importances[particle]["data"][0].value = value
@@ -291,7 +296,10 @@ class Importance(CellModifierInput):
                     )
                 new_vals[particle].append(tree["data"][0])
                 if len(particle_pairings[particle]) == 0:
-                    particle_pairings[particle] = tree["classifier"].particles.particles
+                    # a copy, so that the cell's particles aren't changed by the intersection
+                    particle_pairings[particle] = set(
+                        tree["classifier"].particles.particles
+                    )
                 else:
                     particle_pairings[particle] &= tree[
                         "classifier"
@@ -308,7 +316,8 @@ class Importance(CellModifierInput):
                     if isinstance(edge, syntax_node.ValueNode) and edge.padding is None:
                         edge.padding = syntax_node.PaddingNode(" ")
         else:
-            new_vals = self._collect_new_values()
+            new_vals = self._get_new_values()
+            self._unshare_data_tree()
             for part_set, data in new_vals.items():
                 for particle in part_set:
                     if particle not in self._real_tree:
@@ -2,6 +2,7 @@
 from montepy.data_inputs.element import Element
 from montepy.errors import *
 from montepy.input_parser.syntax_node import PaddingNode, ValueNode
+from montepy.utilities import _deepcopy_state, _mark_modified
 
 import warnings
 
@@ -30,6 +31,13 @@ class Isotope:
     Points on bounding curve for determining if "valid" isotope
     """
 
+    _owner = None
+    """
+    The material that formats this, and counts the changes to it.
+
+    .. versionadded:: 0.5.4
+    """
+
     def __init__(self, ZAID="", node=None, suppress_warning=False):
         if not suppress_warning:
             warnings.warn(
@@ -193,6 +201,7 @@ class Isotope:
     def library(self, library):
         if not isinstance(library, str):
             raise TypeError("library must be a string")
+        _mark_modified(self)
         self._library = library
 
     def __repr__(self):
@@ -230,6 +239,18 @@ class Isotope:
         suffix = f" ({self._library})" if self._library else ""
         return f"{self.element.symbol:>2}-{self.A:<3}{meta_suffix:<2}{suffix}"
 
+    def __deepcopy__(self, memo):
+        cls = type(self)
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        state = self.__dict__.copy()
+        owner = state.pop("_owner", None)
+        result.__dict__.update(_deepcopy_state(state, memo))
+        # the owner is only kept if it is being copied as well
+        if owner is not None:
+            result._owner = memo.get(id(owner))
+        return result
+
     def __hash__(self):
         return hash(self._ZAID)
 
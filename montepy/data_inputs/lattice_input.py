@@ -38,7 +38,7 @@ class LatticeInput(CellModifierInput):
                 self._lattice = val
         elif input:
             self._lattice = []
-            words = self.data
+            words = self._tree["data"]
             for word in words:
                 try:
                     word._convert_to_int()
@@ -9,6 +9,7 @@ from montepy import mcnp_object
 from montepy.numbered_mcnp_object import Numbered_MCNP_Object
 from montepy.errors import *
 from montepy.utilities import *
+from montepy.utilities import _claim, _mark_modified
 import itertools
 import re
 
@@ -70,9 +71,10 @@ class Material(data_input.DataInputAbstract, Numbered_MCNP_Object):
                             f"Material definitions for material: {self.number} cannot use atom and mass fraction at the same time",
                         )
 
-                self._material_components[isotope] = MaterialComponent(
-                    isotope, fraction, suppress_warning=True
-                )
+                component = MaterialComponent(isotope, fraction, suppress_warning=True)
+                _claim(isotope, self)
+                _claim(component, self)
+                self._material_components[isotope] = component
 
     @make_prop_val_node("_old_number")
     def old_number(self):
@@ -131,9 +133,7 @@ See <https://www.montepy.org/migrations/migrate0_1.html> for more information ""
         :rtype: generator
         """
         if self._problem:
-            for cell in self._problem.cells:
-                if cell.material == self:
-                    yield cell
+            yield from self._problem.cells._get_cells_linked_to("material", self)
 
     def format_for_mcnp_input(self, mcnp_version):
         """
@@ -150,9 +150,22 @@ See <https://www.montepy.org/migrations/migrate0_1.html> for more information ""
             lines += self.thermal_scattering.format_for_mcnp_input(mcnp_version)
         return lines
 
+    def _formatting_state(self):
+        # the components can be swapped in the dictionary without using this material.
+        # the thermal scattering is printed with this, but counts its own changes.
+        thermal = self._thermal_scattering
+        return (
+            tuple(map(id, self._material_components)),
+            tuple(map(id, self._material_components.values())),
+            id(thermal),
+            thermal._modifications if thermal is not None else None,
+        )
+
     def _update_values(self):
         new_list = syntax_node.IsotopesNode("new isotope list")
         for idx, (isotope, component) in enumerate(self._material_components.items()):
+            _claim(isotope, self)
+            _claim(component, self)
             isotope._tree.value = isotope.mcnp_str()
             node = component._tree
             node.is_negatable_float = True
@@ -173,6 +186,7 @@ See <https://www.montepy.org/migrations/migrate0_1.html> for more information ""
             raise TypeError(
                 f"Thermal Scattering law for material {self.number} must be a string"
             )
+        _mark_modified(self)
         self._thermal_scattering = thermal_scattering.ThermalScatteringLaw(
             material=self
         )
@@ -1,7 +1,7 @@
 # Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
 from montepy.data_inputs.isotope import Isotope
 from montepy.input_parser.syntax_node import PaddingNode, ValueNode
-from montepy.utilities import make_prop_val_node
+from montepy.utilities import make_prop_val_node, _deepcopy_state
 
 import warnings
 
@@ -30,6 +30,13 @@ class MaterialComponent:
     :type suppress_warning: bool
     """
 
+    _owner = None
+    """
+    The material that formats this, and counts the changes to it.
+
+    .. versionadded:: 0.5.4
+    """
+
     def __init__(self, isotope, fraction, suppress_warning=False):
         if not suppress_warning:
             warnings.warn(
@@ -51,6 +58,18 @@ See <https://www.montepy.org/migrations/migrate0_1.html> for more information ""
             raise ValueError(f"Fraction must be > 0. {fraction.value} given.")
         self._fraction = fraction
 
+    def __deepcopy__(self, memo):
+        cls = type(self)
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        state = self.__dict__.copy()
+        owner = state.pop("_owner", None)
+        result.__dict__.update(_deepcopy_state(state, memo))
+        # the owner is only kept if it is being copied as well
+        if owner is not None:
+            result._owner = memo.get(id(owner))
+        return result
+
     @property
     def isotope(self):
         """
@@ -2,6 +2,7 @@
 from montepy.data_inputs.data_input import DataInputAbstract
 from montepy.input_parser import syntax_node
 from montepy.particle import Particle
+from montepy.utilities import _mark_modified
 
 
 class Mode(DataInputAbstract):
@@ -69,6 +70,7 @@ class Mode(DataInputAbstract):
             if isinstance(particle, syntax_node.ValueNode):
                 particle = particle.value
             particle = Particle(particle.upper())
+        _mark_modified(self)
         self._particles.add(particle)
 
     def remove(self, particle):
@@ -83,6 +85,7 @@ class Mode(DataInputAbstract):
             raise TypeError("particle must be a Particle instance")
         if isinstance(particle, str):
             particle = Particle(particle.upper())
+        _mark_modified(self)
         self._particles.remove(particle)
 
     def set(self, particles):
@@ -110,6 +113,7 @@ class Mode(DataInputAbstract):
         else:
             particles = particles.split()
             is_str = True
+        _mark_modified(self)
         if is_str:
             self._parse_and_override_particle_modes(particles)
         else:
@@ -4,6 +4,7 @@ from montepy.input_parser.thermal_parser import ThermalParser
 from montepy import mcnp_object
 from montepy.errors import *
 from montepy.utilities import *
+from montepy.utilities import _mark_modified
 import montepy
 
 
@@ -86,6 +87,7 @@ class ThermalScatteringLaw(DataInputAbstract):
                 raise TypeError(
                     f"element {law} in thermal_scattering_laws must be a string"
                 )
+        _mark_modified(self)
         self._scattering_laws.clear()
         for law in laws:
             self._scattering_laws.append(self._generate_default_node(str, law))
@@ -97,6 +99,7 @@ class ThermalScatteringLaw(DataInputAbstract):
         :param law: the thermal scattering law to add.
         :type law: str
         """
+        _mark_modified(self)
         self._scattering_laws.append(self._generate_default_node(str, law))
 
     def validate(self):
@@ -133,19 +136,20 @@ class ThermalScatteringLaw(DataInputAbstract):
                 raise MalformedInputError(
                     self._input, "MT input is detached from a parent material"
                 )
-        # brute force it
-        found = False
-        for data_input in data_inputs:
-            if isinstance(data_input, montepy.data_inputs.material.Material):
-                if data_input.number == self.old_number:
-                    mat = data_input
-                    found = True
-                    break
+        else:
+            # brute force it
+            found = False
+            for data_input in data_inputs:
+                if isinstance(data_input, montepy.data_inputs.material.Material):
+                    if data_input.number == self.old_number:
+                        mat = data_input
+                        found = True
+                        break
+            if not found:
+                raise MalformedInputError(
+                    self._input, "MT input is detached from a parent material"
+                )
         # actually update things
-        if not found:
-            raise MalformedInputError(
-                self._input, "MT input is detached from a parent material"
-            )
 
         if mat.thermal_scattering:
             raise MalformedInputError(
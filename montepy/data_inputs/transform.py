@@ -5,6 +5,7 @@ from montepy.data_inputs import data_input
 from montepy.errors import *
 from montepy.numbered_mcnp_object import Numbered_MCNP_Object
 from montepy.utilities import *
+from montepy.utilities import _mark_modified
 import numpy as np
 import re
 
@@ -128,6 +129,7 @@ class Transform(data_input.DataInputAbstract, Numbered_MCNP_Object):
             raise TypeError("displacement_vector must be a numpy array")
         if len(vector) != 3:
             raise ValueError("displacement_vector must have three components")
+        _mark_modified(self)
         self._displacement_vector = vector
 
     @property
@@ -145,6 +147,7 @@ class Transform(data_input.DataInputAbstract, Numbered_MCNP_Object):
             raise TypeError("rotation_matrix must be a numpy array")
         if len(matrix) < 5 or len(matrix) > 9:
             raise ValueError("rotation_matrix must have between 5 and 9 components.")
+        _mark_modified(self)
         self._rotation_matrix = matrix
 
     @make_prop_pointer("_is_main_to_aux", bool)
@@ -167,6 +170,13 @@ class Transform(data_input.DataInputAbstract, Numbered_MCNP_Object):
         ret += f"MAIN_TO_AUX: {self.is_main_to_aux}\n"
         return ret
 
+    def _formatting_state(self):
+        # the vector, and matrix are arrays that can be changed in place.
+        return tuple(
+            None if array is None else array.tobytes()
+            for array in (self._displacement_vector, self._rotation_matrix)
+        )
+
     def _update_values(self):
         # update in degrees
         if self._classifier.modifier is None:
@@ -179,8 +189,8 @@ class Transform(data_input.DataInputAbstract, Numbered_MCNP_Object):
             self._classifier.modifier.value = ""
         # update displacement vector
         new_values = []
-        list_iter = iter(self.data)
-        length = len(self.data)
+        list_iter = iter(self._tree["data"])
+        length = len(self._tree["data"])
         for value, node in zip(self.displacement_vector, list_iter):
             node.value = value
             new_values.append(node)
@@ -188,7 +198,7 @@ class Transform(data_input.DataInputAbstract, Numbered_MCNP_Object):
         # test if the rotation matrix has info, or was specified or main_to_aux is needed
         needs_rotation = (
             np.any(self.rotation_matrix)
-            or len(self.data) >= 8
+            or len(self._tree["data"]) >= 8
             or not self.is_main_to_aux
         )
         if needs_rotation:
@@ -200,20 +210,20 @@ class Transform(data_input.DataInputAbstract, Numbered_MCNP_Object):
             if i < len(flat_pack) - 1:
                 for value in flat_pack[i + 1 :]:
                     node = self._generate_default_node(float, value)
-                    self.data.append(node)
+                    self._tree["data"].append(node)
                     new_values.append(node)
             # if main to aux specified or is needed
-            if len(self.data) == 13 or not self.is_main_to_aux:
-                if len(self.data) == 13:
-                    node = self.data[-1]
+            if len(self._tree["data"]) == 13 or not self.is_main_to_aux:
+                if len(self._tree["data"]) == 13:
+                    node = self._tree["data"][-1]
                 else:
                     node = self._generate_default_node(int, 1)
                     node.is_negatable_identifier = True
-                    self.data.append(node)
+                    self._tree["data"].append(node)
                 node.is_negative = not self.is_main_to_aux
                 new_values.append(node)
         # Trigger shortcut recompression
-        self.data.update_with_new_values(new_values)
+        self._tree["data"].update_with_new_values(new_values)
 
     def validate(self):
         if self.displacement_vector is None or len(self.displacement_vector) != 3:
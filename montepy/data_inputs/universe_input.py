@@ -1,5 +1,7 @@
 # Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
 import itertools
+
+import montepy
 from montepy.data_inputs.cell_modifier import CellModifierInput
 from montepy.errors import *
 from montepy.constants import DEFAULT_VERSION
@@ -8,6 +10,7 @@ from montepy.input_parser import syntax_node
 from montepy.mcnp_object import MCNP_Object
 from montepy.universe import Universe
 from montepy.utilities import *
+from montepy.utilities import _mark_modified
 
 
 class UniverseInput(CellModifierInput):
@@ -39,7 +42,7 @@ class UniverseInput(CellModifierInput):
                 self._old_number = val
         elif input:
             self._universes = []
-            for node in self.data:
+            for node in self._tree["data"]:
                 try:
                     node.is_negatable_identifier = True
                     if node.value is not None:
@@ -130,6 +133,7 @@ class UniverseInput(CellModifierInput):
     def not_truncated(self, value):
         if not isinstance(value, bool):
             raise TypeError("truncated_by_parent must be a bool")
+        _mark_modified(self)
         self._not_truncated = value
 
     @property
@@ -180,7 +184,8 @@ class UniverseInput(CellModifierInput):
                     universes.append(universe)
                 else:
                     universe = universes[uni_num]
-                cell._universe._universe = universe
+                with montepy.cells._CellLinks.track_changes(cell):
+                    cell._universe._universe = universe
 
     def _clear_data(self):
         del self._old_numbers
@@ -6,6 +6,7 @@ from montepy.input_parser.mcnp_input import Jump
 from montepy.input_parser import syntax_node
 from montepy.mcnp_object import MCNP_Object
 from montepy.utilities import *
+from montepy.utilities import _mark_modified
 
 
 def _ensure_positive(self, value):
@@ -138,6 +139,7 @@ class Volume(CellModifierInput):
     @is_mcnp_calculated.setter
     def is_mcnp_calculated(self, value):
         if not self.in_cell_block:
+            _mark_modified(self)
             self._calc_by_mcnp = value
 
     @property
@@ -190,6 +192,7 @@ class Volume(CellModifierInput):
         if self.in_cell_block:
             self._update_cell_values()
         else:
+            self._unshare_data_tree()
             keyword = self._tree["keyword"]
             if not self.is_mcnp_calculated and (
                 keyword.value is None or keyword.value.lower() != "no"
@@ -199,8 +202,8 @@ class Volume(CellModifierInput):
                     keyword.padding = syntax_node.PaddingNode(" ")
             elif self.is_mcnp_calculated:
                 keyword.value = None
-            new_vals = self._collect_new_values()
-            self.data.update_with_new_values(new_vals)
+            new_vals = self._get_new_values()
+            self._tree["data"].update_with_new_values(new_vals)
 
     def _update_cell_values(self):
         if self._tree["data"][0] is not self._volume:
@@ -0,0 +1,327 @@
+# Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
+import os
+
+from montepy.cell import Cell
+from montepy.constants import DEFAULT_VERSION
+from montepy.data_inputs.cell_modifier import CellModifierInput
+from montepy.data_inputs.data_input import DataInputAbstract
+from montepy.data_inputs.mode import Mode
+from montepy.errors import *
+from montepy.errors import _record_line_expansions
+from montepy.input_parser import mcnp_input
+from montepy.input_parser.input_file import MCNP_InputFile
+from montepy.mcnp_problem import MCNP_Problem
+from montepy.surfaces.surface import Surface
+
+
+class DeckWriter:
+    """
+    Writes an MCNP input file one object at a time, as the objects are made.
+
+    This is for writing models that are too large to build as a whole :class:`~montepy.mcnp_problem.MCNP_Problem`,
+    e.g., from generators.
+    Every object is formatted, and written as soon as it is added,
+    so it doesn't need to be kept in memory.
+    The blocks must be written in order: first the cells, then the surfaces,
+    and then the data inputs.
+
+    .. code-block:: python
+
+        with montepy.DeckWriter("lattice.imcnp", title="A big lattice") as writer:
+            writer.add_cells(make_cells())
+            writer.add_surfaces(surfaces)
+            writer.add_data_inputs(materials)
+
+    The output is the same as for :func:`~montepy.mcnp_problem.MCNP_Problem.write_problem`
+    for a new problem with the same objects in it, with the mode as its first data input.
+    The objects are linked to a problem owned by the writer, as though they were added to it.
+
+    Cell modifiers, e.g., ``imp``, are printed in the cell block, unless they are given in ``print_in_data_block``.
+    Those are gathered from all of the cells into one data block input each, when the writer is closed.
+    For this every cell is kept in memory until the writer is closed,
+    and the cell numbers are checked to be unique.
+
+    .. versionadded:: 0.5.4
+
+    :param destination: File path or writable object
+    :type destination: io.TextIOBase, str, os.PathLike
+    :param title: the title of the problem.
+    :type title: str
+    :param message: the message to put at the beginning of the problem, if any.
+    :type message: str
+    :param overwrite: Whether to overwrite 'destination' if it is an existing file
+    :type overwrite: bool
+    :param mcnp_version: the version of MCNP to write the input for.
+    :type mcnp_version: tuple
+    :param mode: the mode of the problem, which is written first in the data block.
+        This is needed to write the importances of cells for particles other than neutrons,
+        as the cells are written before the data block.
+    :type mode: Mode
+    :param print_in_data_block: the class prefixes of the cell modifiers to print in the data block, e.g., ``["imp", "vol"]``.
+    :type print_in_data_block: iterable
+    :raises TypeError: if any argument is the wrong type.
+    :raises KeyError: if a cell modifier in print_in_data_block isn't supported.
+    """
+
+    _CELL_BLOCK = 0
+    _SURFACE_BLOCK = 1
+    _DATA_BLOCK = 2
+    _CLOSED = 3
+    _BLOCK_NAMES = ("cells", "surfaces", "data inputs")
+
+    def __init__(
+        self,
+        destination,
+        title="",
+        message=None,
+        overwrite=False,
+        mcnp_version=DEFAULT_VERSION,
+        mode=None,
+        print_in_data_block=(),
+    ):
+        if not isinstance(title, str):
+            raise TypeError(f"title must be a str. {title} given.")
+        if message is not None and not isinstance(message, str):
+            raise TypeError(f"message must be a str. {message} given.")
+        if mode is not None and not isinstance(mode, Mode):
+            raise TypeError(f"mode must be a Mode. {mode} given.")
+        if isinstance(print_in_data_block, str):
+            print_in_data_block = [print_in_data_block]
+        problem = MCNP_Problem(None)
+        problem.mcnp_version = mcnp_version
+        problem.title = title
+        if message is not None:
+            lines = message.splitlines()
+            problem._message = mcnp_input.Message(lines, lines)
+        if mode is not None:
+            problem._mode = mode
+        self._mode = mode
+        print_in_data_block = {key.lower() for key in print_in_data_block}
+        self._print_settings = {}
+        for cls in Cell._INPUTS_TO_PROPERTY:
+            key = cls._class_prefix()
+            self._print_settings[key] = key in print_in_data_block
+            print_in_data_block.discard(key)
+        if print_in_data_block:
+            raise KeyError(
+                f"{print_in_data_block} are not supported cell modifiers in MCNP"
+            )
+        self._keep_cells = any(self._print_settings.values())
+        self._problem = problem
+        self._enforce_print_settings()
+        if hasattr(destination, "write") and callable(getattr(destination, "write")):
+            self._file = MCNP_InputFile.from_open_stream(destination)
+        elif isinstance(destination, (str, os.PathLike)):
+            self._file = MCNP_InputFile(destination, overwrite=overwrite)
+            self._file.open("w").__enter__()
+        else:
+            raise TypeError(
+                f"destination f{destination} is not a file path or writable object"
+            )
+        self._block = self._CELL_BLOCK
+        if problem.message:
+            self._write(problem.message)
+        self._write(problem.title)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.close()
+        elif not self._file.is_stream and self._block != self._CLOSED:
+            self._block = self._CLOSED
+            self._file.__exit__(exc_type, exc_val, exc_tb)
+
+    @property
+    def mcnp_version(self):
+        """
+        The version of MCNP that the input is written for.
+
+        :rtype: tuple
+        """
+        return self._problem.mcnp_version
+
+    @property
+    def lineno(self):
+        """
+        The line number that the next object will be written on.
+
+        This is 1-indexed.
+
+        :rtype: int
+        """
+        return self._file.lineno
+
+    def add_cell(self, cell):
+        """
+        Writes a cell to the cell block.
+
+        :param cell: the cell to write.
+        :type cell: Cell
+        :raises TypeError: if cell is not a Cell.
+        :raises IllegalState: if the cell block has already been finished.
+        :raises NumberConflictError: if the cells are kept for print_in_data_block,
+            and a cell with the same number has already been written.
+        """
+        if not isinstance(cell, Cell):
+            raise TypeError(f"cell must be a Cell. {cell} given.")
+        self._start_block(self._CELL_BLOCK)
+        if self._keep_cells:
+            self._problem.cells.append(cell)
+        else:
+            cell.link_to_problem(self._problem)
+        self._enforce_print_settings()
+        self._write(cell)
+
+    def add_cells(self, cells):
+        """
+        Writes every cell to the cell block, one at a time.
+
+        :param cells: the cells to write, e.g., a generator.
+        :type cells: iterable
+        :raises TypeError: if any item is not a Cell.
+        :raises IllegalState: if the cell block has already been finished.
+        """
+        for cell in cells:
+            self.add_cell(cell)
+
+    def add_surface(self, surface):
+        """
+        Writes a surface to the surface block.
+
+        This finishes the cell block.
+
+        :param surface: the surface to write.
+        :type surface: Surface
+        :raises TypeError: if surface is not a Surface.
+        :raises IllegalState: if the surface block has already been finished.
+        """
+        if not isinstance(surface, Surface):
+            raise TypeError(f"surface must be a Surface. {surface} given.")
+        self._start_block(self._SURFACE_BLOCK)
+        surface.link_to_problem(self._problem)
+        self._write(surface)
+
+    def add_surfaces(self, surfaces):
+        """
+        Writes every surface to the surface block, one at a time.
+
+        :param surfaces: the surfaces to write, e.g., a generator.
+        :type surfaces: iterable
+        :raises TypeError: if any item is not a Surface.
+        :raises IllegalState: if the surface block has already been finished.
+        """
+        for surface in surfaces:
+            self.add_surface(surface)
+
+    def add_data_input(self, data_input):
+        """
+        Writes a data input, e.g., a material, to the data block.
+
+        This finishes the cell, and surface blocks.
+        Cell modifiers can't be added, as they are written from the cells.
+
+        :param data_input: the data input to write.
+        :type data_input: DataInputAbstract
+        :raises TypeError: if data_input is not a data input, or is a cell modifier.
+        :raises IllegalState: if the writer has been closed,
+            or if data_input is a Mode and the mode was already given.
+        """
+        if not isinstance(data_input, DataInputAbstract):
+            raise TypeError(f"data_input must be a data input. {data_input} given.")
+        if isinstance(data_input, CellModifierInput):
+            raise TypeError(
+                f"Cell modifiers are written from the cells, and can't be added. {type(data_input).__name__} given."
+            )
+        if isinstance(data_input, Mode) and self._mode is not None:
+            raise IllegalState("The mode was already given to this DeckWriter.")
+        self._start_block(self._DATA_BLOCK)
+        data_input.link_to_problem(self._problem)
+        if isinstance(data_input, Mode):
+            self._mode = data_input
+            self._problem._mode = data_input
+        self._write(data_input)
+
+    def add_data_inputs(self, data_inputs):
+        """
+        Writes every data input to the data block, one at a time.
+
+        :param data_inputs: the data inputs to write, e.g., a generator.
+        :type data_inputs: iterable
+        :raises TypeError: if any item is not a data input, or is a cell modifier.
+        :raises IllegalState: if the writer has been closed.
+        """
+        for data_input in data_inputs:
+            self.add_data_input(data_input)
+
+    def close(self):
+        """
+        Finishes all of the blocks, writes any cell modifiers printed in the data block,
+        and closes the file.
+
+        Streams are flushed, but not closed.
+        This is done automatically when leaving a ``with`` block.
+        Closing a writer again does nothing.
+        """
+        if self._block == self._CLOSED:
+            return
+        self._start_block(self._DATA_BLOCK)
+        self._write(None)
+        self._write(self._problem.cells)
+        self._write(None)
+        self._block = self._CLOSED
+        if self._file.is_stream:
+            self._file.flush()
+        else:
+            self._file.__exit__(None, None, None)
+
+    def _start_block(self, block):
+        """
+        Finishes the blocks before ``block``.
+
+        :param block: the block that will be written to next.
+        :type block: int
+        :raises IllegalState: if a later block has already been started.
+        """
+        if block < self._block:
+            if self._block == self._CLOSED:
+                raise IllegalState("The DeckWriter has already been closed.")
+            raise IllegalState(
+                f"The {self._BLOCK_NAMES[block]} can't be added after the {self._BLOCK_NAMES[self._block]} have been started."
+            )
+        while self._block < block:
+            self._write(None)
+            self._block += 1
+            if self._block == self._DATA_BLOCK and self._mode is not None:
+                self._mode.link_to_problem(self._problem)
+                self._write(self._mode)
+
+    def _enforce_print_settings(self):
+        """
+        Sets which cell modifiers are printed in the data block,
+        as linking a cell read from a file can change it.
+        """
+        controller = self._problem.print_in_data_block
+        for key, value in self._print_settings.items():
+            if controller[key] != value:
+                controller[key] = value
+
+    def _write(self, obj):
+        """
+        Formats, and writes one item like :func:`~montepy.mcnp_problem.MCNP_Problem.write_problem` does.
+
+        Any line expansions are warned about right away.
+
+        :param obj: the object, or ``None`` for the blank line that ends a block.
+        """
+        problem = self._problem
+        with _record_line_expansions() as expansions:
+            lines = problem._format_for_writing(obj)
+        if expansions:
+            problem._locate_expansions(
+                expansions, self._file.lineno, self._file.name, obj, lines
+            )
+        self._file.write_lines(lines)
+        if expansions:
+            problem._handle_warnings(expansions)
@@ -1,6 +1,8 @@
 # Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
 
+import contextlib
 import traceback
+import warnings
 
 
 class LineOverRunWarning(UserWarning):
@@ -208,13 +210,68 @@ class IllegalState(ValueError):
 class LineExpansionWarning(Warning):
     """
     Warning for when a field or line expands that may damage user formatting.
+
+    .. versionchanged:: 0.5.4
+        How many of these warnings have been made is counted in ``count``.
+    """
+
+    count = 0
+    """
+    How many of these warnings have been made.
+
+    Cached formatted inputs are only kept if no warning was made while formatting them.
     """
 
     def __init__(self, message):
         self.message = message
+        LineExpansionWarning.count += 1
         super().__init__(self.message)
 
 
+_LINE_EXPANSION_RECORDS = []
+"""
+The lists that line expansion warnings are being recorded in, by :func:`_record_line_expansions`.
+"""
+
+
+@contextlib.contextmanager
+def _record_line_expansions():
+    """
+    Records the line expansion warnings made in this context in a list, instead of warning.
+
+    This is a cheap side channel for writing problems,
+    which avoids catching all warnings with the warnings module.
+
+    .. versionadded:: 0.5.4
+
+    :returns: the list that the :class:`LineExpansionWarning` instances are added to.
+    :rtype: list
+    """
+    records = []
+    _LINE_EXPANSION_RECORDS.append(records)
+    try:
+        yield records
+    finally:
+        _LINE_EXPANSION_RECORDS.pop()
+
+
+def _warn_line_expansion(warning, stacklevel=1):
+    """
+    Warns about a line expansion, or records it if :func:`_record_line_expansions` is in use.
+
+    .. versionadded:: 0.5.4
+
+    :param warning: the warning to make.
+    :type warning: LineExpansionWarning
+    :param stacklevel: the stack level of the warning, relative to the caller of this function.
+    :type stacklevel: int
+    """
+    if _LINE_EXPANSION_RECORDS:
+        _LINE_EXPANSION_RECORDS[-1].append(warning)
+    else:
+        warnings.warn(warning, stacklevel=stacklevel + 1)
+
+
 def add_line_number_to_exception(error, broken_robot):
     """
     Adds additional context to an Exception raised by an :class:`~montepy.mcnp_object.MCNP_Object`.
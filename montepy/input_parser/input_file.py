@@ -1,9 +1,26 @@
 # Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
+import importlib
 import itertools as it
 from montepy.constants import ASCII_CEILING
 from montepy.utilities import *
 import os
 
+_COMPRESSIONS = (
+    ("gzip", (".gz",), b"\x1f\x8b"),
+    ("bz2", (".bz2",), b"BZh"),
+    ("lzma", (".xz",), b"\xfd7zXZ\x00"),
+)
+"""
+The modules for every compression format supported, with their file extensions, and magic bytes.
+"""
+
+_NON_ASCII_TABLE = bytes(
+    code if code < ASCII_CEILING else ord(" ") for code in range(256)
+)
+"""
+The table to replace all non-ASCII characters with a space (0x20) with ``bytes.translate``.
+"""
+
 
 class MCNP_InputFile:
     """
@@ -23,6 +40,13 @@ class MCNP_InputFile:
     :type overwrite: bool
     """
 
+    BUFFER_SIZE = 1 << 20
+    """
+    How many characters :func:`write_lines` collects before writing them all at once.
+
+    .. versionadded:: 0.5.4
+    """
+
     def __init__(self, path, parent_file=None, overwrite=False):
         self._path = path
         self._parent_file = parent_file
@@ -32,6 +56,10 @@ class MCNP_InputFile:
         self._mode = None
         self._fh = None
         self._is_stream = False
+        self._buffer = []
+        self._buffer_size = 0
+        self._position = 0
+        self._newline_size = 1
 
     @classmethod
     def from_open_stream(cls, fh):
@@ -64,6 +92,25 @@ class MCNP_InputFile:
     def is_stream(self):
         return self._is_stream
 
+    @property
+    def compression(self):
+        """
+        The name of the module used to compress this file, if it is compressed.
+
+        This is ``"gzip"``, ``"bz2"``, or ``"lzma"`` for ``.gz``, ``.bz2``, and ``.xz`` files,
+        respectively, and ``None`` for files that aren't compressed.
+        Existing files are also checked for the magic bytes of these formats.
+        If the file doesn't exist, but a compressed file with one of these extensions added does,
+        e.g., ``model.imcnp.gz`` for ``model.imcnp``, that file is read instead.
+
+        .. versionadded:: 0.5.4
+
+        :rtype: str
+        """
+        if self._is_stream:
+            return None
+        return _find_compression(_find_compressed_path(self.path))
+
     @make_prop_pointer("_parent_file")
     def parent_file(self):
         """
@@ -105,6 +152,10 @@ class MCNP_InputFile:
         .. versionchanged:: 0.2.11
             Added guardrails to raise FileExistsError and IsADirectoryError.
 
+        .. versionchanged:: 0.5.4
+            Compressed files are decompressed, and compressed as they are read, and written;
+            see :attr:`compression`.
+
         :param mode: the mode to open the file in
         :type mode: str
         :param encoding: The encoding scheme to use. If replace is true, this is ignored, and changed to ASCII
@@ -121,23 +172,50 @@ class MCNP_InputFile:
                 mode = "rb"
                 encoding = None
         self._mode = mode
+        path = self.path
         if "w" in mode:
-            if os.path.isfile(self.path) and self._overwrite is not True:
-                raise FileExistsError(
-                    f"{self.path} already exists, and overwrite is not set."
-                )
-            if os.path.isdir(self.path):
-                raise IsADirectoryError(
-                    f"{self.path} is a directory, and cannot be overwritten."
-                )
-        self._fh = open(self.path, mode, encoding=encoding)
+            self._check_can_write()
+            if "b" not in mode:
+                # new lines are translated when written in text mode
+                self._newline_size = len(os.linesep)
+            compression = _find_compression(path, check_magic=False)
+        else:
+            path = _find_compressed_path(path)
+            compression = _find_compression(path)
+        if compression:
+            if "b" not in mode:
+                mode += "t"
+            opener = importlib.import_module(compression).open
+            self._fh = opener(path, mode, encoding=encoding)
+        else:
+            self._fh = open(path, mode, encoding=encoding)
         return self
 
+    def _check_can_write(self):
+        """
+        Checks that this file can be written to.
+
+        .. versionadded:: 0.5.4
+
+        :raises FileExistsError: if a file already exists with the same path, and overwrite is not set.
+        :raises IsADirectoryError: if the path given is actually a directory.
+        """
+        if os.path.isfile(self.path) and self._overwrite is not True:
+            raise FileExistsError(
+                f"{self.path} already exists, and overwrite is not set."
+            )
+        if os.path.isdir(self.path):
+            raise IsADirectoryError(
+                f"{self.path} is a directory, and cannot be overwritten."
+            )
+
     def __enter__(self):
         self._fh.__enter__()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
+        if exc_type is None:
+            self.flush()
         status = self._fh.__exit__(exc_type, exc_val, exc_tb)
         self._fh = None
         return status
@@ -151,8 +229,7 @@ class MCNP_InputFile:
 
     @staticmethod
     def _clean_line(line):
-        new_line = bytes([code if code < ASCII_CEILING else ord(" ") for code in line])
-        line = new_line.decode("ascii")
+        line = line.translate(_NON_ASCII_TABLE).decode("ascii")
         line = line.replace("\r\n", "\n").replace("\r", "\n")
         return line
 
@@ -176,8 +253,93 @@ class MCNP_InputFile:
 
     def write(self, to_write):
         if self._fh:
-            self._lineno += to_write.count("\n")
+            self.flush()
+            new_lines = to_write.count("\n")
+            self._lineno += new_lines
+            self._position += len(to_write) + new_lines * (self._newline_size - 1)
             return self._fh.write(to_write)
 
+    def write_lines(self, lines):
+        """
+        Writes the lines, each followed by a new line.
+
+        The lines are collected, and written in chunks of about :attr:`BUFFER_SIZE` characters.
+        Call :func:`flush` to write any lines that are still collected;
+        this is done automatically when leaving a ``with`` block.
+
+        .. versionadded:: 0.5.4
+
+        :param lines: the lines to write, which must not contain new lines.
+        :type lines: list
+        """
+        if self._fh:
+            size = sum(map(len, lines))
+            self._buffer += lines
+            self._lineno += len(lines)
+            self._buffer_size += size + len(lines)
+            self._position += size + len(lines) * self._newline_size
+            if self._buffer_size >= self.BUFFER_SIZE:
+                self.flush()
+
+    def flush(self):
+        """
+        Writes the lines collected by :func:`write_lines` to the file.
+
+        .. versionadded:: 0.5.4
+        """
+        if self._buffer:
+            self._buffer.append("")
+            self._fh.write("\n".join(self._buffer))
+            self._buffer = []
+            self._buffer_size = 0
+
     def __str__(self):
         return str(self.name)
+
+
+def _find_compression(path, check_magic=True):
+    """
+    Finds how a file is compressed from its extension, or its magic bytes.
+
+    .. versionadded:: 0.5.4
+
+    :param path: the path of the file.
+    :type path: str, os.PathLike
+    :param check_magic: whether to check the magic bytes at the start of an existing file.
+    :type check_magic: bool
+    :returns: the name of the module to decompress the file with, or ``None`` if it isn't compressed.
+    :rtype: str
+    """
+    name = os.fspath(path).lower()
+    for module, extensions, _ in _COMPRESSIONS:
+        if name.endswith(extensions):
+            return module
+    if check_magic and os.path.isfile(path):
+        with open(path, "rb") as fh:
+            start = fh.read(max(len(magic) for _, _, magic in _COMPRESSIONS))
+        for module, _, magic in _COMPRESSIONS:
+            if start.startswith(magic):
+                return module
+    return None
+
+
+def _find_compressed_path(path):
+    """
+    Finds the compressed version of a file to read, if the file itself doesn't exist.
+
+    .. versionadded:: 0.5.4
+
+    :param path: the path of the file.
+    :type path: str, os.PathLike
+    :returns: the path of a compressed file with the same name, and a compression extension,
+        if only it exists, otherwise ``path``.
+    :rtype: str
+    """
+    if os.path.exists(path):
+        return path
+    for _, extensions, _ in _COMPRESSIONS:
+        for extension in extensions:
+            compressed = os.fspath(path) + extension
+            if os.path.isfile(compressed):
+                return compressed
+    return path
@@ -12,6 +12,11 @@ def read_input(destination, mcnp_version=DEFAULT_VERSION, replace=True):
     .. note::
         if a stream is provided. It will not be closed by this function.
 
+    .. versionchanged:: 0.5.4
+        Files compressed with gzip, bzip2, or xz are decompressed as they are read,
+        and files named in READ inputs may be compressed.
+        See :attr:`~montepy.input_parser.input_file.MCNP_InputFile.compression`.
+
     :param destination: the path to the input file to read, or a readable stream.
     :type destination: io.TextIOBase, str, os.PathLike
     :param mcnp_version: The version of MCNP that the input is intended for.
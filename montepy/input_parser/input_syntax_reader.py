@@ -16,7 +16,9 @@ import warnings
 reading_queue = []
 
 
-def read_input_syntax(input_file, mcnp_version=DEFAULT_VERSION, replace=True):
+def read_input_syntax(
+    input_file, mcnp_version=DEFAULT_VERSION, replace=True, read_inputs=None
+):
     """
     Creates a generator function to return a new MCNP input for
     every new one that is encountered.
@@ -26,6 +28,8 @@ def read_input_syntax(input_file, mcnp_version=DEFAULT_VERSION, replace=True):
 
     The version must be a three component tuple e.g., (6, 2, 0) and (5, 1, 60).
 
+    .. versionchanged:: 0.5.4
+        Added the ``read_inputs`` parameter.
 
     :param input_file: the path to the input file to be read
     :type input_file: MCNP_InputFile
@@ -33,6 +37,9 @@ def read_input_syntax(input_file, mcnp_version=DEFAULT_VERSION, replace=True):
     :type mcnp_version: tuple
     :param replace: replace all non-ASCII characters with a space (0x20)
     :type replace: bool
+    :param read_inputs: a list to append every :class:`~montepy.input_parser.mcnp_input.ReadInput` to,
+        before the ``None`` that hides it is yielded.
+    :type read_inputs: list
     :returns: a generator of MCNP_Object objects
     :rtype: generator
     """
@@ -44,7 +51,7 @@ def read_input_syntax(input_file, mcnp_version=DEFAULT_VERSION, replace=True):
         context = input_file.open("r", replace=replace)
     with context as fh:
         yield from read_front_matters(fh, mcnp_version)
-        yield from read_data(fh, mcnp_version)
+        yield from read_data(fh, mcnp_version, read_inputs=read_inputs)
 
 
 def read_front_matters(fh, mcnp_version):
@@ -93,7 +100,7 @@ def read_front_matters(fh, mcnp_version):
             break
 
 
-def read_data(fh, mcnp_version, block_type=None, recursion=False):
+def read_data(fh, mcnp_version, block_type=None, recursion=False, read_inputs=None):
     """
     Reads the bulk of an MCNP file for all of the MCNP data.
 
@@ -108,6 +115,9 @@ def read_data(fh, mcnp_version, block_type=None, recursion=False):
     .. versionchanged:: 0.2.0
         ``file_wrapper`` was added to better track which file is being read.
 
+    .. versionchanged:: 0.5.4
+        Added the ``read_inputs`` parameter.
+
     :param fh: The file handle of the input file.
     :type fh: MCNP_InputFile
     :param mcnp_version: The version of MCNP that the input is intended for.
@@ -117,6 +127,9 @@ def read_data(fh, mcnp_version, block_type=None, recursion=False):
     :param recursion: Whether or not this is being called recursively. If True this has been called
                          from read_data. This prevents the reading queue causing infinite recursion.
     :type recursion: bool
+    :param read_inputs: a list to append every :class:`~montepy.input_parser.mcnp_input.ReadInput` to,
+        before the ``None`` that hides it is yielded.
+    :type read_inputs: list
 
     :return: MCNP_Input instances: Inputs that represent the data in the MCNP input.
     :rtype: MCNP_Input
@@ -153,6 +166,8 @@ def read_data(fh, mcnp_version, block_type=None, recursion=False):
                 input_raw_lines, block_type, current_file, start_line
             )
             reading_queue.append((block_type, read_input.file_name, current_file.path))
+            if read_inputs is not None:
+                read_inputs.append(read_input)
             yield None
         except ValueError as e:
             if isinstance(e, ParsingError):
@@ -204,5 +219,7 @@ def read_data(fh, mcnp_version, block_type=None, recursion=False):
             new_wrapper = MCNP_InputFile(os.path.join(path, file_name), parent)
             with new_wrapper.open("r") as sub_fh:
                 new_wrapper = MCNP_InputFile(file_name, parent)
-                for input in read_data(sub_fh, mcnp_version, block_type, True):
+                for input in read_data(
+                    sub_fh, mcnp_version, block_type, True, read_inputs
+                ):
                     yield input
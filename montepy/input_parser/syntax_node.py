@@ -1,20 +1,24 @@
 # Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
 from abc import ABC, abstractmethod
+import bisect
 import collections
 import copy
 import enum
+import itertools
 import math
 
+import numpy as np
+
 from montepy import input_parser
 from montepy import constants
 from montepy.constants import rel_tol, abs_tol
 from montepy.errors import *
+from montepy.errors import _warn_line_expansion
 from montepy.input_parser.shortcuts import Shortcuts
 from montepy.geometry_operators import Operator
 from montepy.particle import Particle
-from montepy.utilities import fortran_float
+from montepy.utilities import fortran_float, _deepcopy_state, _ValueChanges
 import re
-import warnings
 
 
 class SyntaxNodeBase(ABC):
@@ -35,6 +39,13 @@ class SyntaxNodeBase(ABC):
         self._name = name
         self._nodes = []
 
+    def __deepcopy__(self, memo):
+        cls = type(self)
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        result.__dict__.update(_deepcopy_state(self.__dict__, memo))
+        return result
+
     def append(self, node):
         """
         Append the node to this node.
@@ -568,6 +579,31 @@ class PaddingNode(SyntaxNodeBase):
         if token is not None:
             self.append(token, is_comment)
 
+    def __deepcopy__(self, memo):
+        result = PaddingNode.__new__(PaddingNode)
+        memo[id(self)] = result
+        result.__dict__.update(self.__dict__)
+        # padding is mostly strings, which don't need to be copied
+        result._nodes = [
+            node if isinstance(node, str) else copy.deepcopy(node, memo)
+            for node in self._nodes
+        ]
+        return result
+
+    def _copy_template(self):
+        """
+        Quickly makes a copy of a template padding node, which only holds strings.
+
+        .. versionadded:: 0.5.4
+
+        :returns: a new PaddingNode with the same padding.
+        :rtype: PaddingNode
+        """
+        result = object.__new__(PaddingNode)
+        result.__dict__.update(self.__dict__)
+        result._nodes = self._nodes.copy()
+        return result
+
     def __str__(self):
         return f"(Padding, {self._nodes})"
 
@@ -907,29 +943,86 @@ class ValueNode(SyntaxNodeBase):
     A regex for finding scientific notation.
     """
 
+    _TOKEN_SHAPE = str.maketrans("23456789", "11111111")
+    """
+    A translation table to find the shape of a numeric token.
+
+    The formatting only depends on the shape of a token, so all non-zero digits are treated the same.
+    """
+
+    _FORMAT_CACHE = {}
+    """
+    The formatter and compiled value formatter for every token shape that has been seen.
+    """
+
     def __init__(self, token, token_type, padding=None, never_pad=False):
         super().__init__("")
         self._token = token
         self._type = token_type
-        self._formatter = self._FORMATTERS[token_type].copy()
+        self._formatter = self._FORMATTERS[token_type]
+        self._format_key = None
         self._is_neg_id = False
         self._is_neg_val = False
         self._og_value = None
         self._never_pad = never_pad
+        self._set_token(token)
+        self._padding = padding
+        self._nodes = [self]
+
+    def _set_token(self, token):
+        """
+        Sets the original token, and parses the value from it.
+
+        .. versionadded:: 0.5.4
+
+        :param token: the original token for the ValueNode.
+        :type token: str
+        """
+        self._token = token
         if token is None:
             self._value = None
         elif isinstance(token, input_parser.mcnp_input.Jump):
             self._value = None
-        elif token_type == float:
+        elif self._type == float:
             self._value = fortran_float(token)
-        elif token_type == int:
+        elif self._type == int:
             self._value = int(token)
         else:
             self._value = token
         self._og_value = self.value
-        self._padding = padding
-        self._nodes = [self]
-        self._is_reversed = False
+
+    def __deepcopy__(self, memo):
+        cls = type(self)
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        # everything besides the padding is immutable, or shared
+        result.__dict__.update(self.__dict__)
+        result._nodes = [result]
+        if self._padding is not None:
+            result._padding = copy.deepcopy(self._padding, memo)
+        return result
+
+    def _copy_template(self, token=None):
+        """
+        Quickly makes a copy of a template node, whose padding has no comments.
+
+        This avoids the overhead of :func:`copy.deepcopy`.
+
+        .. versionadded:: 0.5.4
+
+        :param token: the original token for the copy, if it isn't ``None``.
+        :type token: str
+        :returns: a new ValueNode with the same type, and padding.
+        :rtype: ValueNode
+        """
+        result = object.__new__(type(self))
+        result.__dict__.update(self.__dict__)
+        result._nodes = [result]
+        if self._padding is not None:
+            result._padding = self._padding._copy_template()
+        if token is not None:
+            result._set_token(token)
+        return result
 
     def _convert_to_int(self):
         """
@@ -949,7 +1042,8 @@ class ValueNode(SyntaxNodeBase):
                     self._value = int(parts[0])
                 else:
                     raise e
-        self._formatter = self._FORMATTERS[int].copy()
+        self._formatter = self._FORMATTERS[int]
+        self._format_key = None
 
     def _convert_to_enum(
         self, enum_class, allow_none=False, format_type=str, switch_to_upper=False
@@ -973,7 +1067,8 @@ class ValueNode(SyntaxNodeBase):
             value = self._value
         if not (allow_none and self._value is None):
             self._value = enum_class(value)
-        self._formatter = self._FORMATTERS[format_type].copy()
+        self._formatter = self._FORMATTERS[format_type]
+        self._format_key = None
 
     @property
     def is_negatable_identifier(self):
@@ -1053,80 +1148,187 @@ class ValueNode(SyntaxNodeBase):
     def _reverse_engineer_formatting(self):
         """
         Tries its best to figure out and update the formatter based on the token's format.
+
+        .. versionchanged:: 0.5.4
+            The formatter is now built once per token shape and shared between nodes.
         """
-        if not self._is_reversed and self._token is not None:
-            self._is_reversed = True
+        if self._format_key is None:
             token = self._token
-            if isinstance(token, input_parser.mcnp_input.Jump):
-                token = "J"
-            if isinstance(token, (int, float)):
-                token = str(token)
-            self._formatter["value_length"] = len(token)
-            if self.padding:
-                if self.padding.is_space(0):
-                    self._formatter["value_length"] += len(self.padding.nodes[0])
-
-            if self._type == float or self._type == int:
-                no_zero_pad = token.lstrip("0+-")
-                length = len(token)
-                delta = length - len(no_zero_pad)
-                if token.startswith("+") or token.startswith("-"):
-                    delta -= 1
-                    if token.startswith("+"):
-                        self._formatter["sign"] = "+"
-                    if token.startswith("-"):
-                        self._formatter["sign"] = " "
-                if delta > 0:
-                    self._formatter["zero_padding"] = length
-                if self._type == float:
-                    self._reverse_engineer_float()
-
-    def _reverse_engineer_float(self):
-        token = self._token
-        if isinstance(token, float):
-            token = str(token)
-        if isinstance(token, input_parser.mcnp_input.Jump):
-            token = "J"
-        if match := self._SCIENTIFIC_FINDER.match(token):
+            if token is None:
+                key = (None, self._format_category, 0)
+            else:
+                if isinstance(token, input_parser.mcnp_input.Jump):
+                    token = "J"
+                if isinstance(token, (int, float)):
+                    token = str(token)
+                pad_length = 0
+                if self.padding:
+                    if self.padding.is_space(0):
+                        pad_length = len(self.padding.nodes[0])
+                if self._format_category is None:
+                    shape = len(token)
+                else:
+                    shape = token.translate(self._TOKEN_SHAPE)
+                key = (shape, self._format_category, pad_length)
+            self._format_key = key
+            self._formatter = self._get_compiled_format(key)[0]
+
+    @property
+    def _format_category(self):
+        """
+        The type of formatting this node uses: ``int``, ``float``, or ``None`` for strings.
+
+        :rtype: type
+        """
+        if self._type in {int, float}:
+            return self._type
+        return None
+
+    @classmethod
+    def _get_compiled_format(cls, key):
+        """
+        Gets the formatter and compiled value formatter for the given token shape.
+
+        :param key: a tuple of the token shape, the format category, and the length of the space after the token.
+            The token shape is ``None`` for new values.
+        :type key: tuple
+        :returns: the formatter dictionary, and a function that converts a value to a string.
+        :rtype: tuple
+        """
+        try:
+            return cls._FORMAT_CACHE[key]
+        except KeyError:
+            pass
+        shape, value_type, pad_length = key
+        formatter = cls._FORMATTERS[value_type if value_type else str].copy()
+        if shape is not None:
+            cls._reverse_engineer_token(formatter, shape, value_type, pad_length)
+        compiled = (formatter, cls._compile_formatter(formatter, value_type, shape))
+        cls._FORMAT_CACHE[key] = compiled
+        return compiled
+
+    @classmethod
+    def _reverse_engineer_token(cls, formatter, shape, value_type, pad_length):
+        """
+        Updates the formatter based on the token's shape.
+
+        :param formatter: the formatter to update.
+        :type formatter: dict
+        :param shape: the token shape, or the token length for strings.
+        :type shape: str, int
+        :param value_type: the format category.
+        :type value_type: type
+        :param pad_length: the length of the space after the token.
+        :type pad_length: int
+        """
+        if value_type is None:
+            formatter["value_length"] = shape + pad_length
+            return
+        token = shape
+        formatter["value_length"] = len(token) + pad_length
+        no_zero_pad = token.lstrip("0+-")
+        length = len(token)
+        delta = length - len(no_zero_pad)
+        if token.startswith("+") or token.startswith("-"):
+            delta -= 1
+            if token.startswith("+"):
+                formatter["sign"] = "+"
+            if token.startswith("-"):
+                formatter["sign"] = " "
+        if delta > 0:
+            formatter["zero_padding"] = length
+        if value_type == float:
+            cls._reverse_engineer_float(formatter, token)
+
+    @classmethod
+    def _reverse_engineer_float(cls, formatter, token):
+        """
+        Updates the formatter for floating point specific formatting.
+
+        :param formatter: the formatter to update.
+        :type formatter: dict
+        :param token: the token shape.
+        :type token: str
+        """
+        if match := cls._SCIENTIFIC_FINDER.match(token):
             groups = match.groupdict(default="")
-            self._formatter["is_scientific"] = True
+            formatter["is_scientific"] = True
             significand = groups["significand"]
-            self._formatter["divider"] = groups["e"]
+            formatter["divider"] = groups["e"]
             # extra space for the "e" in scientific and... stuff
-            self._formatter["zero_padding"] += 4
+            formatter["zero_padding"] += 4
             exponent = groups["exponent"]
             temp_exp = exponent.lstrip("0")
             if exponent != temp_exp:
-                self._formatter["exponent_length"] = len(exponent)
-                self._formatter["exponent_zero_pad"] = len(exponent)
+                formatter["exponent_length"] = len(exponent)
+                formatter["exponent_zero_pad"] = len(exponent)
         else:
-            self._formatter["is_scientific"] = False
+            formatter["is_scientific"] = False
             significand = token
         parts = significand.split(".")
         if len(parts) == 2:
             precision = len(parts[1])
         else:
-            precision = self._FORMATTERS[float]["precision"]
-            self._formatter["as_int"] = True
-
-        self._formatter["precision"] = precision
-
-    def _can_float_to_int_happen(self):
-        """
-        Checks if you can format a floating point as an int.
+            precision = cls._FORMATTERS[float]["precision"]
+            formatter["as_int"] = True
+
+        formatter["precision"] = precision
+
+    @classmethod
+    def _compile_formatter(cls, formatter, value_type, shape):
+        """
+        Compiles a formatter into a function that converts a value to its string.
+
+        All of the format specifications are built once here, rather than every time a value is formatted.
+
+        :param formatter: the formatter to compile.
+        :type formatter: dict
+        :param value_type: the format category.
+        :type value_type: type
+        :param shape: the token shape, ``None`` for a new value.
+        :type shape: str, int
+        :returns: a function which takes the value, and returns the string for it.
+        :rtype: Callable
+        """
+        if value_type is None:
+            return str
+        int_spec = "0={sign}{zero_padding}d".format(**formatter)
+        if value_type == int:
+            return lambda value: format(int(value), int_spec)
+        # default to python general if new value
+        if shape is None:
+            float_spec = "0={sign}{zero_padding}.{precision}g".format(**formatter)
+            return lambda value: format(value, float_spec)
+        if formatter["is_scientific"]:
+            float_spec = "0={sign}{zero_padding}.{precision}e".format(**formatter)
+            divider = formatter["divider"]
+            exponent_spec = "0={exponent_zero_pad}d".format(**formatter)
+            exponent_length = formatter["exponent_length"]
+
+            def format_float(value):
+                temp = format(value, float_spec).replace("e", divider)
+                temp_match = cls._SCIENTIFIC_FINDER.match(temp)
+                start, end = temp_match.span("exponent")
+                new_exp = format(int(temp_match.group("exponent")), exponent_spec)
+                return temp[0:start] + new_exp.ljust(exponent_length) + temp[end:]
 
-        E.g., 1.0 -> 1
+        elif formatter["as_int"]:
+            float_spec = "0={sign}0{zero_padding}g".format(**formatter)
+            format_float = lambda value: format(value, float_spec)
+        else:
+            float_spec = "0={sign}0{zero_padding}.{precision}f".format(**formatter)
+            format_float = lambda value: format(value, float_spec)
+        if not formatter["as_int"]:
+            return format_float
 
-        Considers if this was done in the input, and if the value is close to the int value.
+        def format_maybe_int(value):
+            # E.g., 1.0 -> 1 if this was done in the input
+            nearest_int = round(value)
+            if math.isclose(nearest_int, value, rel_tol=rel_tol, abs_tol=abs_tol):
+                return format(int(value), int_spec)
+            return format_float(value)
 
-        :rtype: bool.
-        """
-        if self._type != float or not self._formatter["as_int"]:
-            return False
-        nearest_int = round(self.value)
-        if not math.isclose(nearest_int, self.value, rel_tol=rel_tol, abs_tol=abs_tol):
-            return False
-        return True
+        return format_maybe_int
 
     @property
     def _print_value(self):
@@ -1171,42 +1373,7 @@ class ValueNode(SyntaxNodeBase):
             value = self.value.value
         else:
             value = self._print_value
-        if self._type == int or self._can_float_to_int_happen():
-            temp = "{value:0={sign}{zero_padding}d}".format(
-                value=int(value), **self._formatter
-            )
-        elif self._type == float:
-            # default to python general if new value
-            if not self._is_reversed:
-                temp = "{value:0={sign}{zero_padding}.{precision}g}".format(
-                    value=value, **self._formatter
-                )
-            elif self._formatter["is_scientific"]:
-                temp = "{value:0={sign}{zero_padding}.{precision}e}".format(
-                    value=value, **self._formatter
-                )
-                temp = temp.replace("e", self._formatter["divider"])
-                temp_match = self._SCIENTIFIC_FINDER.match(temp)
-                exponent = temp_match.group("exponent")
-                start, end = temp_match.span("exponent")
-                new_exp_temp = "{value:0={zero_padding}d}".format(
-                    value=int(exponent),
-                    zero_padding=self._formatter["exponent_zero_pad"],
-                )
-                new_exp = "{temp:<{value_length}}".format(
-                    temp=new_exp_temp, value_length=self._formatter["exponent_length"]
-                )
-                temp = temp[0:start] + new_exp + temp[end:]
-            elif self._formatter["as_int"]:
-                temp = "{value:0={sign}0{zero_padding}g}".format(
-                    value=value, **self._formatter
-                )
-            else:
-                temp = "{value:0={sign}0{zero_padding}.{precision}f}".format(
-                    value=value, **self._formatter
-                )
-        else:
-            temp = str(value)
+        temp = self._get_compiled_format(self._format_key)[1](value)
         if self.padding:
             if self.padding.is_space(0):
                 # if there was and end space, and we ran out of space, and there isn't
@@ -1225,9 +1392,7 @@ class ValueNode(SyntaxNodeBase):
         else:
             pad_str = ""
             extra_pad_str = ""
-        buffer = "{temp:<{value_length}}{padding}".format(
-            temp=temp, padding=pad_str, **self._formatter
-        )
+        buffer = temp.ljust(self._formatter["value_length"]) + pad_str
         if len(buffer) > self._formatter["value_length"] and self._token is not None:
             warning = LineExpansionWarning(
                 f"The value has expanded, and may change formatting. The original value was {self._token}, new value is {temp}."
@@ -1235,10 +1400,7 @@ class ValueNode(SyntaxNodeBase):
             warning.cause = "value"
             warning.og_value = self._token
             warning.new_value = temp
-            warnings.warn(
-                warning,
-                stacklevel=2,
-            )
+            _warn_line_expansion(warning, stacklevel=2)
         return buffer + extra_pad_str
 
     @property
@@ -1333,6 +1495,7 @@ class ValueNode(SyntaxNodeBase):
         if self.is_negative is not None and value is not None:
             value = abs(value)
         self._check_if_needs_end_padding(value)
+        _ValueChanges.count += 1
         self._value = value
 
     def _check_if_needs_end_padding(self, value):
@@ -1497,6 +1660,80 @@ class ParticleNode(SyntaxNodeBase):
         return iter(self.particles)
 
 
+class _NodeValueArrays:
+    """
+    Array representations of the values of a list of ValueNodes.
+
+    This is used to find runs of values that can be compressed into shortcuts
+    without checking every node individually.
+
+    Other nodes in the list, e.g., the ``:`` of a ``0:1`` range in a lattice fill,
+    can never be in a shortcut.
+    Neither can the values that a ``:`` joins, as a shortcut can't be a bound of a range.
+
+    :param nodes: the nodes to represent.
+    :type nodes: list
+    """
+
+    def __init__(self, nodes):
+        self.nodes = nodes
+        is_value = [isinstance(node, ValueNode) for node in nodes]
+        raw = [node.value if value else None for node, value in zip(nodes, is_value)]
+        types = [node.type if value else None for node, value in zip(nodes, is_value)]
+        length = len(nodes)
+        self.consumable = np.fromiter(is_value, bool, length)
+        for idx in np.flatnonzero(~self.consumable):
+            if getattr(nodes[idx], "value", None) == ":":
+                self.consumable[max(idx - 1, 0) : idx + 2] = False
+        self.is_none = (
+            np.fromiter((val is None for val in raw), bool, length) & self.consumable
+        )
+        self.numeric = (
+            np.fromiter((type_ in {int, float} for type_ in types), bool, length)
+            & ~self.is_none
+            & self.consumable
+        )
+        self.floats = np.array(
+            [val if num else np.nan for val, num in zip(raw, self.numeric)],
+            dtype=float,
+        )
+        type_ids = {}
+        type_codes = np.fromiter(
+            (type_ids.setdefault(type_, len(type_ids)) for type_ in types),
+            int,
+            length,
+        )
+        self.same_as_prev = np.zeros(length, dtype=bool)
+        if length > 1:
+            comparable = (
+                (type_codes[1:] == type_codes[:-1])
+                & (~self.is_none[1:] & ~self.is_none[:-1])
+                & (self.consumable[1:] & self.consumable[:-1])
+            )
+            same = comparable & self.isclose(self.floats[1:], self.floats[:-1])
+            # fall back to equality for non-numeric values
+            for idx in np.flatnonzero(comparable & ~self.numeric[1:]):
+                same[idx] = raw[idx + 1] == raw[idx]
+            self.same_as_prev[1:] = same
+
+    @staticmethod
+    def isclose(a, b):
+        """
+        A vectorized version of :func:`math.isclose` using the MontePy tolerances.
+
+        :param a: the first values.
+        :type a: numpy.ndarray
+        :param b: the second values.
+        :type b: numpy.ndarray
+        :rtype: numpy.ndarray
+        """
+        with np.errstate(invalid="ignore"):
+            return (a == b) | (
+                np.abs(a - b)
+                <= np.maximum(rel_tol * np.maximum(np.abs(a), np.abs(b)), abs_tol)
+            )
+
+
 class ListNode(SyntaxNodeBase):
     """
     A node to represent a list of values.
@@ -1524,28 +1761,31 @@ class ListNode(SyntaxNodeBase):
         as many neighbor nodes as possible.
         Finally, the internal shortcuts, and list will be updated to reflect the new state.
 
+        .. versionchanged:: 0.5.4
+            The shortcuts are now expanded using array operations, which scales linearly with the
+            number of values.
+
         :param new_vals: the new values (a list of ValueNodes)
         :type new_vals: list
         """
         if not new_vals:
             self._nodes = []
             return
-        new_vals_cache = {id(v): v for v in new_vals}
+        positions = {id(v): i for i, v in enumerate(new_vals)}
+        owners = list(new_vals)
         # bind shortcuts to single site in new values
         for shortcut in self._shortcuts:
-            for node in shortcut.nodes:
-                if id(node) in new_vals_cache:
-                    new_vals_cache[id(node)] = shortcut
-                    shortcut.nodes.clear()
+            for node in shortcut._real_nodes():
+                if id(node) in positions:
+                    owners[positions[id(node)]] = shortcut
+                    shortcut._clear_nodes()
                     break
-        self._expand_shortcuts(new_vals, new_vals_cache)
+        self._expand_shortcuts(new_vals, owners)
         self._shortcuts = []
         self._nodes = []
-        for key, node in new_vals_cache.items():
+        for node in owners:
             if isinstance(node, ShortcutNode):
-                if (
-                    len(self._shortcuts) > 0 and node is not self._shortcuts[-1]
-                ) or len(self._shortcuts) == 0:
+                if len(self._shortcuts) == 0 or node is not self._shortcuts[-1]:
                     self._shortcuts.append(node)
                     self._nodes.append(node)
             else:
@@ -1560,68 +1800,72 @@ class ListNode(SyntaxNodeBase):
             self._nodes.pop()
             self._shortcuts.pop()
 
-    def _expand_shortcuts(self, new_vals, new_vals_cache):
+    def _expand_shortcuts(self, new_vals, owners):
         """
         Expands the existing shortcuts, and tries to "zip out" and consume their neighbors.
 
+        Each shortcut is bound to a single site, and then expanded forward until it can't consume
+        the next value, and backwards to the end of the previous shortcut.
+        Runs of values are found with array operations over all of the values, rather than
+        checking one node at a time.
+
         :param new_vals: the new values.
         :type new_vals: list
-        :param new_vals_cache: a dictionary mapping the id of the ValueNode to the ValueNode
-            or ShortcutNode. This is ordered the same as ``new_vals``.
-        :type new_vals_cache: dict
+        :param owners: a list the same length as ``new_vals`` of the ValueNode or ShortcutNode
+            that each value belongs to. This is updated in place.
+        :type owners: list
         """
+        values = _NodeValueArrays(new_vals)
+        length = len(new_vals)
+        sites = [i for i, owner in enumerate(owners) if isinstance(owner, ShortcutNode)]
+        jumps = np.flatnonzero(values.is_none)
 
-        def try_expansion(shortcut, value):
-            status = shortcut.consume_edge_node(
-                value, 1, i == last_end + 1 and last_end != 0
-            )
-            if status:
-                new_vals_cache[id(value)] = shortcut
-            else:
-                new_vals_cache[id(value)] = value
-            return status
-
-        def try_reverse_expansion(shortcut, i, last_end):
-            if i > 1:
-                for value in new_vals[i - 1 : last_end : -1]:
-                    if shortcut.consume_edge_node(value, -1):
-                        new_vals_cache[id(value)] = shortcut
-                    else:
-                        new_vals_cache[id(value)] = value
-                        return
-
-        def check_for_orphan_jump(value):
-            """
-            Checks if the current Jump is not tied to an existing Shortcut
-            """
-            nonlocal shortcut
-            if value.value is None and shortcut is None:
-                shortcut = ShortcutNode(p=None, short_type=Shortcuts.JUMP)
-                if shortcut.consume_edge_node(value, 1):
-                    new_vals_cache[id(value)] = shortcut
+        def next_index(indices, i):
+            idx = bisect.bisect_left(indices, i)
+            if idx < len(indices):
+                return int(indices[idx])
+            return length
 
         shortcut = None
         last_end = 0
-        for i, value in enumerate(new_vals_cache.values()):
+        i = 0
+        while i < length:
+            owner = owners[i]
             # found a new shortcut
-            if isinstance(value, ShortcutNode):
+            if isinstance(owner, ShortcutNode):
                 # shortcuts bumped up against each other
                 if shortcut is not None:
                     last_end = i - 1
-                shortcut = value
-                if try_expansion(shortcut, new_vals[i]):
-                    try_reverse_expansion(shortcut, i, last_end)
+                shortcut = owner
+                if shortcut.consume_edge_node(
+                    new_vals[i], 1, i == last_end + 1 and last_end != 0
+                ):
+                    if i > 1:
+                        count = shortcut._count_consumable(values, i - 1, last_end, -1)
+                        shortcut._nodes.extendleft(new_vals[i - count : i][::-1])
+                        owners[i - count : i] = [shortcut] * count
                 else:
+                    owners[i] = new_vals[i]
                     shortcut = None
+                i += 1
             # otherwise it is actually a value to expand as well
+            elif shortcut is not None:
+                stop = next_index(sites, i)
+                count = shortcut._count_consumable(values, i, stop, 1)
+                shortcut._nodes.extend(new_vals[i : i + count])
+                owners[i : i + count] = [shortcut] * count
+                i += count
+                if i < stop:
+                    last_end = i - 1
+                    shortcut = None
+            # Checks if the current Jump is not tied to an existing Shortcut
+            elif values.is_none[i]:
+                shortcut = ShortcutNode(p=None, short_type=Shortcuts.JUMP)
+                shortcut.consume_edge_node(new_vals[i], 1)
+                owners[i] = shortcut
+                i += 1
             else:
-                if shortcut is not None:
-                    if not try_expansion(shortcut, new_vals[i]):
-                        last_end = i - 1
-                        shortcut = None
-                        check_for_orphan_jump(new_vals[i])
-                else:
-                    check_for_orphan_jump(new_vals[i])
+                i = min(next_index(sites, i), next_index(jumps, i))
 
     def append(self, val, from_parsing=False):
         """
@@ -1837,6 +2081,9 @@ class ShortcutNode(ListNode):
         self._type = None
         self._end_pad = None
         self._nodes = collections.deque()
+        self._tail = []
+        self._virtual_count = 0
+        self._template = None
         self._original = []
         self._full = False
         self._num_node = ValueNode(None, float, never_pad=True)
@@ -1849,6 +2096,8 @@ class ShortcutNode(ListNode):
                         self._type = shortcut
             if self._type is None:
                 raise ValueError("must use a valid shortcut")
+            # ListNode.__init__ resets the nodes to a list
+            self._nodes = collections.deque()
             self._original = list(p)
             if self._type == Shortcuts.REPEAT:
                 self._expand_repeat(p)
@@ -1871,6 +2120,225 @@ class ShortcutNode(ListNode):
                 self._num_node = ValueNode(None, int, never_pad=True)
             self._end_pad = PaddingNode(" ")
 
+    @property
+    def nodes(self):
+        """
+        The expanded nodes of this shortcut.
+
+        The values implied by the shortcut are stored virtually until they are needed.
+        Accessing this will create a :class:`ValueNode` for every value.
+
+        .. versionchanged:: 0.5.4
+            The nodes are only created when first accessed.
+
+        :returns: the nodes of this shortcut.
+        :rtype: collections.deque
+        """
+        if self._virtual_count or self._tail:
+            self._materialize()
+        return self._nodes
+
+    def __len__(self):
+        return len(self._nodes) + self._virtual_count + len(self._tail)
+
+    def _materialize(self):
+        """
+        Creates the ValueNodes for all virtual values of this shortcut.
+        """
+        self._nodes.extend(self._make_virtual_nodes(0, self._virtual_count))
+        self._nodes.extend(self._tail)
+        self._virtual_count = 0
+        self._tail = []
+
+    def _make_virtual_nodes(self, start, stop):
+        """
+        Creates the ValueNodes for the virtual values in ``[start, stop)``.
+
+        :param start: the index of the first virtual value to make.
+        :type start: int
+        :param stop: the index after the last virtual value to make.
+        :type stop: int
+        :returns: a list of the new nodes.
+        :rtype: list
+        """
+        if stop <= start:
+            return []
+        if self._type == Shortcuts.REPEAT:
+            return [copy.deepcopy(self._template) for _ in range(start, stop)]
+        if self._type == Shortcuts.JUMP:
+            return [
+                ValueNode(input_parser.mcnp_input.Jump(), float)
+                for _ in range(start, stop)
+            ]
+        return [
+            ValueNode(str(value), self._data_type, never_pad=True)
+            for value in self._virtual_values(start, stop).tolist()
+        ]
+
+    def _virtual_values(self, start, stop):
+        """
+        Calculates the virtual values in ``[start, stop)`` of this shortcut.
+
+        :param start: the index of the first virtual value.
+        :type start: int
+        :param stop: the index after the last virtual value.
+        :type stop: int
+        :returns: an array of the values.
+        :rtype: numpy.ndarray
+        """
+        length = max(stop - start, 0)
+        if length == 0:
+            return np.array([])
+        if self._type == Shortcuts.REPEAT:
+            return np.full(length, self._template.value)
+        if self._type == Shortcuts.JUMP:
+            return np.full(length, None, dtype=object)
+        values = self._begin + self._spacing * np.arange(start + 1, stop + 1)
+        if self._type == Shortcuts.LOG_INTERPOLATE:
+            values = np.power(10.0, values)
+        return values.astype(self._data_type)
+
+    @property
+    def values(self):
+        """
+        The values of this shortcut, without creating a node for every value.
+
+        Jumps are represented by ``None``.
+
+        .. versionadded:: 0.5.4
+
+        :returns: an array of all values this shortcut expands to.
+        :rtype: numpy.ndarray
+        """
+        parts = [
+            np.array([node.value for node in self._nodes]),
+            self._virtual_values(0, self._virtual_count),
+            np.array([node.value for node in self._tail]),
+        ]
+        parts = [part for part in parts if len(part) > 0]
+        if not parts:
+            return np.array([])
+        return np.concatenate(parts)
+
+    def _real_nodes(self):
+        """
+        Iterates over the nodes of this shortcut that have actually been created.
+
+        :rtype: Generator
+        """
+        return itertools.chain(self._nodes, self._tail)
+
+    def _clear_nodes(self):
+        """
+        Removes all real and virtual nodes from this shortcut.
+        """
+        self._nodes = collections.deque()
+        self._tail = []
+        self._virtual_count = 0
+
+    def _count_consumable(self, values, start, stop, direction):
+        """
+        Counts how many consecutive values this shortcut can consume.
+
+        The values are checked starting at ``start``, moving in ``direction``, and stopping before ``stop``.
+        The edge of this shortcut must be the value just before ``start``.
+
+        :param values: the array representation of all values.
+        :type values: _NodeValueArrays
+        :param start: the index of the first value to try.
+        :type start: int
+        :param stop: the index to stop before.
+        :type stop: int
+        :param direction: the direct to go in. Must be in {-1, 1}
+        :type direction: int
+        :returns: the number of values that can be consumed.
+        :rtype: int
+        """
+        total = max((stop - start) * direction, 0)
+        if self._type == Shortcuts.MULTIPLY:
+            if (
+                total
+                and values.consumable[start]
+                and self._can_consume_node(values.nodes[start], direction)
+            ):
+                return 1
+            return 0
+        count = 0
+        # check in growing chunks to stay linear when runs are short
+        chunk = 64
+        while count < total:
+            size = min(chunk, total - count)
+            first = start + count * direction
+            indices = np.arange(first, first + size * direction, direction)
+            consumable = self._consumable_mask(values, indices, direction)
+            if not consumable.all():
+                return count + int(np.argmin(consumable))
+            count += size
+            chunk *= 2
+        return count
+
+    def _consumable_mask(self, values, indices, direction):
+        """
+        Finds which values could be consumed if all values before them were consumed.
+
+        :param values: the array representation of all values.
+        :type values: _NodeValueArrays
+        :param indices: the indices of the values to check.
+        :type indices: numpy.ndarray
+        :param direction: the direct to go in. Must be in {-1, 1}
+        :type direction: int
+        :rtype: numpy.ndarray
+        """
+        if self._type == Shortcuts.JUMP:
+            return values.is_none[indices]
+        if self._type == Shortcuts.REPEAT:
+            if direction == 1:
+                return values.same_as_prev[indices]
+            return values.same_as_prev[indices + 1]
+        edges = values.floats[indices - direction]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if self._type == Shortcuts.LOG_INTERPOLATE:
+                expected = np.power(10.0, np.log10(edges) + direction * self._spacing)
+            else:
+                expected = edges + direction * self._spacing
+        return values.numeric[indices] & values.isclose(
+            expected, values.floats[indices]
+        )
+
+    @property
+    def comments(self):
+        for node in itertools.chain(self._nodes, self._tail):
+            yield from node.comments
+
+    def flatten(self):
+        # virtual values are never printed so only the real nodes matter.
+        return list(self._nodes) + self._tail
+
+    def _first_node(self):
+        """
+        Gets the first node of this shortcut without expanding the whole shortcut.
+
+        :rtype: ValueNode
+        """
+        if self._nodes:
+            return self._nodes[0]
+        if self._virtual_count:
+            return self._make_virtual_nodes(0, 1)[0]
+        return self._tail[0]
+
+    def _last_node(self):
+        """
+        Gets the last node of this shortcut without expanding the whole shortcut.
+
+        :rtype: ValueNode
+        """
+        if self._tail:
+            return self._tail[-1]
+        if self._virtual_count:
+            last = self._virtual_count
+            return self._make_virtual_nodes(last - 1, last)[0]
+        return self._nodes[-1]
+
     def load_nodes(self, nodes):
         """
         Loads the given nodes into this shortcut, and update needed information.
@@ -1882,6 +2350,8 @@ class ShortcutNode(ListNode):
         :type nodes: list
         """
         self._nodes = collections.deque(nodes)
+        self._virtual_count = 0
+        self._tail = []
         if self.type in {Shortcuts.INTERPOLATE, Shortcuts.LOG_INTERPOLATE}:
             self._begin = nodes[0].value
             self._end = nodes[-1].value
@@ -1925,6 +2395,25 @@ class ShortcutNode(ListNode):
             return collections.deque([last])
         return collections.deque()
 
+    @staticmethod
+    def _get_last_value_node(node):
+        """
+        Gets the final leaf of the node preceding a shortcut.
+
+        This avoids expanding any preceding shortcut.
+
+        :param node: the node before the shortcut.
+        :type node: ValueNode, GeometryTree, ListNode
+        :rtype: ValueNode
+        """
+        if isinstance(node, ValueNode):
+            return node
+        if isinstance(node, GeometryTree):
+            return list(node)[-1]
+        if isinstance(node, ShortcutNode):
+            return node._last_node()
+        return node.nodes[-1]
+
     def _expand_repeat(self, p):
         self._nodes = self._get_last_node(p)
         repeat = p[1]
@@ -1935,35 +2424,29 @@ class ShortcutNode(ListNode):
         except ValueError:
             repeat_num = 1
             self._num_node = ValueNode(None, int, never_pad=True)
-        if isinstance(p[0], ValueNode):
-            last_val = p[0]
-        else:
-            if isinstance(p[0], GeometryTree):
-                last_val = list(p[0])[-1]
-            else:
-                last_val = p[0].nodes[-1]
+        last_val = self._get_last_value_node(p[0])
         if last_val.value is None:
             raise ValueError(f"Repeat cannot follow a jump. Given: {list(p)}")
-        self._nodes += [copy.deepcopy(last_val) for i in range(repeat_num)]
+        self._template = copy.deepcopy(last_val)
+        self._virtual_count = repeat_num
 
     def _expand_multiply(self, p):
         self._nodes = self._get_last_node(p)
         mult_str = p[1].lower().replace("m", "")
         mult_val = fortran_float(mult_str)
         self._num_node = ValueNode(mult_str, float, never_pad=True)
-        if isinstance(p[0], ValueNode):
-            last_val = self.nodes[-1]
-        elif isinstance(p[0], GeometryTree):
+        if isinstance(p[0], GeometryTree):
             if "right" in p[0].nodes:
                 last_val = p[0].nodes["right"]
             else:
                 last_val = p[0].nodes["left"]
         else:
-            last_val = p[0].nodes[-1]
+            last_val = self._get_last_value_node(p[0])
         if last_val.value is None:
             raise ValueError(f"Multiply cannot follow a jump. Given: {list(p)}")
+        # a multiply only ever expands to a single value so there is nothing to defer.
         self._nodes.append(copy.deepcopy(last_val))
-        self.nodes[-1].value *= mult_val
+        self._nodes[-1].value *= mult_val
 
     def _expand_jump(self, p):
         try:
@@ -1973,8 +2456,7 @@ class ShortcutNode(ListNode):
         except ValueError:
             jump_num = 1
             self._num_node = ValueNode(None, int, never_pad=True)
-        for i in range(jump_num):
-            self._nodes.append(ValueNode(input_parser.mcnp_input.Jump(), float))
+        self._virtual_count = jump_num
 
     def _expand_interpolate(self, p):
         if self._type == Shortcuts.LOG_INTERPOLATE:
@@ -1982,18 +2464,10 @@ class ShortcutNode(ListNode):
         else:
             is_log = False
         if hasattr(p, "geometry_term"):
-            term = p.geometry_term
-            if isinstance(term, GeometryTree):
-                begin = list(term)[-1].value
-            else:
-                begin = term.value
-            end = p.number_phrase.value
+            begin = self._get_last_value_node(p.geometry_term).value
         else:
-            if isinstance(p[0], ListNode):
-                begin = p[0].nodes[-1].value
-            else:
-                begin = p[0].value
-            end = p.number_phrase.value
+            begin = self._get_last_value_node(p[0]).value
+        end = p.number_phrase.value
         self._nodes = self._get_last_node(p)
         if begin is None:
             raise ValueError(f"Interpolates cannot follow a jump. Given: {list(p)}")
@@ -2008,20 +2482,11 @@ class ShortcutNode(ListNode):
             begin = math.log(begin, 10)
             end = math.log(end, 10)
         spacing = (end - begin) / (number + 1)
-        for i in range(number):
-            if is_log:
-                new_val = 10 ** (begin + spacing * (i + 1))
-            else:
-                new_val = begin + spacing * (i + 1)
-            self.append(
-                ValueNode(
-                    str(self._data_type(new_val)), self._data_type, never_pad=True
-                )
-            )
         self._begin = begin
         self._end = end
         self._spacing = spacing
-        self.append(p.number_phrase)
+        self._virtual_count = number
+        self._tail = [p.number_phrase]
 
     def _can_consume_node(self, node, direction, last_edge_shortcut=False):
         """
@@ -2120,6 +2585,7 @@ class ShortcutNode(ListNode):
         :rtype: bool
         """
         if self._can_consume_node(node, direction, last_edge_shortcut):
+            self._materialize()
             if direction == 1:
                 self._nodes.append(node)
             else:
@@ -2146,7 +2612,7 @@ class ShortcutNode(ListNode):
         return f"{temp}{pad_str}"
 
     def _format_jump(self):
-        num_jumps = len(self.nodes)
+        num_jumps = len(self)
         if num_jumps == 0:
             return ""
         if len(self._original) > 0 and "j" in self._original[0]:
@@ -2183,13 +2649,13 @@ class ShortcutNode(ListNode):
         if isinstance(node, ValueNode):
             value = node.value
         elif isinstance(node, ShortcutNode):
-            value = node.nodes[-1].value
+            value = node._last_node().value
         else:
             return False
         if value is None:
             return False
         if start is None:
-            start = self.nodes[0].value
+            start = self._first_node().value
         return math.isclose(start, value)
 
     def _format_repeat(self, leading_node=None):
@@ -2198,9 +2664,9 @@ class ShortcutNode(ListNode):
             first_val = ""
             num_extra = 0
         else:
-            first_val = self.nodes[0].format()
+            first_val = self._first_node().format()
             num_extra = 1
-        num_repeats = len(self.nodes) - num_extra
+        num_repeats = len(self) - num_extra
         self._num_node.value = num_repeats
         if len(self._original) >= 2 and "r" in self._original[1]:
             r = "r"
@@ -2219,16 +2685,16 @@ class ShortcutNode(ListNode):
     def _format_multiply(self, leading_node=None):
         # Multiply doesn't usually consume other nodes
         if leading_node is not None and len(self) == 1:
-            first_val = leading_node.nodes[-1]
+            first_val = leading_node._last_node()
             first_val_str = ""
         else:
-            first_val = self.nodes[0]
+            first_val = self._first_node()
             first_val_str = first_val
         if self._original and "m" in self._original[-1]:
             m = "m"
         else:
             m = "M"
-        self._num_node.value = self.nodes[-1].value / first_val.value
+        self._num_node.value = self._last_node().value / first_val.value
         return f"{first_val_str.format()}{self._num_node.format()}{m}"
 
     def _format_interpolate(self, leading_node=None):
@@ -2241,10 +2707,10 @@ class ShortcutNode(ListNode):
             if hasattr(self, "_has_pseudo_start"):
                 num_extra_nodes += 1
         else:
-            start = self.nodes[0]
+            start = self._first_node()
             num_extra_nodes = 2
-        end = self.nodes[-1]
-        num_interp = len(self.nodes) - num_extra_nodes
+        end = self._last_node()
+        num_interp = len(self) - num_extra_nodes
         self._num_node.value = num_interp
         interp = "I"
         can_match = False
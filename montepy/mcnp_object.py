@@ -4,6 +4,7 @@ import copy
 import functools
 import itertools as it
 from montepy.errors import *
+from montepy.errors import _warn_line_expansion
 from montepy.constants import (
     BLANK_SPACE_CONTINUE,
     get_max_line_length,
@@ -17,16 +18,100 @@ from montepy.input_parser.syntax_node import (
     ValueNode,
 )
 import montepy
+from montepy.utilities import (
+    _deepcopy_state,
+    _mark_modified,
+    _only_returns_attribute,
+)
 import numpy as np
+import re
 import textwrap
+import types
 import warnings
 import weakref
 
+_SPACES = re.compile(r"( +)")
+
+_TEXTWRAP_BREAKS = re.compile(r"[^\d\W]-[^\d\W]|--")
+"""
+Text where :class:`textwrap.TextWrapper` may break a line at a hyphen, and not only at spaces.
+"""
+
+
+@functools.lru_cache
+def _get_text_wrapper(width, initial_indent, subsequent_indent):
+    return textwrap.TextWrapper(
+        width=width,
+        initial_indent=initial_indent,
+        subsequent_indent=subsequent_indent,
+        drop_whitespace=False,
+    )
+
+
+def _wrap_line(line, width, initial_indent, subsequent_indent):
+    """
+    Wraps one line to be no longer than ``width``, breaking it between tokens.
+
+    This gives the same lines as :class:`textwrap.TextWrapper` with ``drop_whitespace=False``,
+    but only does any work for lines that are too long.
+    Lines that textwrap could break at hyphens are left to textwrap.
+
+    .. versionadded:: 0.5.4
+
+    :param line: the line to wrap, without any new lines in it.
+    :type line: str
+    :param width: the maximum length of a line.
+    :type width: int
+    :param initial_indent: the indent for the first line.
+    :type initial_indent: str
+    :param subsequent_indent: the indent for every line after the first.
+    :type subsequent_indent: str
+    :returns: the wrapped lines.
+    :rtype: list
+    """
+    if not line:
+        return []
+    if "\t" in line:
+        line = line.expandtabs()
+    if len(initial_indent) + len(line) <= width:
+        return [initial_indent + line]
+    if _TEXTWRAP_BREAKS.search(line):
+        return _get_text_wrapper(width, initial_indent, subsequent_indent).wrap(line)
+    chunks = [chunk for chunk in _SPACES.split(line) if chunk]
+    chunks.reverse()
+    lines = []
+    indent = initial_indent
+    while chunks:
+        line_width = width - len(indent)
+        cur_line = []
+        cur_len = 0
+        while chunks and cur_len + len(chunks[-1]) <= line_width:
+            chunk = chunks.pop()
+            cur_line.append(chunk)
+            cur_len += len(chunk)
+        if chunks and len(chunks[-1]) > line_width:
+            # break a token that is longer than a whole line
+            chunk = chunks[-1]
+            end = line_width - cur_len if line_width >= 1 else 1
+            hyphen = chunk.rfind("-", 0, end)
+            if hyphen > 0 and chunk[:hyphen].strip("-"):
+                end = hyphen + 1
+            cur_line.append(chunk[:end])
+            chunks[-1] = chunk[end:]
+        if cur_line:
+            lines.append(indent + "".join(cur_line))
+        indent = subsequent_indent
+    return lines
+
 
 class _ExceptionContextAdder(ABCMeta):
     """
     A metaclass for wrapping all class properties and methods in :func:`~montepy.errors.add_line_number_to_exception`.
 
+    .. versionchanged:: 0.5.4
+        Methods and properties are wrapped with wrappers that match their signature,
+        so they only add one light function call.
+        Property getters that only return an attribute aren't wrapped at all.
     """
 
     @staticmethod
@@ -52,6 +137,79 @@ class _ExceptionContextAdder(ABCMeta):
             return classmethod(wrapped)
         return wrapped
 
+    @staticmethod
+    def _wrap_method(func):
+        """
+        Wraps a method, which takes ``self`` as the first argument.
+        """
+
+        @functools.wraps(func)
+        def wrapped(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            except Exception as e:
+                if isinstance(self, MCNP_Object):
+                    add_line_number_to_exception(e, self)
+                raise e
+
+        return wrapped
+
+    @staticmethod
+    def _wrap_getter(func):
+        """
+        Wraps a property getter, which only takes ``self``.
+
+        Getters that only return an attribute, e.g., ``return self._x``, aren't wrapped,
+        as they can't raise an error that the input could explain.
+        """
+        if _only_returns_attribute(func):
+            return func
+
+        @functools.wraps(func)
+        def wrapped(self):
+            try:
+                return func(self)
+            except Exception as e:
+                if isinstance(self, MCNP_Object):
+                    add_line_number_to_exception(e, self)
+                raise e
+
+        return wrapped
+
+    @staticmethod
+    def _wrap_setter(func):
+        """
+        Wraps a property setter, which takes ``self``, and the new value.
+        """
+
+        @functools.wraps(func)
+        def wrapped(self, value):
+            try:
+                return func(self, value)
+            except Exception as e:
+                if isinstance(self, MCNP_Object):
+                    add_line_number_to_exception(e, self)
+                raise e
+
+        return wrapped
+
+    @staticmethod
+    def _wrap_deleter(func):
+        """
+        Wraps a property deleter, which only takes ``self``.
+        """
+
+        @functools.wraps(func)
+        def wrapped(self):
+            try:
+                return func(self)
+            except Exception as e:
+                if isinstance(self, MCNP_Object):
+                    add_line_number_to_exception(e, self)
+                raise e
+
+        return wrapped
+
     def __new__(meta, classname, bases, attributes):
         """
         This will replace all properties and callable attributes with
@@ -60,28 +218,70 @@ class _ExceptionContextAdder(ABCMeta):
         """
         new_attrs = {}
         for key, value in attributes.items():
-            if key.startswith("_"):
-                new_attrs[key] = value
-            if callable(value):
+            if isinstance(value, types.FunctionType):
+                new_attrs[key] = _ExceptionContextAdder._wrap_method(value)
+            elif callable(value):
                 new_attrs[key] = _ExceptionContextAdder._wrap_attr_call(value)
             elif isinstance(value, property):
-                new_props = {}
-                for attr_name in {"fget", "fset", "fdel", "doc"}:
-                    try:
-                        assert getattr(value, attr_name)
-                        new_props[attr_name] = _ExceptionContextAdder._wrap_attr_call(
-                            getattr(value, attr_name)
+                new_attrs[key] = property(
+                    *(
+                        (
+                            (
+                                accessor
+                                if getattr(accessor, "_adds_exception_context", False)
+                                else wrapper(accessor)
+                            )
+                            if accessor
+                            else None
                         )
-                    except (AttributeError, AssertionError):
-                        new_props[attr_name] = None
-
-                new_attrs[key] = property(**new_props)
+                        for wrapper, accessor in (
+                            (_ExceptionContextAdder._wrap_getter, value.fget),
+                            (_ExceptionContextAdder._wrap_setter, value.fset),
+                            (_ExceptionContextAdder._wrap_deleter, value.fdel),
+                        )
+                    )
+                )
             else:
                 new_attrs[key] = value
         cls = super().__new__(meta, classname, bases, new_attrs)
         return cls
 
 
+def _cache_format(format_func):
+    """
+    A decorator for ``format_for_mcnp_input`` that reuses the last lines made for an unchanged object.
+
+    The lines are reused as long as :func:`~montepy.mcnp_object.MCNP_Object._format_key` is the same.
+    Lines that made a :class:`~montepy.errors.LineExpansionWarning` are never reused,
+    so the warning is made every time the object is written.
+    Nothing is cached when an object is read, so the first write still formats every object.
+    The lines that were read can't be used instead,
+    as formatting can change them, e.g., by moving cell modifiers to the data block.
+
+    .. versionadded:: 0.5.4
+
+    :param format_func: the ``format_for_mcnp_input`` method to decorate.
+    :type format_func: function
+    :returns: the decorated method.
+    :rtype: function
+    """
+
+    @functools.wraps(format_func)
+    def cached(self, mcnp_version):
+        cache = self._format_cache
+        if cache is not None and cache[0] == self._format_key(mcnp_version):
+            return list(cache[1])
+        expansions = LineExpansionWarning.count
+        lines = format_func(self, mcnp_version)
+        if LineExpansionWarning.count == expansions:
+            self._format_cache = (self._format_key(mcnp_version), tuple(lines))
+        else:
+            self._format_cache = None
+        return lines
+
+    return cached
+
+
 class MCNP_Object(ABC, metaclass=_ExceptionContextAdder):
     """
     Abstract class for semantic representations of MCNP inputs.
@@ -96,6 +296,31 @@ class MCNP_Object(ABC, metaclass=_ExceptionContextAdder):
     :type parser: MCNP_Lexer
     """
 
+    _DEFAULT_NODES = {}
+    """
+    The template ValueNodes made by :func:`_generate_default_node` for every value type, and padding.
+
+    These are copied instead of making a new node every time.
+    The templates don't hold a value, so there are only a few of them.
+    """
+
+    _modifications = 0
+    """
+    How many times this object may have been modified through its public API.
+
+    This is increased by :func:`~montepy.utilities._mark_modified`,
+    which every setter, and method that changes an object calls.
+
+    .. versionadded:: 0.5.4
+    """
+
+    _format_cache = None
+    """
+    The key from :func:`_format_key`, and the lines from the last time this was formatted.
+
+    .. versionadded:: 0.5.4
+    """
+
     def __init__(self, input, parser):
         self._problem_ref = None
         self._parameters = ParametersNode()
@@ -133,6 +358,9 @@ class MCNP_Object(ABC, metaclass=_ExceptionContextAdder):
 
         .. versionadded:: 0.2.0
 
+        .. versionchanged:: 0.5.4
+            The nodes are now copied from cached templates.
+
         :param value_type: the data type for the ValueNode.
         :type value_type: Class
         :param default: the default value to provide (type needs to agree with value_type)
@@ -142,13 +370,19 @@ class MCNP_Object(ABC, metaclass=_ExceptionContextAdder):
         :returns: a new ValueNode with the requested information.
         :rtype: ValueNode
         """
-        if padding:
-            padding_node = PaddingNode(padding)
-        else:
-            padding_node = None
+        key = (value_type, padding)
+        try:
+            template = MCNP_Object._DEFAULT_NODES[key]
+        except KeyError:
+            if padding:
+                padding_node = PaddingNode(padding)
+            else:
+                padding_node = None
+            template = ValueNode(None, value_type, padding_node)
+            MCNP_Object._DEFAULT_NODES[key] = template
         if default is None or isinstance(default, montepy.input_parser.mcnp_input.Jump):
-            return ValueNode(default, value_type, padding_node)
-        return ValueNode(str(default), value_type, padding_node)
+            return template._copy_template(default)
+        return template._copy_template(str(default))
 
     @property
     def parameters(self):
@@ -161,6 +395,8 @@ class MCNP_Object(ABC, metaclass=_ExceptionContextAdder):
         :returns: a dictionary of the key-value pairs of the parameters.
         :rytpe: dict
         """
+        # the parameters can be changed in place
+        _mark_modified(self)
         return self._parameters
 
     @abstractmethod
@@ -178,11 +414,16 @@ class MCNP_Object(ABC, metaclass=_ExceptionContextAdder):
         """
         pass
 
+    @_cache_format
     def format_for_mcnp_input(self, mcnp_version):
         """
         Creates a string representation of this MCNP_Object that can be
         written to file.
 
+        .. versionchanged:: 0.5.4
+            The lines are reused if this object, and everything it depends on, has not changed
+            since it was last formatted.
+
         :param mcnp_version: The tuple for the MCNP version that must be exported to.
         :type mcnp_version: tuple
         :return: a list of strings for the lines that this input will occupy.
@@ -194,6 +435,45 @@ class MCNP_Object(ABC, metaclass=_ExceptionContextAdder):
         lines = self.wrap_string_for_mcnp(self._tree.format(), mcnp_version, True)
         return lines
 
+    def _format_key(self, mcnp_version):
+        """
+        Everything that the formatted lines of this object depend on.
+
+        When this is unchanged the last formatted lines can be reused.
+        This includes how often this object has been modified,
+        how often any object has been renumbered, and :func:`_formatting_state`.
+
+        .. versionadded:: 0.5.4
+
+        :param mcnp_version: The tuple for the MCNP version that must be exported to.
+        :type mcnp_version: tuple
+        :returns: a key that can be compared to the last one.
+        :rtype: tuple
+        """
+        return (
+            mcnp_version,
+            self._modifications,
+            montepy.numbered_mcnp_object._NUMBER_CHANGES[MCNP_Object],
+            self._formatting_state(),
+        )
+
+    def _formatting_state(self):
+        """
+        The state of other objects that the formatted lines of this object depend on.
+
+        Numbers of other objects are already covered by :func:`_format_key`.
+        Objects that print other objects, e.g., cells printing their cell modifiers,
+        must include those objects' ``_modifications``.
+        Mutable values that are given out, and can be changed in place, e.g., arrays,
+        must be included as well.
+
+        .. versionadded:: 0.5.4
+
+        :returns: a comparable summary of the state.
+        :rtype: tuple
+        """
+        return ()
+
     @property
     def comments(self):
         """
@@ -232,6 +512,7 @@ class MCNP_Object(ABC, metaclass=_ExceptionContextAdder):
                 raise TypeError(
                     f"Comment must be a CommentNode. {comment} given at index {i}."
                 )
+        _mark_modified(self)
         new_nodes = list(*zip(comments, it.cycle(["\n"])))
         if self._tree["start_pad"] is None:
             self._tree["start_pad"] = syntax_node.PaddingNode(" ")
@@ -239,6 +520,7 @@ class MCNP_Object(ABC, metaclass=_ExceptionContextAdder):
 
     @leading_comments.deleter
     def leading_comments(self):
+        _mark_modified(self)
         self._tree["start_pad"]._delete_trailing_comment()
 
     @staticmethod
@@ -272,15 +554,11 @@ class MCNP_Object(ABC, metaclass=_ExceptionContextAdder):
             initial_indent = 0
         else:
             initial_indent = indent_length
-        wrapper = textwrap.TextWrapper(
-            width=line_length,
-            initial_indent=" " * initial_indent,
-            subsequent_indent=" " * indent_length,
-            drop_whitespace=False,
-        )
+        initial_indent = " " * initial_indent
+        subsequent_indent = " " * indent_length
         ret = []
         for line in strings:
-            buffer = wrapper.wrap(line)
+            buffer = _wrap_line(line, line_length, initial_indent, subsequent_indent)
             if len(buffer) > 1:
                 warning = LineExpansionWarning(
                     f"The line exceeded the maximum length allowed by MCNP, and was split. The line was:\n{line}"
@@ -288,11 +566,7 @@ class MCNP_Object(ABC, metaclass=_ExceptionContextAdder):
                 warning.cause = "line"
                 warning.og_value = line
                 warning.new_value = buffer
-                warnings.warn(
-                    warning,
-                    LineExpansionWarning,
-                    stacklevel=2,
-                )
+                _warn_line_expansion(warning, stacklevel=2)
             # lazy final guard against extra lines
             if suppress_blank_end:
                 buffer = [s for s in buffer if s.strip()]
@@ -317,6 +591,7 @@ class MCNP_Object(ABC, metaclass=_ExceptionContextAdder):
         """
         if not isinstance(problem, (montepy.mcnp_problem.MCNP_Problem, type(None))):
             raise TypeError("problem must be an MCNP_Problem")
+        _mark_modified(self)
         if problem is None:
             self._problem_ref = None
         else:
@@ -528,6 +803,13 @@ class MCNP_Object(ABC, metaclass=_ExceptionContextAdder):
         crunchy_data["_problem_ref"] = None
         self.__dict__.update(crunchy_data)
 
+    def __deepcopy__(self, memo):
+        cls = type(self)
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        result.__setstate__(_deepcopy_state(self.__getstate__(), memo))
+        return result
+
     def clone(self):
         """
         Create a new independent instance of this object.
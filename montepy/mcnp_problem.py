@@ -1,15 +1,27 @@
 # Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
+import concurrent.futures
+import contextlib
+import bisect
 import copy
 from enum import Enum
+import gc
 import itertools
+import math
+import multiprocessing
 import os
+import shutil
+import tempfile
 import warnings
+import weakref
 
 from montepy.data_inputs import mode, transform
 from montepy._cell_data_control import CellDataPrintController
 from montepy.cell import Cell
-from montepy.cells import Cells
+from montepy.cells import Cells, _CellLinks
+from montepy.data_inputs.cell_modifier import CellModifierInput
 from montepy.errors import *
+from montepy.errors import _record_line_expansions
+from montepy.utilities import _SharedObjects
 from montepy.constants import DEFAULT_VERSION
 from montepy.materials import Material, Materials
 from montepy.surfaces import surface, surface_builder
@@ -18,7 +30,11 @@ from montepy.surface_collection import Surfaces
 # weird way to avoid circular imports
 from montepy.data_inputs import parse_data
 from montepy.input_parser import input_syntax_reader, block_type, mcnp_input
-from montepy.input_parser.input_file import MCNP_InputFile
+from montepy.input_parser.input_file import (
+    MCNP_InputFile,
+    _find_compressed_path,
+    _find_compression,
+)
 from montepy.universes import Universes
 from montepy.transforms import Transforms
 import montepy
@@ -43,6 +59,31 @@ class MCNP_Problem:
         montepy.universe.Universe: Universes,
     }
 
+    _write_record = None
+    """
+    Where every input was written the last time this problem was written to a file.
+    """
+
+    _file_tree = None
+    """
+    The files that this problem was read from with READ inputs, and what was in them.
+    """
+
+    _copy_on_write = None
+    """
+    How the objects shared with the problem this was cloned from are copied, if this is a copy-on-write clone.
+    """
+
+    _data_positions = None
+    """
+    The positions of the data inputs from :func:`_find_data_input`.
+    """
+
+    _clones = None
+    """
+    The copy-on-write clones that share objects with this problem, as a :class:`weakref.WeakSet` of :class:`_CopyOnWrite`.
+    """
+
     def __init__(self, destination):
         if hasattr(destination, "read") and callable(getattr(destination, "read")):
             self._input_file = MCNP_InputFile.from_open_stream(destination)
@@ -60,9 +101,19 @@ class MCNP_Problem:
         self._mcnp_version = DEFAULT_VERSION
         self._mode = mode.Mode()
 
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # every object is pickled, so nothing is shared anymore
+        state.pop("_copy_on_write", None)
+        state.pop("_data_positions", None)
+        state.pop("_clones", None)
+        return state
+
     def __setstate__(self, nom_nom):
         self.__dict__.update(nom_nom)
         self.__unpickled = True
+        # the objects are new, so can't be found in the record
+        self._write_record = None
 
     @staticmethod
     def __get_collect_attr_name(collect_type):
@@ -120,20 +171,114 @@ class MCNP_Problem:
         cls = type(self)
         result = cls.__new__(cls)
         memo[id(self)] = result
-        for k, v in self.__dict__.items():
-            setattr(result, k, copy.deepcopy(v, memo))
+        # copying doesn't make garbage, so don't let the garbage collector rescan the growing heap
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for k, v in self.__dict__.items():
+                if k in {
+                    "_write_record",
+                    "_copy_on_write",
+                    "_data_positions",
+                    "_clones",
+                }:
+                    continue
+                setattr(result, k, copy.deepcopy(v, memo))
+        finally:
+            if gc_was_enabled:
+                gc.enable()
         result.__unlink_objs()
         return result
 
-    def clone(self):
+    def clone(self, copy_on_write=False):
         """
         Creates a complete independent copy of this problem.
 
+        With ``copy_on_write`` the clone shares all of the objects of this problem at first.
+        An object is only copied for the clone the first time that either problem may change it:
+        when this problem changes it, or when the clone gives it out,
+        e.g., with ``clone.cells[5]``, or while iterating over ``clone.surfaces``,
+        as the object that is given out can be changed without this problem knowing.
+        The objects that it links to are copied with it, e.g., the material, and surfaces of a cell.
+        So the clone is a snapshot of this problem, and changes to either one never show up in the other.
+        This makes cloning even very large problems almost instant,
+        which is meant for making many variants of a model that each change a few objects:
+
+        .. code-block:: python
+
+            for density in [1.0, 2.0, 3.0]:
+                variant = problem.clone(copy_on_write=True)
+                variant.cells[5].mass_density = density
+                variant.write_problem(f"dense_{density}.imcnp")
+
+        The objects that a clone shares are written with the lines cached by this problem,
+        so they aren't formatted again.
+        A clone can be written with :func:`write_patch`,
+        which copies the unchanged inputs from the file this problem was last written to.
+
+        .. note::
+            Iterating over a collection of a copy-on-write clone, or getting its :func:`data_inputs`,
+            copies every object in it.
+            Changing this problem while it has many copy-on-write clones copies the changed objects for each of them.
+
         .. versionadded:: 0.5.0
 
+        .. versionchanged:: 0.5.4
+            Added the ``copy_on_write`` parameter.
+
+        :param copy_on_write: Whether to share the objects of this problem until they are needed.
+        :type copy_on_write: bool
         :rtype: MCNP_Problem
+        :raises TypeError: if copy_on_write is not a bool.
+        """
+        if not isinstance(copy_on_write, bool):
+            raise TypeError(f"copy_on_write must be a bool. {copy_on_write} given.")
+        if not copy_on_write:
+            return copy.deepcopy(self)
+        self.__relink_objs()
+        cls = type(self)
+        result = cls.__new__(cls)
+        result.__dict__.update(self.__dict__)
+        result._clones = None
+        shared = _CopyOnWrite(result, self)
+        result._copy_on_write = shared
+        result._file_tree = None
+        for collect_type in self._NUMBERED_OBJ_MAP.values():
+            attr_name = self.__get_collect_attr_name(collect_type)
+            setattr(result, attr_name, getattr(self, attr_name)._share(result, shared))
+        result._data_inputs = list(self._data_inputs)
+        result._data_positions = None
+        result._print_in_data_block = copy.deepcopy(self._print_in_data_block)
+        result._mode = shared.copy(self._mode)
+        data_ids = {id(data_input) for data_input in self._data_inputs}
+        for attr, _ in Cell._INPUTS_TO_PROPERTY.values():
+            modifier = self._cells.__dict__.get(attr)
+            # the modifiers from the data block are shared like the other data inputs
+            if modifier is not None and id(modifier) not in data_ids:
+                setattr(result._cells, attr, shared.copy(modifier))
+        return result
+
+    @contextlib.contextmanager
+    def _reading_shared(self):
         """
-        return copy.deepcopy(self)
+        Lets the objects that are shared with copy-on-write clones be read without copying them, e.g., to write them.
+
+        Formatting only updates the syntax trees of the objects from the values that they hold,
+        so neither this problem, nor the problems that share its objects copy them for it.
+
+        .. versionadded:: 0.5.4
+
+        :returns: a context manager.
+        """
+        _SharedObjects.reading += 1
+        try:
+            if self._copy_on_write is None:
+                yield
+            else:
+                with self._copy_on_write.reading_shared():
+                    yield
+        finally:
+            _SharedObjects.reading -= 1
 
     @property
     def cells(self):
@@ -264,12 +409,74 @@ class MCNP_Problem:
         """
         A list of the DataInput objects in this problem.
 
+        .. versionchanged:: 0.5.4
+            For a copy-on-write clone every data input is copied, see :func:`clone`.
+
         :return: a list of the :class:`~montepy.data_cards.data_card.DataCardAbstract` objects, ordered by the order they were in the input file.
         :rtype: list
         """
         self.__relink_objs()
+        shared = self._copy_on_write
+        if shared is not None and not shared.reading:
+            for data_input in list(self._data_inputs):
+                shared.copy(data_input)
         return self._data_inputs
 
+    def _find_data_input(self, obj):
+        """
+        Finds where an object is in :func:`data_inputs` by identity.
+
+        The positions of all of the data inputs are found the first time,
+        and are kept up to date as data inputs are removed, or replaced with :func:`_remove_data_input`,
+        and :func:`_replace_data_input`.
+        They are found again when the list has been changed in any other way.
+
+        .. versionadded:: 0.5.4
+
+        :param obj: the object to find.
+        :returns: the index of the object, or ``None`` if it isn't a data input.
+        :rtype: int
+        """
+        positions = self._data_positions
+        if positions is None or not positions.is_current(self._data_inputs):
+            positions = self._data_positions = _DataInputPositions(self._data_inputs)
+        return positions.find(obj)
+
+    def _remove_data_input(self, obj):
+        """
+        Removes an object from :func:`data_inputs` by identity.
+
+        .. versionadded:: 0.5.4
+
+        :param obj: the object to remove.
+        :raises ValueError: if the object isn't a data input.
+        """
+        index = self._find_data_input(obj)
+        if index is None:
+            # the list may have been changed in place, e.g., ``data_inputs[0] = obj``
+            self._data_positions = None
+            index = self._find_data_input(obj)
+            if index is None:
+                raise ValueError(f"{obj} is not in the data inputs.")
+        self._data_positions.remove(obj, index)
+
+    def _replace_data_input(self, original, new):
+        """
+        Puts an object in the place of another in :func:`data_inputs`.
+
+        .. versionadded:: 0.5.4
+
+        :param original: the object to replace.
+        :param new: the object to put in its place.
+        :returns: whether ``original`` was a data input.
+        :rtype: bool
+        """
+        index = self._find_data_input(original)
+        if index is None:
+            return False
+        self._data_positions.replace(original, new, index)
+        return True
+
     @property
     def input_file(self):
         """
@@ -336,6 +543,12 @@ class MCNP_Problem:
         trailing_comment = None
         last_obj = None
         last_block = None
+        # the READ inputs, and the objects from every file they read, to write them back
+        read_inputs = []
+        reads = []
+        include_keys = {}
+        parsed = {None: []}
+        modifier_files = set()
         OBJ_MATCHER = {
             block_type.BlockType.CELL: (Cell, self._cells),
             block_type.BlockType.SURFACE: (
@@ -347,11 +560,27 @@ class MCNP_Problem:
         try:
             for i, input in enumerate(
                 input_syntax_reader.read_input_syntax(
-                    self._input_file, self.mcnp_version, replace=replace
+                    self._input_file,
+                    self.mcnp_version,
+                    replace=replace,
+                    read_inputs=read_inputs,
                 )
             ):
                 self._original_inputs.append(input)
-                if i == 0 and isinstance(input, mcnp_input.Message):
+                if input is None:
+                    # a READ input was hidden
+                    read_input = read_inputs[-1]
+                    parent = include_keys.get(read_input.input_file.path)
+                    key = read_input.file_name
+                    include_keys[
+                        os.path.join(
+                            os.path.dirname(self._input_file.name), read_input.file_name
+                        )
+                    ] = key
+                    parsed.setdefault(key, [])
+                    reads.append((read_input, parent, len(parsed[parent])))
+
+                elif i == 0 and isinstance(input, mcnp_input.Message):
                     self._message = input
 
                 elif isinstance(input, mcnp_input.Title) and self._title is None:
@@ -384,6 +613,10 @@ class MCNP_Problem:
                             self._materials.append(obj, False)
                         if isinstance(obj, transform.Transform):
                             self._transforms.append(obj, False)
+                        key = include_keys.get(input.input_file.path)
+                        parsed[key].append(obj)
+                        if isinstance(obj, CellModifierInput):
+                            modifier_files.add(key)
                     if trailing_comment is not None and last_obj is not None:
                         obj._grab_beginning_comment(trailing_comment, last_obj)
                         last_obj._delete_trailing_comment()
@@ -395,6 +628,8 @@ class MCNP_Problem:
             else:
                 raise e
         self.__update_internal_pointers(check_input)
+        if reads and not self._input_file.is_stream:
+            self._file_tree = _FileTree(self, reads, parsed, modifier_files)
 
     def __update_internal_pointers(self, check_input=False):
         """Updates the internal pointers between objects
@@ -427,11 +662,11 @@ class MCNP_Problem:
                 ParticleTypeNotInCell,
             ) as e:
                 handle_error(e)
-        to_delete = []
-        for data_index, data_input in enumerate(self._data_inputs):
+        to_delete = set()
+        for data_input in self._data_inputs:
             try:
                 if data_input.update_pointers(self._data_inputs):
-                    to_delete.append(data_index)
+                    to_delete.add(id(data_input))
             except (
                 BrokenObjectLinkError,
                 MalformedInputError,
@@ -440,8 +675,62 @@ class MCNP_Problem:
             ) as e:
                 handle_error(e)
                 continue
-        for delete_index in to_delete[::-1]:
-            del self._data_inputs[delete_index]
+        if to_delete:
+            self._data_inputs[:] = [
+                input for input in self._data_inputs if id(input) not in to_delete
+            ]
+
+    def renumber(self, cells=None, surfaces=None, materials=None, transforms=None):
+        """
+        Renumbers many objects of this problem at once.
+
+        Every kind of object can be renumbered with its own scheme, which can be:
+
+        * an ``int`` to offset every number by, e.g., ``10000``.
+        * ``"compact"`` to number the objects consecutively from the collection's
+          :func:`~montepy.numbered_object_collection.NumberedObjectCollection.starting_number`
+          by its :func:`~montepy.numbered_object_collection.NumberedObjectCollection.step`,
+          keeping the order of their current numbers.
+        * a ``dict`` mapping old numbers to new numbers. Objects not in the dict are not renumbered.
+
+        For example to get the cells out of the way before merging two models,
+        and to close all gaps in the surface numbers:
+
+        .. code-block:: python
+
+            problem.renumber(cells=10000, surfaces="compact")
+
+        All of the new numbers are checked together before any object is renumbered,
+        so this is much faster than setting every number one at a time.
+        The new numbers are written out to every input that references these objects
+        the next time this problem is written.
+
+        .. versionadded:: 0.5.4
+
+        :param cells: how to renumber the cells.
+        :type cells: int, str, dict
+        :param surfaces: how to renumber the surfaces.
+        :type surfaces: int, str, dict
+        :param materials: how to renumber the materials.
+        :type materials: int, str, dict
+        :param transforms: how to renumber the transforms.
+        :type transforms: int, str, dict
+        :raises TypeError: if a scheme, or a new number is the wrong type.
+        :raises ValueError: if a scheme is unknown, or a new number is negative.
+        :raises KeyError: if a number in a mapping isn't in the problem.
+        :raises NumberConflictError: if two objects would have the same number.
+        """
+        renumbering = []
+        for collection, scheme in (
+            (self.cells, cells),
+            (self.surfaces, surfaces),
+            (self.materials, materials),
+            (self.transforms, transforms),
+        ):
+            if scheme is not None:
+                renumbering.append((collection, collection._find_new_numbers(scheme)))
+        for collection, new_numbers in renumbering:
+            collection._set_numbers(new_numbers)
 
     def remove_duplicate_surfaces(self, tolerance):
         """Finds duplicate surfaces in the problem, and remove them.
@@ -490,27 +779,249 @@ class MCNP_Problem:
         self._transforms = Transforms(transforms, problem=self)
         self._data_inputs = sorted(set(self._data_inputs + materials + transforms))
 
-    def write_problem(self, destination, overwrite=False):
+    def write_problem(self, destination, overwrite=False, workers=1):
         """
         Write the problem to a file or writeable object.
 
+        .. versionchanged:: 0.5.4
+            Added the ``workers`` parameter.
+
+        .. versionchanged:: 0.5.4
+            Paths ending in ``.gz``, ``.bz2``, or ``.xz`` are compressed as they are written.
+
         :param destination: File path or writable object
         :type destination: io.TextIOBase, str, os.PathLike
         :param overwrite: Whether to overwrite 'destination' if it is an existing file
         :type overwrite: bool
+        :param workers: How many processes to format the inputs in.
+            Using more than one process only helps when most inputs have changed since the last write,
+            e.g., after a renumbering.
+            The output is the same for any number of workers.
+        :type workers: int
+        :raises TypeError: if workers is not an int.
+        :raises ValueError: if workers is not positive.
         """
+        if not isinstance(workers, int):
+            raise TypeError(f"workers must be an int. {workers} given.")
+        if workers < 1:
+            raise ValueError(f"workers must be positive. {workers} given.")
         if hasattr(destination, "write") and callable(getattr(destination, "write")):
             new_file = MCNP_InputFile.from_open_stream(destination)
-            self._write_to_stream(new_file)
+            self._write_to_stream(new_file, workers)
         elif isinstance(destination, (str, os.PathLike)):
             new_file = MCNP_InputFile(destination, overwrite=overwrite)
             with new_file.open("w") as fh:
-                self._write_to_stream(fh)
+                record = _WriteRecord(destination, self.mcnp_version, fh._newline_size)
+                self._write_to_stream(fh, workers, record)
+            record.finish(new_file._position)
+            self._write_record = record
         else:
             raise TypeError(
                 f"destination f{destination} is not a file path or writable object"
             )
 
+    def write_patch(self, destination, overwrite=False):
+        """
+        Writes the problem to a file, copying the unchanged inputs from the last file it was written to.
+
+        Only the inputs that have changed since this problem was last written to a file,
+        by :func:`write_problem` or this method, are formatted again.
+        The lines of all other inputs are copied straight from that file in large chunks,
+        with ``os.copy_file_range`` where it is available.
+        This is much faster than :func:`write_problem` for small edits to large problems,
+        and the output is the same.
+
+        If the problem hasn't been written to a file yet, or that file has been changed since,
+        the whole problem is written like :func:`write_problem`.
+        This is also the case when either file is compressed.
+
+        .. code-block:: python
+
+            problem.write_problem("model.imcnp")
+            problem.cells[1].mass_density = 10.0
+            problem.write_patch("model_dense.imcnp")
+
+        .. versionadded:: 0.5.4
+
+        :param destination: File path to write to.
+            This can be the last file the problem was written to, if ``overwrite`` is set.
+        :type destination: str, os.PathLike
+        :param overwrite: Whether to overwrite 'destination' if it is an existing file
+        :type overwrite: bool
+        :raises TypeError: if destination is not a file path.
+        :raises FileExistsError: if a file already exists with the same path, and overwrite is not set.
+        :raises IsADirectoryError: if the path given is actually a directory.
+        """
+        if not isinstance(destination, (str, os.PathLike)):
+            raise TypeError(f"destination {destination} is not a file path")
+        base = self._write_record
+        if (
+            base is None
+            or not base.is_current(self.mcnp_version)
+            or _find_compression(destination, check_magic=False)
+        ):
+            return self.write_problem(destination, overwrite)
+        MCNP_InputFile(destination, overwrite=overwrite)._check_can_write()
+        in_place = os.path.exists(destination) and os.path.samefile(
+            destination, base.path
+        )
+        if in_place:
+            fd, out_path = tempfile.mkstemp(dir=os.path.dirname(base.path))
+            os.close(fd)
+            shutil.copymode(base.path, out_path)
+        else:
+            out_path = destination
+        try:
+            with open(base.path, "rb") as source, open(out_path, "wb") as out:
+                record = self._write_patch_to(source, out, base, destination)
+                size = out.tell()
+            if in_place:
+                os.replace(out_path, destination)
+        except BaseException:
+            if in_place and os.path.exists(out_path):
+                os.remove(out_path)
+            raise
+        record.finish(size)
+        self._write_record = record
+
+    def _write_patch_to(self, source, out, base, destination):
+        """
+        Writes the patched problem, copying the unchanged inputs from the last file.
+
+        .. versionadded:: 0.5.4
+
+        :param source: the last file this problem was written to, open for reading bytes.
+        :type source: io.BufferedReader
+        :param out: the file to write to, open for writing bytes.
+        :type out: io.BufferedWriter
+        :param base: where every input was written in ``source``.
+        :type base: _WriteRecord
+        :param destination: the path being written to.
+        :type destination: str, os.PathLike
+        :returns: where every input was written in ``out``.
+        :rtype: _WriteRecord
+        """
+        record = _WriteRecord(destination, self.mcnp_version, base.newline_size)
+        newline = os.linesep
+        position = 0
+        lineno = 1
+        # the range of source that is still to be copied
+        copy_start = copy_end = None
+        with self._reading_shared(), _record_line_expansions() as expansions:
+            handled = 0
+            for obj in self._objects_to_write():
+                entry = base.find(obj, self.mcnp_version)
+                if entry is not None:
+                    _, start, end, num_lines = entry
+                    if start != copy_end:
+                        if copy_start is not None:
+                            _copy_file_range(source, out, copy_start, copy_end)
+                        copy_start = start
+                    copy_end = end
+                    record.add(obj, position, position + end - start, num_lines)
+                    position += end - start
+                    lineno += num_lines
+                    continue
+                lines = self._format_for_writing(obj)
+                if len(expansions) > handled:
+                    self._locate_expansions(
+                        expansions[handled:], lineno, str(destination), obj, lines
+                    )
+                    handled = len(expansions)
+                if copy_start is not None:
+                    _copy_file_range(source, out, copy_start, copy_end)
+                    copy_start = copy_end = None
+                text = "".join(line + "\n" for line in lines)
+                if newline != "\n":
+                    text = text.replace("\n", newline)
+                data = text.encode("ascii")
+                out.write(data)
+                record.add(obj, position, position + len(data), len(lines))
+                position += len(data)
+                lineno += len(lines)
+            if copy_start is not None:
+                _copy_file_range(source, out, copy_start, copy_end)
+        self._handle_warnings(expansions)
+        return record
+
+    def write_tree(self, destination, overwrite=False):
+        """
+        Writes the problem back to the tree of files it was read from with READ inputs.
+
+        Every object is written to the file it was read from, and the READ inputs are kept,
+        so ``destination`` reads the same files as the original input did.
+        New objects are written to ``destination``.
+        The files that were read are written relative to the directory of ``destination``,
+        like they are read relative to the directory of the original input.
+
+        Only the files with objects that have changed are written.
+        If ``destination`` is the original input, the other files are not touched at all,
+        and otherwise they are copied unchanged.
+        Objects are treated as changed if they have been modified, or if a file was written
+        with :func:`write_problem` since it was read, or last written with this.
+        Problems without READ inputs are written like with :func:`write_problem`.
+        Files that were read compressed are written compressed,
+        with the same extension added to their file names, e.g., ``fuel.i.gz`` for ``read file=fuel.i``.
+
+        .. code-block:: python
+
+            problem = montepy.read_input("reactor/core.imcnp")
+            problem.materials[5].add_nuclide("U-235.80c", 0.01)
+            # only the file that has material 5 is rewritten
+            problem.write_tree("reactor/core.imcnp", overwrite=True)
+
+        .. versionadded:: 0.5.4
+
+        :param destination: File path for the top of the tree.
+        :type destination: str, os.PathLike
+        :param overwrite: Whether to overwrite files that already exist.
+        :type overwrite: bool
+        :returns: the paths of the files that were written, or copied.
+        :rtype: list
+        :raises TypeError: if destination is not a file path.
+        :raises FileExistsError: if a file would be written that already exists, and overwrite is not set.
+        :raises IsADirectoryError: if a path to write is actually a directory.
+        """
+        if not isinstance(destination, (str, os.PathLike)):
+            raise TypeError(f"destination {destination} is not a file path")
+        destination = os.fspath(destination)
+        tree = self._file_tree
+        if tree is None:
+            self.write_problem(destination, overwrite)
+            return [destination]
+        contents = tree.contents(self)
+        changed = tree.changed_files(self, contents)
+        directory = os.path.dirname(destination)
+        paths = {
+            key: (
+                destination
+                if key is None
+                else os.path.join(directory, key) + tree.suffixes[key]
+            )
+            for key in tree.sources
+        }
+        written = []
+        for key, path in paths.items():
+            if key in changed or not _is_same_file(path, tree.sources[key]):
+                written.append(key)
+        # check everything first, so nothing is written if any file can't be
+        for key in written:
+            MCNP_InputFile(paths[key], overwrite=overwrite)._check_can_write()
+        for key in written:
+            path = paths[key]
+            if os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            if key in changed:
+                with MCNP_InputFile(path, overwrite=overwrite).open("w") as fh:
+                    self._write_to_stream(
+                        fh, sequence=tree.sequence(self, key, contents)
+                    )
+            else:
+                shutil.copyfile(tree.sources[key], path)
+        tree.sources = {key: os.path.abspath(path) for key, path in paths.items()}
+        tree.snapshot(self, contents)
+        return [paths[key] for key in written]
+
     def write_to_file(self, file_path, overwrite=False):
         """
         Writes the problem to a file.
@@ -528,47 +1039,155 @@ class MCNP_Problem:
         """
         return self.write_problem(file_path, overwrite)
 
-    def _write_to_stream(self, inp):
+    def _write_to_stream(self, inp, workers=1, record=None, sequence=None):
         """
         Writes the problem to a writeable stream.
 
+        .. versionchanged:: 0.5.4
+            The lines are written in large chunks with :func:`~montepy.input_parser.input_file.MCNP_InputFile.write_lines`,
+            and line expansions are recorded directly instead of catching all warnings.
+            Added the ``workers``, ``record``, and ``sequence`` parameters.
+
         :param inp: Writable input file
         :type inp: MCNP_InputFile
+        :param workers: How many processes to format the inputs in.
+        :type workers: int
+        :param record: where to record where every input is written, if anywhere.
+        :type record: _WriteRecord
+        :param sequence: what to write, instead of :func:`_objects_to_write`.
+        :type sequence: list
         """
-        with warnings.catch_warnings(record=True) as warning_catch:
-            objects_list = []
-            if self.message:
-                objects_list.append(([self.message], False))
-            objects_list += [
-                ([self.title], False),
-                (self.cells, True),
-                (self.surfaces, True),
-                (self.data_inputs, True),
-            ]
-            for objects, terminate in objects_list:
-                for obj in objects:
-                    lines = obj.format_for_mcnp_input(self.mcnp_version)
-                    if warning_catch:
-                        # handle ALL new warnings
-                        for warning in warning_catch[::-1]:
-                            if getattr(warning, "handled", None):
-                                break
-                            warning.lineno = inp.lineno
-                            warning.path = inp.name
-                            warning.obj = obj
-                            warning.lines = lines
-                            warning.handled = True
-                    for line in lines:
-                        inp.write(line + "\n")
-                if terminate:
-                    inp.write("\n")
-            for line in self.cells._run_children_format_for_mcnp(
+        with self._reading_shared(), _record_line_expansions() as expansions:
+            if sequence is None:
+                sequence = self._objects_to_write()
+            if workers > 1:
+                formatted = self._format_in_workers(sequence, workers)
+            else:
+                formatted = ((self._format_for_writing(obj), ()) for obj in sequence)
+            handled = 0
+            for obj, (lines, new_expansions) in zip(sequence, formatted):
+                expansions += new_expansions
+                if len(expansions) > handled:
+                    self._locate_expansions(
+                        expansions[handled:], inp.lineno, inp.name, obj, lines
+                    )
+                    handled = len(expansions)
+                start = inp._position
+                inp.write_lines(lines)
+                if record is not None:
+                    record.add(obj, start, inp._position, len(lines))
+            inp.flush()
+        self._handle_warnings(expansions)
+
+    def _objects_to_write(self):
+        """
+        Lists everything that is written for this problem, in order.
+
+        ``None`` is the blank line that ends a block,
+        and :attr:`cells` is the cell modifiers that are printed in the data block.
+
+        .. versionadded:: 0.5.4
+
+        :rtype: list
+        """
+        sequence = []
+        if self.message:
+            sequence.append(self.message)
+        sequence.append(self.title)
+        for objects in (self.cells, self.surfaces, self.data_inputs):
+            sequence += objects
+            sequence.append(None)
+        sequence += [self.cells, None]
+        return sequence
+
+    def _format_for_writing(self, obj):
+        """
+        Formats one item from :func:`_objects_to_write`.
+
+        .. versionadded:: 0.5.4
+
+        :returns: the lines to write.
+        :rtype: list
+        """
+        if obj is None:
+            return [""]
+        if obj is self.cells:
+            return self.cells._run_children_format_for_mcnp(
                 self.data_inputs, self.mcnp_version
+            )
+        if isinstance(obj, mcnp_input.ReadInput):
+            return list(obj.input_lines)
+        if self._copy_on_write is not None and isinstance(obj, CellModifierInput):
+            return self._copy_on_write.format_modifier(obj, self.mcnp_version)
+        return obj.format_for_mcnp_input(self.mcnp_version)
+
+    def _format_in_workers(self, sequence, workers):
+        """
+        Formats the objects to write in chunks in worker processes.
+
+        The workers are forked from this process when possible,
+        so the problem doesn't need to be pickled.
+        The chunks are yielded in order as they are done.
+        The lines that the workers keep for the objects in ``sequence``,
+        see :func:`~montepy.mcnp_object._cache_format`,
+        are sent back, and kept by those objects, so the next write can reuse them.
+        The lines kept by the objects that these objects print, e.g., the thermal scattering of a material, are not.
+
+        .. versionadded:: 0.5.4
+
+        :param sequence: the objects from :func:`_objects_to_write`.
+        :type sequence: list
+        :param workers: how many processes to use.
+        :type workers: int
+        :returns: the lines, and the line expansion warnings for every object in ``sequence``.
+        :rtype: generator
+        """
+        if "fork" in multiprocessing.get_all_start_methods():
+            context = multiprocessing.get_context("fork")
+        else:
+            context = None
+        chunk_size = math.ceil(len(sequence) / (workers * _CHUNKS_PER_WORKER))
+        with concurrent.futures.ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_format_worker,
+            initargs=(self, sequence),
+        ) as executor:
+            starts = range(0, len(sequence), chunk_size)
+            for start, chunk in zip(
+                starts,
+                executor.map(_format_chunk, starts, itertools.repeat(chunk_size)),
             ):
-                inp.write(line + "\n")
+                objects = sequence[start : start + chunk_size]
+                for obj, (lines, expansions, cache) in zip(objects, chunk):
+                    if cache is not None and cache[0] == obj._format_key(
+                        self.mcnp_version
+                    ):
+                        obj._format_cache = cache
+                    yield lines, expansions
 
-            inp.write("\n")
-        self._handle_warnings(warning_catch)
+    @staticmethod
+    def _locate_expansions(expansions, lineno, path, obj, lines):
+        """
+        Records where the lines that expanded are being written.
+
+        .. versionadded:: 0.5.4
+
+        :param expansions: the line expansion warnings made while formatting ``obj``.
+        :type expansions: list
+        :param lineno: the line number the lines are being written on.
+        :type lineno: int
+        :param path: the name of the file the lines are being written to.
+        :type path: str
+        :param obj: the object that was formatted.
+        :param lines: the lines for the object.
+        :type lines: list
+        """
+        for warning in expansions:
+            warning.lineno = lineno
+            warning.path = path
+            warning.obj = obj
+            warning.lines = lines
 
     def _handle_warnings(self, warning_queue):
         class WarningLevels(Enum):
@@ -578,9 +1197,8 @@ class MCNP_Problem:
 
         warning_level = WarningLevels.MAXIMAL
 
-        for warning_message in warning_queue:
-            warning = warning_message.message
-            message = f"The input starting on Line {warning_message.lineno} of: {warning_message.path} expanded. "
+        for warning in warning_queue:
+            message = f"The input starting on Line {warning.lineno} of: {warning.path} expanded. "
             if warning_level == WarningLevels.SUPRESS:
                 continue
             elif warning_level == WarningLevels.MINIMAL:
@@ -590,8 +1208,8 @@ class MCNP_Problem:
                     message += f"The new lines are: {warning.new_value}"
             elif warning_level == WarningLevels.MAXIMAL:
                 message += "\nThe new input is:\n"
-                for i, line in enumerate(warning_message.lines):
-                    message += f"     {warning_message.lineno + i:5g}| {line}\n"
+                for i, line in enumerate(warning.lines):
+                    message += f"     {warning.lineno + i:5g}| {line}\n"
                 message += warning.message
             warning = LineExpansionWarning(message)
             warnings.warn(warning, stacklevel=3)
@@ -622,8 +1240,804 @@ class MCNP_Problem:
         if self.message:
             ret += str(self._message) + "\n"
         ret += str(self._title) + "\n"
-        for collection in [self.cells, self.surfaces, self.data_inputs]:
-            for obj in collection:
-                ret += f"{obj}\n"
-            ret += "\n"
+        with self._reading_shared():
+            for collection in [self.cells, self.surfaces, self.data_inputs]:
+                for obj in collection:
+                    ret += f"{obj}\n"
+                ret += "\n"
         return ret
+
+
+_CHUNKS_PER_WORKER = 4
+"""
+How many chunks of objects are given to each worker process when writing in parallel.
+"""
+
+_FORMAT_WORKER_STATE = {}
+"""
+The problem, and the objects to write in a worker process for :func:`MCNP_Problem._format_in_workers`.
+"""
+
+
+def _init_format_worker(problem, sequence):
+    _FORMAT_WORKER_STATE["problem"] = problem
+    _FORMAT_WORKER_STATE["sequence"] = sequence
+
+
+def _format_chunk(start, size):
+    problem = _FORMAT_WORKER_STATE["problem"]
+    ret = []
+    for obj in _FORMAT_WORKER_STATE["sequence"][start : start + size]:
+        with _record_line_expansions() as expansions:
+            lines = problem._format_for_writing(obj)
+        ret.append((lines, expansions, getattr(obj, "_format_cache", None)))
+    return ret
+
+
+def _copy_file_range(source, destination, start, end):
+    """
+    Copies a range of bytes from one file to another.
+
+    ``os.copy_file_range`` is used where it is available, so the bytes can be copied by the kernel,
+    otherwise the bytes are read, and written in chunks.
+    ``destination`` is flushed first, so the bytes are written in order.
+
+    .. versionadded:: 0.5.4
+
+    :param source: the file to copy from, open for reading bytes.
+    :type source: io.BufferedReader
+    :param destination: the file to copy to, open for writing bytes.
+    :type destination: io.BufferedWriter
+    :param start: the position of the first byte to copy.
+    :type start: int
+    :param end: the position after the last byte to copy.
+    :type end: int
+    :raises EOFError: if source ends before ``end``.
+    """
+    destination.flush()
+    if hasattr(os, "copy_file_range"):
+        src_fd = source.fileno()
+        dest_fd = destination.fileno()
+        try:
+            while start < end:
+                copied = os.copy_file_range(src_fd, dest_fd, end - start, start)
+                if copied == 0:
+                    break
+                start += copied
+        except OSError:
+            # e.g., copying between file systems isn't supported everywhere
+            pass
+        else:
+            if start < end:
+                raise EOFError(f"{source.name} ended before byte {end}.")
+            return
+    source.seek(start)
+    while start < end:
+        chunk = source.read(min(end - start, _COPY_CHUNK_SIZE))
+        if not chunk:
+            raise EOFError(f"{source.name} ended before byte {end}.")
+        destination.write(chunk)
+        start += len(chunk)
+
+
+_COPY_CHUNK_SIZE = 1 << 20
+"""
+How many bytes to copy at a time when ``os.copy_file_range`` can't be used.
+"""
+
+
+class _WriteRecord:
+    """
+    Records where every input was written in a file, so it can be copied instead of formatted again.
+
+    Only inputs that cache their formatted lines are recorded,
+    so they can be checked for having been changed since.
+
+    .. versionadded:: 0.5.4
+
+    :param path: the path of the file being written.
+    :type path: str, os.PathLike
+    :param mcnp_version: the version of MCNP the file is written for.
+    :type mcnp_version: tuple
+    :param newline_size: how many characters each newline is written as.
+    :type newline_size: int
+    """
+
+    __slots__ = ("path", "mcnp_version", "newline_size", "inputs", "stat")
+
+    def __init__(self, path, mcnp_version, newline_size):
+        self.path = os.path.abspath(path)
+        self.mcnp_version = mcnp_version
+        self.newline_size = newline_size
+        self.inputs = {}
+        self.stat = None
+
+    def add(self, obj, start, end, num_lines):
+        """
+        Records where an input was written.
+
+        :param obj: the input that was written.
+        :param start: the position of the first byte of the input.
+        :type start: int
+        :param end: the position after the last byte of the input.
+        :type end: int
+        :param num_lines: how many lines the input was written as.
+        :type num_lines: int
+        """
+        cache = getattr(obj, "_format_cache", None)
+        if cache is not None:
+            self.inputs[id(obj)] = (cache, start, end, num_lines)
+
+    def finish(self, size):
+        """
+        Records the state of the file once it has been written and closed.
+
+        If the file isn't as large as expected, nothing can be copied from it.
+
+        :param size: how many bytes were written.
+        :type size: int
+        """
+        stat = os.stat(self.path)
+        if stat.st_size == size:
+            self.stat = (stat.st_size, stat.st_mtime_ns)
+
+    def is_current(self, mcnp_version):
+        """
+        Checks that the file is still as it was written.
+
+        :param mcnp_version: the version of MCNP that will be written.
+        :type mcnp_version: tuple
+        :rtype: bool
+        """
+        if (
+            self.stat is None
+            or self.mcnp_version != mcnp_version
+            or self.newline_size != len(os.linesep)
+        ):
+            return False
+        try:
+            stat = os.stat(self.path)
+        except OSError:
+            return False
+        return self.stat == (stat.st_size, stat.st_mtime_ns)
+
+    def find(self, obj, mcnp_version):
+        """
+        Finds where an input was written, if it hasn't been changed since.
+
+        :param obj: the input to find.
+        :param mcnp_version: the version of MCNP that will be written.
+        :type mcnp_version: tuple
+        :returns: the format cache, the start, and end bytes, and how many lines the input was written as.
+            ``None`` if the input wasn't written, or has been changed since.
+        :rtype: tuple
+        """
+        entry = self.inputs.get(id(obj))
+        if entry is None:
+            return None
+        cache = getattr(obj, "_format_cache", None)
+        if entry[0] is not cache or cache[0] != obj._format_key(mcnp_version):
+            return None
+        return entry
+
+
+def _is_same_file(path, other):
+    """
+    Checks if two paths are for the same existing file.
+
+    .. versionadded:: 0.5.4
+
+    :rtype: bool
+    """
+    try:
+        return os.path.samefile(path, other)
+    except OSError:
+        return False
+
+
+class _FileTree:
+    """
+    The files that a problem was read from with READ inputs, and which objects are in each one.
+
+    Every file is keyed by the file name given in the READ input that read it,
+    and the top file by ``None``.
+    The objects in every file, and their :func:`~montepy.mcnp_object.MCNP_Object._format_key`
+    are recorded, so the files with changed objects can be found.
+
+    .. versionadded:: 0.5.4
+
+    :param problem: the problem that was read.
+    :type problem: MCNP_Problem
+    :param reads: every READ input, the key of the file it is in,
+        and how many objects were read from that file before it.
+    :type reads: list
+    :param parsed: the objects read from every file, in order.
+    :type parsed: dict
+    :param modifier_files: the keys of the files with cell modifiers in their data blocks.
+    :type modifier_files: set
+    """
+
+    def __init__(self, problem, reads, parsed, modifier_files):
+        self.reads = reads
+        self.parsed = parsed
+        self.modifier_files = modifier_files
+        top = os.path.abspath(_find_compressed_path(problem._input_file.path))
+        self.sources = {None: top}
+        self.start_blocks = {None: block_type.BlockType.CELL}
+        # the compression extensions of files that were read in place of the file named
+        self.suffixes = {None: ""}
+        for read_input, _, _ in reads:
+            key = read_input.file_name
+            path = os.path.join(os.path.dirname(top), key)
+            self.sources[key] = _find_compressed_path(path)
+            self.suffixes[key] = self.sources[key][len(path) :]
+            self.start_blocks[key] = read_input.block_type
+        self.snapshot(problem, self.contents(problem))
+
+    def contents(self, problem):
+        """
+        Finds the objects that are in every file now.
+
+        Objects that weren't read from a file are in the top file.
+
+        :param problem: the problem to check.
+        :type problem: MCNP_Problem
+        :returns: the objects in every block of every file, in order.
+        :rtype: dict
+        """
+        file_of = {
+            id(obj): key
+            for key, objects in self.parsed.items()
+            if key is not None
+            for obj in objects
+        }
+        contents = {key: ([], [], []) for key in self.sources}
+        for block, objects in enumerate(
+            (problem.cells, problem.surfaces, problem.data_inputs)
+        ):
+            for obj in objects:
+                contents[file_of.get(id(obj))][block].append(obj)
+        return contents
+
+    def snapshot(self, problem, contents):
+        """
+        Records what is in every file now.
+
+        :param problem: the problem that was written.
+        :type problem: MCNP_Problem
+        :param contents: the objects in every file from :func:`contents`.
+        :type contents: dict
+        """
+        version = problem.mcnp_version
+        self.mcnp_version = version
+        self.title = problem.title
+        self.message = problem.message
+        self.cells = list(problem.cells)
+        # this is first, as formatting can mark the cell modifiers as modified
+        try:
+            self.modifier_lines = self._modifier_lines(problem)
+        except ValueError:
+            # the problem can't be written as it is, so the top file always will be
+            self.modifier_lines = None
+        self.objects = {}
+        self.format_keys = {}
+        for key, blocks in contents.items():
+            objects = [obj for block in blocks for obj in block]
+            self.objects[key] = objects
+            self.format_keys[key] = [obj._format_key(version) for obj in objects]
+
+    def changed_files(self, problem, contents):
+        """
+        Finds the files that must be written again.
+
+        Cell modifiers in the data block print the values of every cell,
+        so if any cell changed all files with them must be written,
+        and the top file if the cell modifiers that weren't read from a file print differently.
+        Those files are always written together, as modifiers can be merged across them.
+
+        :param problem: the problem to check.
+        :type problem: MCNP_Problem
+        :param contents: the objects in every file from :func:`contents`.
+        :type contents: dict
+        :returns: the keys of the changed files.
+        :rtype: set
+        """
+        version = problem.mcnp_version
+        if version != self.mcnp_version:
+            return set(self.sources)
+        changed = set()
+        cells_changed = len(problem.cells) != len(self.cells) or any(
+            cell is not old for cell, old in zip(problem.cells, self.cells)
+        )
+        for key, blocks in contents.items():
+            old_keys = {
+                id(obj): format_key
+                for obj, format_key in zip(self.objects[key], self.format_keys[key])
+            }
+            objects = [obj for block in blocks for obj in block]
+            if len(objects) != len(self.objects[key]) or any(
+                obj is not old for obj, old in zip(objects, self.objects[key])
+            ):
+                changed.add(key)
+            for obj in objects:
+                if obj._format_key(version) != old_keys.get(id(obj)):
+                    changed.add(key)
+                    if isinstance(obj, Cell):
+                        cells_changed = True
+        if cells_changed or changed & self.modifier_files:
+            changed |= self.modifier_files
+        if (
+            (
+                cells_changed
+                and (
+                    self.modifier_lines is None
+                    or self._modifier_lines(problem) != self.modifier_lines
+                )
+            )
+            or problem.title is not self.title
+            or problem.message is not self.message
+        ):
+            changed.add(None)
+        return changed
+
+    @staticmethod
+    def _modifier_lines(problem):
+        """
+        Formats the cell modifiers that the top file prints in the data block,
+        which aren't data inputs.
+
+        :param problem: the problem to format.
+        :type problem: MCNP_Problem
+        :rtype: list
+        """
+        # any line expansions are warned about when the file is written.
+        with _record_line_expansions():
+            return problem._format_for_writing(problem.cells)
+
+    def sequence(self, problem, key, contents):
+        """
+        Lists everything that is written to one file, in order, with its READ inputs.
+
+        Every READ input is put after the last object before it in its file that is still there.
+
+        :param problem: the problem to write.
+        :type problem: MCNP_Problem
+        :param key: the key of the file to write.
+        :type key: str
+        :param contents: the objects in every file from :func:`contents`.
+        :type contents: dict
+        :returns: the items to write, like :func:`MCNP_Problem._objects_to_write`.
+        :rtype: list
+        """
+        blocks = []
+        for block, objects in enumerate(contents[key]):
+            present = {id(obj) for obj in objects}
+            heads = []
+            after = {}
+            for read_input, parent, index in self.reads:
+                if parent != key or read_input.block_type.value != block:
+                    continue
+                anchor = next(
+                    (
+                        id(obj)
+                        for obj in reversed(self.parsed[key][:index])
+                        if id(obj) in present
+                    ),
+                    None,
+                )
+                if anchor is None:
+                    heads.append(read_input)
+                else:
+                    after.setdefault(anchor, []).append(read_input)
+            items = heads
+            for obj in objects:
+                items.append(obj)
+                items += after.get(id(obj), [])
+            blocks.append(items)
+        if key is None:
+            sequence = []
+            if problem.message:
+                sequence.append(problem.message)
+            sequence.append(problem.title)
+            for items in blocks:
+                sequence += items
+                sequence.append(None)
+            sequence += [problem.cells, None]
+            return sequence
+        blocks = blocks[self.start_blocks[key].value :]
+        while len(blocks) > 1 and not blocks[-1]:
+            blocks.pop()
+        sequence = []
+        for i, items in enumerate(blocks):
+            if i:
+                sequence.append(None)
+            sequence += items
+        return sequence
+
+
+class _DataInputPositions:
+    """
+    The positions of a problem's data inputs by their ids.
+
+    The positions are found once, and removing a data input only records where it was,
+    so finding, and removing data inputs doesn't scan the list, or compare them by equality.
+
+    .. versionadded:: 0.5.4
+
+    :param data_inputs: the problem's list of data inputs.
+    :type data_inputs: list
+    """
+
+    _MIN_REBUILD = 64
+    """
+    How many data inputs can be removed before the positions are found again, for small problems.
+    """
+
+    def __init__(self, data_inputs):
+        self.data_inputs = data_inputs
+        self.positions = {id(data_input): i for i, data_input in enumerate(data_inputs)}
+        # the original positions of the removed data inputs in order
+        self.removed = []
+
+    def is_current(self, data_inputs):
+        """
+        Whether these are still the positions for the list, as far as can be told cheaply.
+
+        :rtype: bool
+        """
+        return (
+            self.data_inputs is data_inputs
+            and len(self.positions) == len(data_inputs)
+            and len(self.removed) <= max(self._MIN_REBUILD, len(data_inputs))
+        )
+
+    def find(self, obj):
+        """
+        Finds where an object is.
+
+        :returns: the index of the object, or ``None`` if it isn't found.
+        :rtype: int
+        """
+        position = self.positions.get(id(obj))
+        if position is None:
+            return None
+        position -= bisect.bisect_left(self.removed, position)
+        data_inputs = self.data_inputs
+        if position < len(data_inputs) and data_inputs[position] is obj:
+            return position
+        return None
+
+    def remove(self, obj, index):
+        """
+        Removes an object that was found at ``index``.
+        """
+        original = self.positions.pop(id(obj))
+        bisect.insort(self.removed, original)
+        del self.data_inputs[index]
+
+    def replace(self, original, new, index):
+        """
+        Puts ``new`` in the place of ``original``, which was found at ``index``.
+        """
+        self.positions[id(new)] = self.positions.pop(id(original))
+        self.data_inputs[index] = new
+
+
+class _CopyOnWrite:
+    """
+    Shares the objects of a problem with a copy-on-write clone of it,
+    and copies them for the clone the first time they are needed.
+
+    Objects are copied together with everything they link to,
+    e.g., a cell with its material, and surfaces,
+    with one memo for ``copy.deepcopy``, so nothing is ever copied twice.
+    The copies take the places of the objects in the clone's collections, and data inputs.
+
+    .. versionadded:: 0.5.4
+
+    :param problem: the clone.
+    :type problem: MCNP_Problem
+    :param source: the problem that was cloned.
+    :type source: MCNP_Problem
+    """
+
+    def __init__(self, problem, source):
+        self._problem_ref = weakref.ref(problem)
+        self.source = source
+        self.memo = {}
+        # the objects that were copied by the ids of their copies
+        self.originals = {}
+        # how many times the shared objects are being read without copying them
+        self.reading = 0
+        # the objects that hold each shared object by its id, found when they are first needed
+        self.holders = None
+        # the objects of the problems that this was cloned from through other clones are shared as well
+        while source is not None:
+            if source._clones is None:
+                source._clones = weakref.WeakSet()
+            source._clones.add(self)
+            source = (
+                source._copy_on_write.source
+                if source._copy_on_write is not None
+                else None
+            )
+        _SharedObjects.clones += 1
+        weakref.finalize(self, _CopyOnWrite._forget)
+
+    @staticmethod
+    def _forget():
+        """
+        Stops counting a clone that was garbage collected.
+        """
+        _SharedObjects.clones -= 1
+
+    @staticmethod
+    def unshare(obj, while_reading=False):
+        """
+        Copies an object for every copy-on-write clone that shares it, before it is changed.
+
+        Helper objects, e.g., a :class:`~montepy.surfaces.half_space.HalfSpace`,
+        are copied with the object that owns them,
+        and cell modifiers from the cell block with their cell.
+
+        :param obj: the object that is about to be changed.
+        :param while_reading: Whether to copy the object even while a problem is being written.
+        :type while_reading: bool
+        """
+        if _SharedObjects.reading and not while_reading:
+            return
+        if not isinstance(obj, montepy.mcnp_object.MCNP_Object):
+            obj = getattr(obj, "_owner", None)
+            if obj is None:
+                return
+        # objects that are being copied aren't linked yet
+        problem_ref = getattr(obj, "_problem_ref", None)
+        problem = problem_ref() if problem_ref is not None else None
+        if problem is None or not problem._clones:
+            return
+        for shared in list(problem._clones):
+            shared._unshare(obj)
+
+    def _unshare(self, obj):
+        """
+        Copies an object for the clone before it is changed, if the clone shares it.
+
+        :param obj: the object that is about to be changed.
+        :type obj: MCNP_Object
+        """
+        problem = self._problem_ref()
+        if problem is None or id(obj) in self.memo:
+            return
+        if self.holders is None:
+            self.holders = self._find_holders(problem)
+        holder = self.holders.get(id(obj))
+        if holder is not None:
+            self.copy(holder)
+
+    def _find_holders(self, problem):
+        """
+        Finds which objects hold the objects that the clone shares.
+
+        The objects in the collections, and data inputs hold themselves,
+        and the cell modifiers from the cell block are held by their cell.
+
+        :param problem: the clone.
+        :type problem: MCNP_Problem
+        :returns: the objects that hold each shared object by its id.
+        :rtype: dict
+        """
+        holders = {}
+        for collect_type in MCNP_Problem._NUMBERED_OBJ_MAP.values():
+            collection = getattr(problem, f"_{collect_type.__name__.lower()}")
+            for obj in collection._objects.values():
+                holders[id(obj)] = obj
+        for data_input in problem._data_inputs:
+            holders[id(data_input)] = data_input
+        for cell in problem._cells._objects.values():
+            for attr, _ in Cell._INPUTS_TO_PROPERTY.values():
+                modifier = cell.__dict__.get(attr)
+                if modifier is not None:
+                    holders[id(modifier)] = cell
+        return holders
+
+    def copy(self, obj):
+        """
+        Gets the clone's own copy of an object, and copies it the first time.
+
+        :param obj: an object from one of the clone's collections, or data inputs.
+        :type obj: MCNP_Object
+        :returns: the copy, or the object itself if it already belongs to the clone.
+        :rtype: MCNP_Object
+        """
+        problem = self._problem_ref()
+        if obj._problem is problem or id(obj) in self.originals:
+            return obj
+        memo = self.memo
+        copied = memo.get(id(obj))
+        if copied is not None:
+            return copied
+        # deepcopy keeps every object it copies alive in this list
+        keep_alive = memo.setdefault(id(memo), [])
+        start = len(keep_alive)
+        # copying doesn't make garbage, so don't let the garbage collector rescan the growing heap
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            copied = copy.deepcopy(obj, memo)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        for original in keep_alive[start:]:
+            if isinstance(original, montepy.mcnp_object.MCNP_Object):
+                self._adopt(problem, original, memo[id(original)])
+        return copied
+
+    def _adopt(self, problem, original, copied):
+        """
+        Links a new copy to the clone, and puts it in the place of the original.
+
+        This doesn't use ``link_to_problem``, as that can change how cell modifiers are printed.
+
+        :param problem: the clone.
+        :type problem: MCNP_Problem
+        :param original: the object that was copied.
+        :type original: MCNP_Object
+        :param copied: the copy of it.
+        :type copied: MCNP_Object
+        """
+        self.originals[id(copied)] = original
+        # the lines cached for the original may have been made after something it links to was changed in the clone
+        copied._format_cache = None
+        if original._problem is not None:
+            copied._problem_ref = weakref.ref(problem)
+        for obj_class, collect_type in MCNP_Problem._NUMBERED_OBJ_MAP.items():
+            if isinstance(original, obj_class):
+                getattr(problem, f"_{collect_type.__name__.lower()}")._replace(
+                    original, copied
+                )
+        if problem._replace_data_input(original, copied):
+            if isinstance(original, CellModifierInput):
+                cells = problem._cells
+                for attr, _ in Cell._INPUTS_TO_PROPERTY.values():
+                    if cells.__dict__.get(attr) is original:
+                        setattr(cells, attr, copied)
+
+    def format_modifier(self, modifier, mcnp_version):
+        """
+        Formats a cell modifier for the clone, without changing anything that is shared.
+
+        A modifier from the data block finds which values it can print with shortcuts, e.g., ``2J``,
+        by comparing the values of the cells to the ones that it was read with by identity.
+        The clone's cells hold the values of both the cells that are shared, and the cells that were copied,
+        so the modifier is formatted from a throwaway copy of it,
+        with copies of the values that are matched up the same way.
+
+        :param modifier: the cell modifier to format.
+        :type modifier: CellModifierInput
+        :param mcnp_version: The tuple for the MCNP version that must be exported to.
+        :type mcnp_version: tuple
+        :return: a list of strings for the lines that this input will occupy.
+        :rtype: list
+        """
+        problem = self._problem_ref()
+        probe = copy.copy(modifier)
+        probe._problem_ref = weakref.ref(problem)
+        print_in_data_block = problem.print_in_data_block[modifier._class_prefix()]
+        if (
+            modifier.in_cell_block == print_in_data_block
+            or not probe._is_worth_printing
+        ):
+            return []
+        memo = self.memo
+        # the ids of the shared values by the ids of their copies
+        shared_ids = {
+            id(copied): key for key, copied in memo.items() if key != id(memo)
+        }
+        translation = {}
+        format_memo = {}
+
+        def translate(value):
+            if value is None:
+                return None
+            new = translation.get(id(value))
+            if new is None:
+                new = copy.deepcopy(value)
+                translation[id(value)] = new
+                format_memo[id(value)] = new
+                if id(value) in memo:
+                    format_memo[id(memo[id(value)])] = new
+                if id(value) in shared_ids:
+                    format_memo[shared_ids[id(value)]] = new
+            return new
+
+        if not modifier.in_cell_block:
+            new_values = _map_values(probe._collect_new_values(), translate)
+        formatter = copy.deepcopy(modifier, format_memo)
+        formatter._problem_ref = weakref.ref(problem)
+        if not modifier.in_cell_block:
+            # the values were already collected, and must be the copies that the formatter was made with
+            formatter._collected_values = new_values
+        return formatter.format_for_mcnp_input(mcnp_version)
+
+    def _is_own(self, problem, obj):
+        """
+        Whether the object belongs to the clone, and isn't shared.
+
+        :rtype: bool
+        """
+        return obj._problem is problem or id(obj) in self.originals
+
+    @contextlib.contextmanager
+    def reading_shared(self):
+        """
+        Lets the shared objects be read without copying them, e.g., to write the clone.
+
+        The cells that would be written differently in the clone than in the problem
+        that they are shared with are copied first.
+        """
+        if not self.reading:
+            self._copy_changed_cells()
+        self.reading += 1
+        try:
+            yield
+        finally:
+            self.reading -= 1
+
+    def _copy_changed_cells(self):
+        """
+        Copies the shared objects that would be written differently in the clone.
+
+        All of the cells are copied if the mode, or which cell modifiers are printed in the data block
+        differ from the problem they are shared with,
+        and otherwise only the cells, and surfaces that link to an object that was renumbered in the clone.
+        """
+        problem = self._problem_ref()
+        source = self.source
+        if (
+            problem._print_in_data_block._print_data
+            != source._print_in_data_block._print_data
+            or problem._mode.particles != source._mode.particles
+        ):
+            # this copies every cell
+            list(problem._cells)
+        renumbered = {
+            id(original)
+            for original in self.originals.values()
+            if isinstance(original, montepy.numbered_mcnp_object.Numbered_MCNP_Object)
+            and original.number != self.memo[id(original)].number
+        }
+        if not renumbered:
+            return
+        for cell in list(problem._cells._objects.values()):
+            if self._is_own(problem, cell):
+                continue
+            linked = itertools.chain(
+                *_CellLinks._get_links(cell),
+                (id(obj) for obj in cell._get_linked_objects()),
+            )
+            if any(key in renumbered for key in linked):
+                self.copy(cell)
+        for surf in list(problem._surfaces._objects.values()):
+            if self._is_own(problem, surf):
+                continue
+            if (
+                id(surf._transform) in renumbered
+                or id(surf._periodic_surface) in renumbered
+            ):
+                self.copy(surf)
+
+
+def _map_values(values, function):
+    """
+    Applies a function to every value collected by a cell modifier, and keeps their structure.
+
+    :param values: a list of values, or a dict of lists of them, e.g., for importances.
+    :param function: the function to apply to each value.
+    :type function: callable
+    :returns: the new values in the same structure.
+    """
+    if isinstance(values, dict):
+        return {key: _map_values(value, function) for key, value in values.items()}
+    if isinstance(values, list):
+        return [_map_values(value, function) for value in values]
+    return function(values)
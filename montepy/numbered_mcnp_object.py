@@ -1,5 +1,6 @@
 # Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
 from abc import abstractmethod
+import collections
 import copy
 import itertools
 from montepy.errors import NumberConflictError
@@ -7,10 +8,18 @@ from montepy.mcnp_object import MCNP_Object
 import montepy
 from montepy.utilities import *
 
+_NUMBER_CHANGES = collections.Counter()
+"""
+How many times an object of each class has been renumbered.
+
+Collections use this to know when their number caches may be stale.
+"""
+
 
 def _number_validator(self, number):
     if number < 0:
         raise ValueError("number must be >= 0")
+    collection = None
     if self._problem:
         obj_map = montepy.MCNP_Problem._NUMBERED_OBJ_MAP
         try:
@@ -26,6 +35,9 @@ def _number_validator(self, number):
                 raise e
         collection = getattr(self._problem, collection_type.__name__.lower())
         collection.check_number(number)
+    for obj_class in type(self).__mro__:
+        _NUMBER_CHANGES[obj_class] += 1
+    if collection is not None:
         collection._update_number(self.number, number, self)
 
 
@@ -50,6 +62,25 @@ class Numbered_MCNP_Object(MCNP_Object):
         """
         pass
 
+    @classmethod
+    def _create_many(cls, numbers):
+        """
+        Creates a new default object for every number given.
+
+        .. versionadded:: 0.5.4
+
+        :param numbers: the numbers for the new objects.
+        :type numbers: list
+        :returns: the new objects.
+        :rtype: list
+        """
+        new_objs = []
+        for number in numbers:
+            obj = cls()
+            obj.number = number
+            new_objs.append(obj)
+        return new_objs
+
     def clone(self, starting_number=None, step=None):
         """
         Create a new independent instance of this object with a new number.
@@ -1,12 +1,22 @@
 # Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
 from abc import ABC, abstractmethod
+import bisect
+import collections
+import enum
+import gc
+import itertools
+import operator
 import typing
 import weakref
 
+import numpy as np
+
 import montepy
-from montepy.numbered_mcnp_object import Numbered_MCNP_Object
+from montepy.numbered_mcnp_object import Numbered_MCNP_Object, _NUMBER_CHANGES
+from montepy.utilities import _ValueChanges
 from montepy.errors import *
 from montepy.utilities import *
+from montepy.utilities import _deepcopy_state
 
 
 def _enforce_positive(self, num):
@@ -14,6 +24,166 @@ def _enforce_positive(self, num):
         raise ValueError(f"Value must be greater than 0. {num} given.")
 
 
+class _NumberIntervals:
+    """
+    A sorted index of used numbers, stored as runs of consecutive numbers.
+
+    This finds free numbers in logarithmic time, even in densely numbered collections.
+
+    .. versionadded:: 0.5.4
+
+    :param numbers: the numbers in use.
+    :type numbers: iterable of int
+    """
+
+    def __init__(self, numbers=()):
+        numbers = np.unique(np.fromiter(numbers, dtype=np.int64))
+        if len(numbers) > 0:
+            breaks = np.flatnonzero(np.diff(numbers) != 1)
+            self._starts = numbers[np.r_[0, breaks + 1]].tolist()
+            self._ends = numbers[np.r_[breaks, len(numbers) - 1]].tolist()
+        else:
+            self._starts = []
+            self._ends = []
+
+    def __contains__(self, number):
+        i = bisect.bisect_right(self._starts, number) - 1
+        return i >= 0 and number <= self._ends[i]
+
+    def max(self):
+        """
+        The largest number in use.
+
+        :rtype: int
+        :raises ValueError: if no numbers are in use.
+        """
+        if not self._ends:
+            raise ValueError("No numbers are in use.")
+        return self._ends[-1]
+
+    def add(self, number):
+        """
+        Marks the number as used.
+
+        :type number: int
+        """
+        starts, ends = self._starts, self._ends
+        i = bisect.bisect_right(starts, number)
+        if i > 0 and ends[i - 1] >= number:
+            return
+        joins_left = i > 0 and ends[i - 1] == number - 1
+        joins_right = i < len(starts) and starts[i] == number + 1
+        if joins_left and joins_right:
+            ends[i - 1] = ends[i]
+            del starts[i]
+            del ends[i]
+        elif joins_left:
+            ends[i - 1] = number
+        elif joins_right:
+            starts[i] = number
+        else:
+            starts.insert(i, number)
+            ends.insert(i, number)
+
+    def remove(self, number):
+        """
+        Marks the number as free.
+
+        :type number: int
+        """
+        starts, ends = self._starts, self._ends
+        i = bisect.bisect_right(starts, number) - 1
+        if i < 0 or ends[i] < number:
+            return
+        start, end = starts[i], ends[i]
+        if start == end:
+            del starts[i]
+            del ends[i]
+        elif number == start:
+            starts[i] = number + 1
+        elif number == end:
+            ends[i] = number - 1
+        else:
+            ends[i] = number - 1
+            starts.insert(i + 1, number + 1)
+            ends.insert(i + 1, end)
+
+    def find_free(self, start, step, count=1):
+        """
+        Finds the first block of free numbers: ``start + k * step``, ``start + (k + 1) * step``, ...
+
+        :param start: the first number to consider.
+        :type start: int
+        :param step: the step between numbers, which must be positive.
+        :type step: int
+        :param count: how many free numbers are needed in a row.
+        :type count: int
+        :returns: the first number of the block.
+        :rtype: int
+        """
+        starts, ends = self._starts, self._ends
+        number = start
+        while True:
+            last = number + (count - 1) * step
+            # the first run that ends at, or after the number
+            i = max(bisect.bisect_right(starts, number) - 1, 0)
+            if i < len(ends) and ends[i] < number:
+                i += 1
+            conflict = None
+            while i < len(starts) and starts[i] <= last:
+                # the first number of the block in this run
+                lowest = max(starts[i], number)
+                first = number + -(-(lowest - number) // step) * step
+                if first <= ends[i]:
+                    conflict = ends[i]
+                    break
+                i += 1
+            if conflict is None:
+                return number
+            number += ((conflict - number) // step + 1) * step
+
+
+_NO_POSITIONS = np.array([], dtype=np.intp)
+"""
+No positions found by a query.
+"""
+
+
+def _column_to_array(values, pointer):
+    """
+    Converts the values of a property for every object to a NumPy array.
+
+    :param values: the values for every object. ``None`` is used for missing values.
+    :type values: list
+    :param pointer: whether the values are numbered objects, which are stored by their numbers.
+    :type pointer: bool
+    :returns: the array. Numbered objects are stored by their numbers, with 0 for ``None``.
+        Missing numbers are stored as ``nan``,
+        and values that aren't numbers, or strings are stored in an object array.
+    :rtype: numpy.ndarray
+    """
+    if pointer:
+        return np.array(
+            [0 if value is None else value.number for value in values], dtype=np.int64
+        )
+    scalars = (bool, int, float, str, np.number, np.bool_)
+    if all(value is None or isinstance(value, scalars) for value in values):
+        if any(value is None for value in values):
+            try:
+                return np.array(
+                    [np.nan if value is None else value for value in values],
+                    dtype=np.float64,
+                )
+            except (TypeError, ValueError):
+                pass
+        else:
+            return np.array(values)
+    array = np.empty(len(values), dtype=object)
+    for i, value in enumerate(values):
+        array[i] = value
+    return array
+
+
 class NumberedObjectCollection(ABC):
     """A collections of MCNP objects.
 
@@ -44,11 +214,39 @@ class NumberedObjectCollection(ABC):
     :type problem: MCNP_Problem
     """
 
+    _copy_on_write = None
+    """
+    How the objects are copied, if this is a collection of a copy-on-write clone of a problem.
+    """
+
+    _membership_changes = 0
+    """
+    How many times objects have been added to, or removed from this collection.
+
+    Indexes built on the contents of this collection use this to know when they may be stale.
+    """
+
+    _link_owner = None
+    """
+    A weak reference to the cell whose surfaces, or complements these are,
+    once the links of the cell are indexed by :class:`~montepy.cells._CellLinks`.
+    """
+
     def __init__(self, obj_class, objects=None, problem=None):
+        self.__shared = False
         self.__num_cache = {}
+        self.__sorted_numbers = None
+        self.__free_index = None
+        self.__index_version = None
+        self.__reserved = set()
+        self.__arrays = {}
+        self.__query_indexes = {}
+        self.__arrays_version = None
         assert issubclass(obj_class, Numbered_MCNP_Object)
         self._obj_class = obj_class
-        self._objects = []
+        self.__cache_version = _NUMBER_CHANGES[obj_class]
+        # the objects in insertion order keyed by their id for identity lookups.
+        self._objects = {}
         self._start_num = 1
         self._step = 1
         self._problem_ref = None
@@ -70,7 +268,7 @@ class NumberedObjectCollection(ABC):
                         )
                     )
                 self.__num_cache[obj.number] = obj
-            self._objects = objects
+            self._objects = {id(obj): obj for obj in objects}
 
     def link_to_problem(self, problem):
         """Links the card to the parent problem for this card.
@@ -100,12 +298,248 @@ class NumberedObjectCollection(ABC):
         weakref_key = "_problem_ref"
         if weakref_key in state:
             del state[weakref_key]
+        # ids are not kept by copying
+        state["_objects"] = list(self._objects.values())
+        state["_NumberedObjectCollection__sorted_numbers"] = None
+        state["_NumberedObjectCollection__free_index"] = None
+        state["_NumberedObjectCollection__arrays"] = {}
+        state["_NumberedObjectCollection__query_indexes"] = {}
+        state["_NumberedObjectCollection__arrays_version"] = None
+        state["_NumberedObjectCollection__shared"] = False
+        state.pop("_copy_on_write", None)
+        state.pop("_link_owner", None)
         return state
 
     def __setstate__(self, crunchy_data):
         crunchy_data["_problem_ref"] = None
+        crunchy_data["_objects"] = {id(obj): obj for obj in crunchy_data["_objects"]}
+        # the number changes are only counted for this session
+        crunchy_data["_NumberedObjectCollection__cache_version"] = None
+        crunchy_data.setdefault("_NumberedObjectCollection__sorted_numbers", None)
+        crunchy_data.setdefault("_NumberedObjectCollection__free_index", None)
+        crunchy_data.setdefault("_NumberedObjectCollection__index_version", None)
+        crunchy_data.setdefault("_NumberedObjectCollection__reserved", set())
+        crunchy_data.setdefault("_NumberedObjectCollection__arrays", {})
+        crunchy_data.setdefault("_NumberedObjectCollection__query_indexes", {})
+        crunchy_data.setdefault("_NumberedObjectCollection__arrays_version", None)
+        crunchy_data.setdefault("_NumberedObjectCollection__shared", False)
         self.__dict__.update(crunchy_data)
 
+    def __deepcopy__(self, memo):
+        cls = type(self)
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        result.__setstate__(_deepcopy_state(self.__getstate__(), memo))
+        return result
+
+    def _share(self, problem, copy_on_write):
+        """
+        Makes a collection for a copy-on-write clone of the problem, which shares the objects of this one.
+
+        Neither collection changes the shared objects, or indexes in place,
+        and each makes its own copy of them the first time it is changed.
+
+        .. versionadded:: 0.5.4
+
+        :param problem: the clone of the problem.
+        :type problem: MCNP_Problem
+        :param copy_on_write: how the clone copies the objects it shares.
+        :type copy_on_write: _CopyOnWrite
+        :returns: the collection for the clone.
+        :rtype: NumberedObjectCollection
+        """
+        cls = type(self)
+        result = cls.__new__(cls)
+        result.__dict__.update(self.__dict__)
+        result._problem_ref = weakref.ref(problem)
+        result._copy_on_write = copy_on_write
+        self.__shared = result.__shared = True
+        return result
+
+    def __own(self):
+        """
+        Makes this collection's own copy of the objects, and indexes if they are shared
+        with a copy-on-write clone, so they can be changed in place.
+        """
+        if self.__shared:
+            self._objects = dict(self._objects)
+            self.__num_cache = dict(self.__num_cache)
+            self.__reserved = set(self.__reserved)
+            self.__index_version = None
+            self.__arrays = {}
+            self.__query_indexes = {}
+            self.__arrays_version = None
+            self.__shared = False
+
+    def _replace(self, original, copied):
+        """
+        Replaces an object with the copy of it made for a copy-on-write clone.
+
+        The copy keeps the place of the object, and is found by the same number.
+        Nothing is done if the object isn't in this collection.
+
+        .. versionadded:: 0.5.4
+
+        :param original: the object that was copied.
+        :type original: Numbered_MCNP_Object
+        :param copied: the copy of it.
+        :type copied: Numbered_MCNP_Object
+        """
+        key = id(original)
+        if self._objects.get(key) is not original:
+            return
+        self.__own()
+        num_cache = self.__get_num_cache()
+        self._objects[key] = copied
+        if num_cache.get(original.number) is original:
+            num_cache[original.number] = copied
+        self.__query_indexes.pop("objects", None)
+
+    def __key(self, obj):
+        """
+        Gets the key of an object in :attr:`_objects`.
+
+        Copies made for a copy-on-write clone are kept under the key of the object they were copied from.
+
+        :type obj: Numbered_MCNP_Object
+        :rtype: int
+        """
+        key = id(obj)
+        if self._copy_on_write is not None and self._objects.get(key) is not obj:
+            original = self._copy_on_write.originals.get(key)
+            if original is not None:
+                return id(original)
+        return key
+
+    def _hand_out(self, obj):
+        """
+        Gets an object to give to the user.
+
+        For a copy-on-write clone of a problem this is its own copy of the object,
+        which is made the first time it is needed.
+        Otherwise, this is the object itself.
+
+        .. versionadded:: 0.5.4
+
+        :type obj: Numbered_MCNP_Object
+        :rtype: Numbered_MCNP_Object
+        """
+        copy_on_write = self._copy_on_write
+        if copy_on_write is None or copy_on_write.reading:
+            return obj
+        return copy_on_write.copy(obj)
+
+    def __get_num_cache(self):
+        """
+        Gets the map of numbers to objects, and rebuilds it if it may be stale.
+
+        The cache is stale if an object of this type was renumbered without this collection
+        being notified through :func:`_update_number`.
+
+        :returns: the first object for every number.
+        :rtype: dict
+        """
+        version = _NUMBER_CHANGES[self._obj_class]
+        if self.__cache_version != version:
+            num_cache = {}
+            for obj in self._objects.values():
+                num_cache.setdefault(obj.number, obj)
+            self.__num_cache = num_cache
+            self.__cache_version = version
+            self.__index_version = None
+        return self.__num_cache
+
+    def __get_indexes(self):
+        """
+        Gets the sorted used numbers, and the index of used and reserved numbers.
+
+        These are rebuilt if they may be stale.
+
+        :returns: the sorted list of used numbers, and the index of used and reserved numbers.
+        :rtype: tuple
+        """
+        num_cache = self.__get_num_cache()
+        if self.__index_version != self.__cache_version:
+            self.__sorted_numbers = sorted(num_cache)
+            self.__free_index = _NumberIntervals(
+                itertools.chain(num_cache, self.__reserved)
+            )
+            self.__index_version = self.__cache_version
+        return self.__sorted_numbers, self.__free_index
+
+    def __current_indexes(self):
+        """
+        Gets the number indexes only if they are up to date, so they can be updated in place.
+
+        :returns: the sorted list of used numbers, and the index of used and reserved numbers.
+        :rtype: tuple
+        """
+        if (
+            self.__index_version is not None
+            and self.__index_version == self.__cache_version
+        ):
+            return self.__sorted_numbers, self.__free_index
+        return None
+
+    @staticmethod
+    def __index_number(indexes, number):
+        """
+        Adds a used number to the number indexes.
+
+        :type indexes: tuple
+        :type number: int
+        """
+        sorted_numbers, free_index = indexes
+        bisect.insort(sorted_numbers, number)
+        free_index.add(number)
+
+    def __unindex_number(self, indexes, number):
+        """
+        Removes a used number from the number indexes.
+
+        :type indexes: tuple
+        :type number: int
+        """
+        sorted_numbers, free_index = indexes
+        del sorted_numbers[bisect.bisect_left(sorted_numbers, number)]
+        if number not in self.__reserved:
+            free_index.remove(number)
+
+    def __remove_from_index(self, obj):
+        """
+        Removes the object from the internal objects, and number cache.
+
+        :param obj: the object to remove, which must be in this collection.
+        :type obj: Numbered_MCNP_Object
+        """
+        self.__own()
+        num_cache = self.__get_num_cache()
+        indexes = self.__current_indexes()
+        removed = self._objects.pop(self.__key(obj))
+        self._members_changed(removed=(removed,))
+        if num_cache.get(obj.number) is obj:
+            del num_cache[obj.number]
+            if indexes is not None:
+                self.__unindex_number(indexes, obj.number)
+        # there were duplicate numbers so another object may have this number.
+        if len(num_cache) != len(self._objects):
+            self.__cache_version = None
+
+    def _members_changed(self, added=(), removed=()):
+        """
+        Records that objects were added to, or removed from this collection.
+
+        .. versionadded:: 0.5.4
+
+        :param added: the objects that were added.
+        :type added: iterable
+        :param removed: the objects that were removed.
+        :type removed: iterable
+        """
+        self._membership_changes += 1
+        if self._link_owner is not None:
+            montepy.cells._CellLinks.collection_changed(self)
+
     @property
     def numbers(self):
         """
@@ -113,9 +547,7 @@ class NumberedObjectCollection(ABC):
 
         :rtype: generator
         """
-        for obj in self._objects:
-            # update cache every time we go through all objects
-            self.__num_cache[obj.number] = obj
+        for obj in self._objects.values():
             yield obj.number
 
     def check_number(self, number):
@@ -127,15 +559,7 @@ class NumberedObjectCollection(ABC):
         """
         if not isinstance(number, int):
             raise TypeError("The number must be an int")
-        conflict = False
-        # only can trust cache if being
-        if self._problem:
-            if number in self.__num_cache:
-                conflict = True
-        else:
-            if number in self.numbers:
-                conflict = True
-        if conflict:
+        if number in self.__get_num_cache():
             raise NumberConflictError(
                 f"Number {number} is already in use for the collection: {type(self)} by {self[number]}"
             )
@@ -151,11 +575,29 @@ class NumberedObjectCollection(ABC):
         :param obj: the object being updated.
         :type obj: self._obj_class
         """
+        self.__own()
+        version = _NUMBER_CHANGES[self._obj_class]
+        # the cache was already stale before this change
+        if self.__cache_version != version - 1:
+            return
+        indexes = self.__current_indexes()
+        self.__cache_version = version
         # don't update numbers you don't own
         if self.__num_cache.get(old_num, None) is not obj:
+            if self.__key(obj) in self._objects:
+                self.__cache_version = None
+            elif indexes is not None:
+                self.__index_version = version
             return
         self.__num_cache.pop(old_num, None)
         self.__num_cache[new_num] = obj
+        self.__reserved.discard(new_num)
+        if len(self.__num_cache) != len(self._objects):
+            self.__cache_version = None
+        elif indexes is not None:
+            self.__unindex_number(indexes, old_num)
+            self.__index_number(indexes, new_num)
+            self.__index_version = version
 
     @property
     def objects(self):
@@ -167,7 +609,7 @@ class NumberedObjectCollection(ABC):
 
         :rtype: list
         """
-        return self._objects[:]
+        return [self._hand_out(obj) for obj in self._objects.values()]
 
     def pop(self, pos=-1):
         """
@@ -180,16 +622,25 @@ class NumberedObjectCollection(ABC):
         """
         if not isinstance(pos, int):
             raise TypeError("The index for popping must be an int")
-        obj = self._objects.pop(pos)
-        self.__num_cache.pop(obj.number, None)
+        if pos == -1 and self._objects:
+            obj = next(reversed(self._objects.values()))
+        else:
+            obj = list(self._objects.values())[pos]
+        obj = self._hand_out(obj)
+        self.__remove_from_index(obj)
         return obj
 
     def clear(self):
         """
         Removes all objects from this collection.
         """
+        self.__own()
+        removed = list(self._objects.values())
         self._objects.clear()
+        self._members_changed(removed=removed)
         self.__num_cache.clear()
+        self.__index_version = None
+        self.__cache_version = _NUMBER_CHANGES[self._obj_class]
 
     def extend(self, other_list):
         """
@@ -201,38 +652,467 @@ class NumberedObjectCollection(ABC):
         """
         if not isinstance(other_list, (list, type(self))):
             raise TypeError("The extending list must be a list")
-        if self._problem:
-            nums = set(self.__num_cache)
-        else:
-            nums = set(self.numbers)
+        nums = set(self.__get_num_cache())
         for obj in other_list:
             if not isinstance(obj, self._obj_class):
                 raise TypeError(
                     "The object in the list {obj} is not of type: {self._obj_class}"
                 )
             if obj.number in nums:
+                conflict = self.get(obj.number, "another object being added")
                 raise NumberConflictError(
                     (
                         f"When adding to {type(self)} there was a number collision due to "
-                        f"adding {obj} which conflicts with {self[obj.number]}"
+                        f"adding {obj} which conflicts with {conflict}"
                     )
                 )
             nums.add(obj.number)
-        self._objects.extend(other_list)
+        self.__own()
+        self._objects.update({id(obj): obj for obj in other_list})
+        self._members_changed(added=other_list)
         self.__num_cache.update({obj.number: obj for obj in other_list})
+        self.__reserved.difference_update(nums)
+        self.__index_version = None
         if self._problem:
             for obj in other_list:
                 obj.link_to_problem(self._problem)
 
+    def create_many(self, numbers):
+        """
+        Creates many new default objects at once, and adds them to this collection.
+
+        This is much faster than making, and appending every object one at a time,
+        as the numbers are all checked at once,
+        and the new objects are added in bulk.
+        The new objects can then be filled in, e.g.:
+
+        .. code-block:: python
+
+            new_cells = problem.cells.create_many(range(1000, 501000))
+            for cell, surf in zip(new_cells, surfaces):
+                cell.geometry = -surf
+
+        .. versionadded:: 0.5.4
+
+        :param numbers: the numbers for the new objects.
+        :type numbers: iterable of int
+        :returns: the new objects in the same order as the numbers.
+        :rtype: list
+        :raises NumberConflictError: if a number is repeated, or is already in use.
+        """
+        numbers = list(numbers)
+        for number in numbers:
+            if not isinstance(number, int):
+                raise TypeError(f"The number must be an int. {number} given.")
+            if number < 0:
+                raise ValueError(f"The number must be >= 0. {number} given.")
+        # making objects doesn't make garbage, so don't let the garbage collector rescan the growing heap
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            new_objs = self._obj_class._create_many(numbers)
+            self.extend(new_objs)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        return new_objs
+
     def remove(self, delete):
         """
         Removes the given object from the collection.
 
+        .. versionchanged:: 0.5.4
+            Objects are now found by identity, and not equality.
+
         :param delete: the object to delete
         :type delete: Numbered_MCNP_Object
+        :raises ValueError: if the object is not in this collection.
+        """
+        if delete not in self:
+            raise ValueError(f"{delete} is not in the collection: {type(self)}")
+        self.__remove_from_index(delete)
+
+    _ARRAY_POINTERS = {}
+    """
+    The properties that point to other numbered objects,
+    and the name of the problem's collection for those objects.
+
+    These are stored by number in :func:`to_arrays`,
+    and are looked up by number in :func:`set_arrays`.
+    """
+
+    def to_arrays(self, properties):
+        """
+        Gets the values of properties for every object as NumPy arrays.
+
+        This is meant for analyzing whole models at once, e.g.:
+
+        .. code-block:: python
+
+            arrays = problem.cells.to_arrays(["number", "material", "importance.neutron"])
+            void_cells = arrays["number"][arrays["material"] == 0]
+
+        The arrays are in the same order as the objects in this collection.
+        Properties of properties can be given with a ``.``.
+        Numbered objects, like materials, are stored by their numbers, with 0 for ``None``.
+        Objects that don't have a value for a property,
+        e.g., ``atom_density`` for a cell in mass density, are given ``nan``.
+
+        The arrays are cached, and are read-only.
+        They are rebuilt after objects are added to, or removed from this collection,
+        or after any value is set.
+
+        .. versionadded:: 0.5.4
+
+        :param properties: the names of the properties to get.
+        :type properties: list
+        :returns: a dictionary of the array for each property.
+        :rtype: dict
+        :raises AttributeError: if no objects have a property.
+        """
+        if isinstance(properties, str) or not all(
+            isinstance(prop, str) for prop in properties
+        ):
+            raise TypeError(f"properties must be a list of str. {properties} given.")
+        self.__check_arrays_version()
+        ret = {prop: self.__get_array(prop) for prop in properties}
+        self.__arrays_version = (
+            self._membership_changes,
+            _ValueChanges.count,
+        )
+        return ret
+
+    def __check_arrays_version(self):
+        """
+        Clears the cached arrays, and query indexes if anything may have changed since they were made.
+        """
+        if self.__arrays_version != (
+            self._membership_changes,
+            _ValueChanges.count,
+        ):
+            self.__arrays = {}
+            self.__query_indexes = {}
+
+    def __get_array(self, prop):
         """
-        self.__num_cache.pop(delete.number, None)
-        self._objects.remove(delete)
+        Gets the cached array for a property, and builds it if needed.
+
+        :param prop: the name of the property.
+        :type prop: str
+        :rtype: numpy.ndarray
+        """
+        if prop not in self.__arrays:
+            self.__arrays[prop] = self.__build_array(prop)
+        return self.__arrays[prop]
+
+    def __build_array(self, prop):
+        """
+        Gets the values of a property for every object as a read-only NumPy array.
+
+        :param prop: the name of the property.
+        :type prop: str
+        :rtype: numpy.ndarray
+        """
+        getter = operator.attrgetter(prop)
+        values = []
+        error = None
+        for obj in self._objects.values():
+            try:
+                values.append(getter(obj))
+            except AttributeError as e:
+                error = e
+                values.append(None)
+        if error is not None and all(value is None for value in values):
+            raise error
+        pointer = prop in self._ARRAY_POINTERS or any(
+            isinstance(value, Numbered_MCNP_Object) for value in values
+        )
+        array = _column_to_array(values, pointer)
+        array.flags.writeable = False
+        return array
+
+    _QUERY_OPERATORS = frozenset({"eq", "ne", "in", "lt", "le", "gt", "ge"})
+    """
+    The operators that can be used by :func:`where`.
+    """
+
+    def where(self, **conditions):
+        """
+        Finds the objects that match all of the given conditions.
+
+        The conditions are given as ``property=value``,
+        or ``property__operator=value``, e.g.:
+
+        .. code-block:: python
+
+            problem.cells.where(universe=5, material__in=[1, 2, 3], atom_density__lt=1.0)
+            problem.surfaces.where(surface_type="PZ", location__ge=0.0, location__le=100.0)
+
+        The operators are:
+
+        * ``eq``: equal to, which is the default.
+        * ``ne``: not equal to.
+        * ``in``: equal to any of the given values.
+        * ``lt``, ``le``, ``gt``, ``ge``: less than, less than or equal to,
+          greater than, and greater than or equal to.
+
+        Properties of properties are separated with ``__``, e.g., ``importance__neutron__gt=0``.
+        The values are compared to the arrays from :func:`to_arrays`,
+        so numbered objects, like materials, can be given as objects, or by number.
+        ``None`` matches objects without a value for the property,
+        or pointers to nothing.
+
+        Indexes of the values are built the first time a property is searched,
+        and are kept until the collection, or any value is changed.
+        This makes repeated searches only take as long as the number of objects found.
+
+        .. versionadded:: 0.5.4
+
+        :param conditions: the conditions that the objects must meet.
+        :returns: a new collection of the matching objects, in the order of this collection.
+        :rtype: NumberedObjectCollection
+        :raises AttributeError: if no objects have a property.
+        """
+        return type(self)(self._query(**conditions))
+
+    def _query(self, **conditions):
+        """
+        Finds the objects that match all of the given conditions.
+
+        See :func:`where`.
+
+        .. versionadded:: 0.5.4
+
+        :returns: the matching objects, in the order of this collection.
+        :rtype: list
+        """
+        self.__check_arrays_version()
+        positions = None
+        for key, value in conditions.items():
+            prop, _, operation = key.rpartition("__")
+            if operation not in self._QUERY_OPERATORS:
+                prop, operation = key, "eq"
+            prop = prop.replace("__", ".")
+            matches = self.__match(prop, operation, value)
+            if positions is None:
+                positions = matches
+            else:
+                positions = np.intersect1d(positions, matches, assume_unique=True)
+        self.__arrays_version = (
+            self._membership_changes,
+            _ValueChanges.count,
+        )
+        if positions is None:
+            return [self._hand_out(obj) for obj in self._objects.values()]
+        if "objects" not in self.__query_indexes:
+            self.__query_indexes["objects"] = list(self._objects.values())
+        objects = self.__query_indexes["objects"]
+        return [self._hand_out(objects[i]) for i in positions.tolist()]
+
+    def __match(self, prop, operation, value):
+        """
+        Finds the positions of the objects that match one condition.
+
+        :param prop: the name of the property.
+        :type prop: str
+        :param operation: the operator to compare with.
+        :type operation: str
+        :param value: the value to compare to.
+        :returns: the sorted positions of the matching objects.
+        :rtype: numpy.ndarray
+        """
+        if operation in {"eq", "ne", "in"}:
+            values = value if operation == "in" else [value]
+            if operation == "in" and (
+                isinstance(value, (str, bytes)) or not hasattr(value, "__iter__")
+            ):
+                raise TypeError(f"{prop}__in must be given an iterable. {value} given.")
+            pointer = prop in self._ARRAY_POINTERS
+            index = self.__get_hash_index(prop)
+            found = [
+                index.get(self.__query_key(value, pointer), _NO_POSITIONS)
+                for value in values
+            ]
+            matches = np.unique(np.concatenate(found)) if found else _NO_POSITIONS
+            if operation == "ne":
+                matches = np.setdiff1d(
+                    np.arange(len(self._objects)), matches, assume_unique=True
+                )
+            return matches
+        array = self.__get_array(prop)
+        order, sorted_values = self.__get_sorted_index(prop)
+        if value is None:
+            raise TypeError(f"{prop}__{operation} can't be compared to None.")
+        if isinstance(value, Numbered_MCNP_Object):
+            value = value.number
+        side = {"lt": "left", "le": "right", "gt": "right", "ge": "left"}[operation]
+        try:
+            cut = np.searchsorted(sorted_values, value, side=side)
+        except TypeError as e:
+            raise TypeError(f"{prop} can't be compared to {value}.") from e
+        if operation in {"lt", "le"}:
+            matches = order[:cut]
+        else:
+            # nan are sorted last, and never match
+            end = len(sorted_values)
+            if sorted_values.dtype.kind == "f":
+                end = np.searchsorted(sorted_values, np.inf, side="right")
+            matches = order[cut:end]
+        return np.sort(matches)
+
+    @staticmethod
+    def __query_key(value, pointer):
+        """
+        Converts a value being searched for to a key of the hash index.
+
+        :param value: the value being searched for.
+        :param pointer: whether the property points to numbered objects.
+        :type pointer: bool
+        :rtype: object
+        """
+        if isinstance(value, Numbered_MCNP_Object):
+            return value.number
+        if value is None:
+            return 0 if pointer else None
+        if isinstance(value, enum.Enum):
+            return value.value
+        return value
+
+    def __get_hash_index(self, prop):
+        """
+        Gets the index of the positions of the objects with each value of a property.
+
+        Missing values, or ``nan`` are stored under ``None``.
+
+        :param prop: the name of the property.
+        :type prop: str
+        :returns: the sorted positions for each value.
+        :rtype: dict
+        """
+        key = ("hash", prop)
+        if key not in self.__query_indexes:
+            array = self.__get_array(prop)
+            if array.dtype == object:
+                groups = collections.defaultdict(list)
+                for i, value in enumerate(array.tolist()):
+                    try:
+                        groups[self.__query_key(value, False)].append(i)
+                    except TypeError:
+                        # unhashable values can't be searched for
+                        pass
+                index = {
+                    value: np.array(positions, dtype=np.intp)
+                    for value, positions in groups.items()
+                }
+            else:
+                values, inverse = np.unique(array, return_inverse=True)
+                order = np.argsort(inverse, kind="stable")
+                splits = np.cumsum(np.bincount(inverse, minlength=len(values)))[:-1]
+                index = {}
+                for value, positions in zip(values.tolist(), np.split(order, splits)):
+                    # nan
+                    if value != value:
+                        value = None
+                    if value in index:
+                        positions = np.union1d(index[value], positions)
+                    index[value] = positions
+            self.__query_indexes[key] = index
+        return self.__query_indexes[key]
+
+    def __get_sorted_index(self, prop):
+        """
+        Gets the positions of the objects sorted by the values of a property.
+
+        :param prop: the name of the property.
+        :type prop: str
+        :returns: the positions in sorted order, and the sorted values.
+        :rtype: tuple
+        """
+        key = ("sorted", prop)
+        if key not in self.__query_indexes:
+            array = self.__get_array(prop)
+            if array.dtype == object:
+                raise TypeError(f"{prop} can't be compared, because it isn't a number.")
+            order = np.argsort(array, kind="stable")
+            self.__query_indexes[key] = (order, array[order])
+        return self.__query_indexes[key]
+
+    def set_arrays(self, arrays):
+        """
+        Sets the values of properties for every object from arrays.
+
+        This is the inverse of :func:`to_arrays`, e.g.:
+
+        .. code-block:: python
+
+            arrays = problem.cells.to_arrays(["atom_density"])
+            problem.cells.set_arrays({"atom_density": arrays["atom_density"] * 1.1})
+
+        The arrays must be in the same order as the objects in this collection.
+        Properties that point to other numbered objects, like ``material``,
+        are given by number, and are looked up in the problem,
+        with 0 for ``None``.
+        The lengths of the arrays, and the numbers are all checked before any values are set.
+        Every value is still checked like it would be if it were set on its own.
+
+        .. versionadded:: 0.5.4
+
+        :param arrays: a dictionary of the array of values for each property.
+        :type arrays: dict
+        :raises ValueError: if an array isn't the length of this collection,
+            or if a pointer is set when this collection isn't linked to a problem.
+        :raises KeyError: if a number for a pointer isn't in the problem.
+        """
+        if not isinstance(arrays, dict):
+            raise TypeError(f"arrays must be a dict. {arrays} given.")
+        columns = {}
+        for prop, array in arrays.items():
+            if not isinstance(prop, str):
+                raise TypeError(f"Property names must be str. {prop} given.")
+            values = np.asarray(array)
+            if values.shape != (len(self),):
+                raise ValueError(
+                    f"The array for {prop} must be 1-D with {len(self)} values. Shape {values.shape} given."
+                )
+            # convert to python types in one pass
+            values = values.tolist()
+            if prop in self._ARRAY_POINTERS:
+                values = self.__look_up_pointers(prop, values)
+            columns[prop] = values
+        objects = [self._hand_out(obj) for obj in self._objects.values()]
+        for prop, values in columns.items():
+            parent, _, attr = prop.rpartition(".")
+            get_parent = operator.attrgetter(parent) if parent else None
+            for obj, value in zip(objects, values):
+                if get_parent is not None:
+                    obj = get_parent(obj)
+                setattr(obj, attr, value)
+
+    def __look_up_pointers(self, prop, numbers):
+        """
+        Finds the objects that a pointer property is being set to.
+
+        :param prop: the name of the property.
+        :type prop: str
+        :param numbers: the number of the object for every object. 0 means ``None``.
+        :type numbers: list
+        :returns: the objects.
+        :rtype: list
+        """
+        if self._problem is None:
+            raise ValueError(
+                f"{prop} can only be set by number when {type(self).__name__} is linked to a problem."
+            )
+        collection = getattr(self._problem, self._ARRAY_POINTERS[prop])
+        objects = {}
+        for number in set(numbers):
+            if not isinstance(number, int) or isinstance(number, bool):
+                raise TypeError(f"The numbers for {prop} must be ints. {number} given.")
+            obj = collection.get(number)
+            if obj is None and number != 0:
+                raise KeyError(f"{prop} number {number} not found in {collection}.")
+            objects[number] = obj
+        return [objects[number] for number in numbers]
 
     def clone(self, starting_number=None, step=None):
         """
@@ -277,6 +1157,103 @@ class NumberedObjectCollection(ABC):
             starting_number = new_obj.number + step
         return type(self)(objs)
 
+    def _find_new_numbers(self, scheme):
+        """
+        Works out, and checks the new numbers for every object for :func:`~montepy.mcnp_problem.MCNP_Problem.renumber`.
+
+        .. versionadded:: 0.5.4
+
+        :param scheme: How to renumber the objects. Either: an int to offset all numbers by;
+            ``"compact"`` to number the objects from :func:`starting_number` by :func:`step`
+            in the order of their current numbers;
+            or a dict mapping old numbers to new numbers.
+        :type scheme: int, str, dict
+        :returns: the new number for every object in this collection in order.
+        :rtype: numpy.ndarray
+        :raises TypeError: if the scheme, or a new number is the wrong type.
+        :raises ValueError: if the scheme is unknown, or a new number is negative.
+        :raises KeyError: if a number in the mapping isn't in this collection.
+        :raises NumberConflictError: if two objects would have the same number.
+        """
+        old_numbers = np.fromiter(
+            (obj.number for obj in self._objects.values()),
+            dtype=np.int64,
+            count=len(self._objects),
+        )
+        if isinstance(scheme, bool):
+            raise TypeError(f"The renumbering scheme can't be a bool. {scheme} given.")
+        if isinstance(scheme, int):
+            new_numbers = old_numbers + scheme
+        elif isinstance(scheme, str):
+            if scheme.lower() != "compact":
+                raise ValueError(
+                    f"The renumbering scheme must be 'compact'. {scheme} given."
+                )
+            new_numbers = np.empty_like(old_numbers)
+            new_numbers[np.argsort(old_numbers, kind="stable")] = (
+                self.starting_number
+                + self.step * np.arange(len(old_numbers), dtype=np.int64)
+            )
+        elif isinstance(scheme, dict):
+            for old, new in scheme.items():
+                if not isinstance(old, int) or not isinstance(new, int):
+                    raise TypeError(
+                        f"The numbers in the renumbering map must be ints. {old}: {new} given."
+                    )
+            missing = set(scheme) - set(old_numbers.tolist())
+            if missing:
+                raise KeyError(
+                    f"The numbers: {sorted(missing)} are not in the collection: {type(self).__name__}"
+                )
+            new_numbers = np.fromiter(
+                (scheme.get(number, number) for number in old_numbers.tolist()),
+                dtype=np.int64,
+                count=len(old_numbers),
+            )
+        else:
+            raise TypeError(
+                f"The renumbering scheme must be an int, 'compact', or a dict. {scheme} given."
+            )
+        if len(new_numbers) == 0:
+            return new_numbers
+        if new_numbers.min() < 0:
+            bad = old_numbers[new_numbers < 0][0]
+            raise ValueError(
+                f"The new number for {self[int(bad)]} must be >= 0. "
+                f"{new_numbers[new_numbers < 0][0]} given."
+            )
+        unique, counts = np.unique(new_numbers, return_counts=True)
+        if len(unique) != len(new_numbers):
+            number = unique[counts > 1][0]
+            conflicts = [self[int(old)] for old in old_numbers[new_numbers == number]]
+            raise NumberConflictError(
+                f"When renumbering {type(self).__name__} there was a number collision for {number} "
+                f"between: {conflicts[0]} and {conflicts[1]}"
+            )
+        return new_numbers
+
+    def _set_numbers(self, new_numbers):
+        """
+        Sets the numbers of all objects at once, without checking each one.
+
+        The numbers must have been checked by :func:`_find_new_numbers`.
+
+        .. versionadded:: 0.5.4
+
+        :param new_numbers: the new number for every object in this collection in order.
+        :type new_numbers: numpy.ndarray
+        """
+        obj_classes = set()
+        objects = [self._hand_out(obj) for obj in self._objects.values()]
+        for obj, number in zip(objects, new_numbers.tolist()):
+            obj._number.value = number
+            obj_classes.add(type(obj))
+        # every collection of these objects now needs to rebuild its number cache
+        for obj_class in {
+            klass for obj_class in obj_classes for klass in obj_class.__mro__
+        }:
+            _NUMBER_CHANGES[obj_class] += 1
+
     @make_prop_pointer("_start_num", int, validator=_enforce_positive)
     def starting_number(self):
         """
@@ -298,7 +1275,10 @@ class NumberedObjectCollection(ABC):
         pass
 
     def __iter__(self):
-        self._iter = self._objects.__iter__()
+        if self._copy_on_write is None:
+            self._iter = iter(self._objects.values())
+        else:
+            self._iter = map(self._hand_out, self._objects.values())
         return self._iter
 
     def __str__(self):
@@ -309,7 +1289,7 @@ class NumberedObjectCollection(ABC):
     def __repr__(self):
         return (
             f"Numbered_object_collection: obj_class: {self._obj_class}, problem: {self._problem}\n"
-            f"Objects: {self._objects}\n"
+            f"Objects: {list(self._objects.values())}\n"
             f"Number cache: {self.__num_cache}"
         )
 
@@ -323,8 +1303,14 @@ class NumberedObjectCollection(ABC):
         if not isinstance(obj, self._obj_class):
             raise TypeError(f"object being appended must be of type: {self._obj_class}")
         self.check_number(obj.number)
+        self.__own()
+        indexes = self.__current_indexes()
         self.__num_cache[obj.number] = obj
-        self._objects.append(obj)
+        self.__reserved.discard(obj.number)
+        if indexes is not None:
+            self.__index_number(indexes, obj.number)
+        self._objects[id(obj)] = obj
+        self._members_changed(added=(obj,))
         if self._problem:
             obj.link_to_problem(self._problem)
 
@@ -349,12 +1335,10 @@ class NumberedObjectCollection(ABC):
         number = obj.number
         if self._problem:
             obj.link_to_problem(self._problem)
-        try:
-            self.append(obj)
-        except NumberConflictError:
+        if number in self.__get_num_cache():
             number = self.request_number(number, step)
             obj.number = number
-            self.append(obj)
+        self.append(obj)
 
         return number
 
@@ -372,12 +1356,19 @@ class NumberedObjectCollection(ABC):
         .. versionchanged:: 0.5.0
             In 0.5.0 the default values were changed to reference :func:`starting_number` and :func:`step`.
 
+        .. versionchanged:: 0.5.4
+            Free numbers are now found from an index of the used numbers,
+            instead of checking every number in turn.
+            Numbers held by :func:`reserve_numbers` are skipped,
+            and a non-positive step now raises a ``ValueError``.
+
         :param start_num: the starting number to check.
         :type start_num: int
         :param step: the increment to jump by to find new numbers.
         :type step: int
         :returns: an available number
         :rtype: int
+        :raises ValueError: if step is not positive.
         """
         if not isinstance(start_num, (int, type(None))):
             raise TypeError("start_num must be an int")
@@ -387,14 +1378,74 @@ class NumberedObjectCollection(ABC):
             start_num = self.starting_number
         if step is None:
             step = self.step
-        number = start_num
-        while True:
-            try:
-                self.check_number(number)
-                break
-            except NumberConflictError:
-                number += step
-        return number
+        if step <= 0:
+            raise ValueError(f"step must be > 0. {step} given.")
+        _, free_index = self.__get_indexes()
+        return free_index.find_free(start_num, step)
+
+    def reserve_numbers(self, count, start_num=None, step=None):
+        """Reserves a block of available numbers.
+
+        The numbers are found like :func:`request_number`,
+        but all ``count`` numbers must be available in a row, i.e.,
+        ``start``, ``start + step``, ..., ``start + (count - 1) * step``.
+        Reserved numbers will not be given out by :func:`request_number`,
+        :func:`next_number`, :func:`append_renumber`, or another reservation.
+        An object may still be added with a reserved number,
+        which uses up that reservation.
+
+        .. versionadded:: 0.5.4
+
+        :param count: how many numbers to reserve.
+        :type count: int
+        :param start_num: the starting number to check.
+        :type start_num: int
+        :param step: the increment between numbers.
+        :type step: int
+        :returns: the numbers that were reserved.
+        :rtype: range
+        :raises ValueError: if count, or step are not positive.
+        """
+        if not isinstance(count, int) or isinstance(count, bool):
+            raise TypeError("count must be an int")
+        if count <= 0:
+            raise ValueError(f"count must be > 0. {count} given.")
+        if not isinstance(start_num, (int, type(None))):
+            raise TypeError("start_num must be an int")
+        if not isinstance(step, (int, type(None))):
+            raise TypeError("step must be an int")
+        if start_num is None:
+            start_num = self.starting_number
+        if step is None:
+            step = self.step
+        if step <= 0:
+            raise ValueError(f"step must be > 0. {step} given.")
+        self.__own()
+        _, free_index = self.__get_indexes()
+        start = free_index.find_free(start_num, step, count)
+        numbers = range(start, start + count * step, step)
+        for number in numbers:
+            free_index.add(number)
+        self.__reserved.update(numbers)
+        return numbers
+
+    def release_numbers(self, numbers):
+        """Releases numbers that were reserved by :func:`reserve_numbers`.
+
+        Numbers that are not reserved are ignored.
+
+        .. versionadded:: 0.5.4
+
+        :param numbers: the numbers to release.
+        :type numbers: iterable of int
+        """
+        self.__own()
+        indexes = self.__current_indexes()
+        for number in numbers:
+            if number in self.__reserved:
+                self.__reserved.remove(number)
+                if indexes is not None:
+                    indexes[1].remove(number)
 
     def next_number(self, step=1):
         """Get the next available number, based on the maximum number.
@@ -402,6 +1453,9 @@ class NumberedObjectCollection(ABC):
         This works by finding the current maximum number, and then adding the
         stepsize to it.
 
+        .. versionchanged:: 0.5.4
+            Numbers held by :func:`reserve_numbers` count towards the maximum number.
+
         :param step: how much to increase the last number by
         :type step: int
         """
@@ -409,7 +1463,8 @@ class NumberedObjectCollection(ABC):
             raise TypeError("step must be an int")
         if step <= 0:
             raise ValueError("step must be > 0")
-        return max(self.numbers) + step
+        _, free_index = self.__get_indexes()
+        return free_index.max() + step
 
     def __get_slice(self, i: slice):
         """Get a new NumberedObjectCollection over a slice of numbers
@@ -423,30 +1478,48 @@ class NumberedObjectCollection(ABC):
         Because MCNP numbered objects start at 1, so do the indices.
         They are effectively 1-based and endpoint-inclusive.
 
+        .. versionchanged:: 0.5.4
+            Only the numbers in use in the slice's bounds are checked,
+            by searching a sorted list of the numbers.
+
         :rtype: NumberedObjectCollection
         """
         rstep = i.step if i.step is not None else 1
         rstart = i.start
         rstop = i.stop
+        sorted_numbers, _ = self.__get_indexes()
+        num_cache = self.__num_cache
+        if not sorted_numbers:
+            return type(self)([])
         if rstep < 0:  # Backwards
             if rstart is None:
-                rstart = max(self.numbers)
+                rstart = sorted_numbers[-1]
             if rstop is None:
-                rstop = min(self.numbers)
+                rstop = sorted_numbers[0]
+            low, high = rstop, rstart
             rstop -= 1
         else:  # Forwards
             if rstart is None:
                 rstart = 0
             if rstop is None:
-                rstop = max(self.numbers)
+                rstop = sorted_numbers[-1]
+            low, high = rstart, rstop
             rstop += 1
-        numbered_objects = []
-        for num in range(rstart, rstop, rstep):
-            obj = self.get(num)
-            if obj is not None:
-                numbered_objects.append(obj)
+        numbers = range(rstart, rstop, rstep)
+        # only the used numbers in the slice's bounds need to be checked
+        used = sorted_numbers[
+            bisect.bisect_left(sorted_numbers, low) : bisect.bisect_right(
+                sorted_numbers, high
+            )
+        ]
+        if (high - low) // abs(rstep) < len(used):
+            numbered_objects = [num_cache[num] for num in numbers if num in num_cache]
+        else:
+            if rstep < 0:
+                used.reverse()
+            numbered_objects = [num_cache[num] for num in used if num in numbers]
         # obj_class is always implemented in child classes.
-        return type(self)(numbered_objects)
+        return type(self)([self._hand_out(obj) for obj in numbered_objects])
 
     def __getitem__(self, i):
         if isinstance(i, slice):
@@ -462,8 +1535,7 @@ class NumberedObjectCollection(ABC):
         if not isinstance(idx, int):
             raise TypeError("index must be an int")
         obj = self[idx]
-        self.__num_cache.pop(obj.number, None)
-        self._objects.remove(obj)
+        self.__remove_from_index(obj)
 
     def __setitem__(self, key, newvalue):
         if not isinstance(key, int):
@@ -478,7 +1550,13 @@ class NumberedObjectCollection(ABC):
         return self
 
     def __contains__(self, other):
-        return other in self._objects
+        """
+        Checks if this exact object is in this collection.
+
+        .. versionchanged:: 0.5.4
+            Objects are now found by identity, and not equality.
+        """
+        return self._objects.get(self.__key(other)) is other
 
     def get(self, i: int, default=None) -> (Numbered_MCNP_Object, None):
         """
@@ -491,17 +1569,10 @@ class NumberedObjectCollection(ABC):
 
         :rtype: Numbered_MCNP_Object
         """
-        try:
-            ret = self.__num_cache[i]
-            if ret.number == i:
-                return ret
-        except KeyError:
-            pass
-        for obj in self._objects:
-            if obj.number == i:
-                self.__num_cache[i] = obj
-                return obj
-        return default
+        ret = self.__get_num_cache().get(i)
+        if ret is None:
+            return default
+        return self._hand_out(ret)
 
     def keys(self) -> typing.Generator[int, None, None]:
         """
@@ -509,7 +1580,7 @@ class NumberedObjectCollection(ABC):
 
         :rtype: int
         """
-        for o in self._objects:
+        for o in self._objects.values():
             yield o.number
 
     def values(self) -> typing.Generator[Numbered_MCNP_Object, None, None]:
@@ -518,8 +1589,8 @@ class NumberedObjectCollection(ABC):
 
         :rtype: Numbered_MCNP_Object
         """
-        for o in self._objects:
-            yield o
+        for o in self._objects.values():
+            yield self._hand_out(o)
 
     def items(
         self,
@@ -529,7 +1600,8 @@ class NumberedObjectCollection(ABC):
 
         :rtype: tuple(int, MCNP_Object)
         """
-        for o in self._objects:
+        for o in self._objects.values():
+            o = self._hand_out(o)
             yield o.number, o
 
 
@@ -537,12 +1609,28 @@ class NumberedDataObjectCollection(NumberedObjectCollection):
     def __init__(self, obj_class, objects=None, problem=None):
         self._last_index = None
         if problem and objects:
-            try:
-                self._last_index = problem.data_inputs.index(objects[-1])
-            except ValueError:
-                pass
+            self._last_index = problem._find_data_input(objects[-1])
         super().__init__(obj_class, objects, problem)
 
+    def __data_index(self):
+        """
+        Finds where the last object of this collection is in the linked problem's data_inputs.
+
+        :returns: the index of the last object, or the last index of data_inputs if it isn't there.
+        :rtype: int
+        """
+        data_inputs = self._problem._data_inputs
+        if self._objects:
+            last = next(reversed(self._objects.values()))
+            index = self._last_index
+            if index is not None and index < len(data_inputs):
+                if data_inputs[index] is last:
+                    return index
+            index = self._problem._find_data_input(last)
+            if index is not None:
+                return index
+        return len(data_inputs) - 1
+
     def append(self, obj, insert_in_data=True):
         """Appends the given object to the end of this collection.
 
@@ -552,28 +1640,52 @@ class NumberedDataObjectCollection(NumberedObjectCollection):
         :type insert_in_data: bool
         :raises NumberConflictError: if this object has a number that is already in use.
         """
+        if self._problem:
+            index = self.__data_index()
         super().append(obj)
         if self._problem:
-            if self._last_index:
-                index = self._last_index
-            elif len(self) > 0:
-                try:
-                    index = self._problem.data_inputs.index(self._objects[-1])
-                except ValueError:
-                    index = len(self._problem.data_inputs)
-            else:
-                index = len(self._problem.data_inputs)
             if insert_in_data:
-                self._problem.data_inputs.insert(index + 1, obj)
+                self._problem._data_inputs.insert(index + 1, obj)
             self._last_index = index + 1
 
+    def extend(self, other_list):
+        """
+        Extends this collection with another list.
+
+        The new objects are added to the linked problem's data_inputs
+        right after the last object of this collection.
+
+        .. versionchanged:: 0.5.4
+            The objects are now added to the problem's data_inputs.
+
+        :param other_list: the list of objects to add.
+        :type other_list: list
+        :raises NumberConflictError: if these items conflict with existing elements.
+        """
+        if self._problem:
+            index = self.__data_index()
+        super().extend(other_list)
+        if self._problem:
+            self._problem._data_inputs[index + 1 : index + 1] = list(other_list)
+            self._last_index = index + len(other_list)
+
+    def __remove_from_data(self, obj):
+        """
+        Removes an object from the linked problem's data_inputs by its identity.
+
+        :param obj: the object to remove.
+        :type obj: Numbered_MCNP_Object
+        """
+        if self._problem:
+            self._problem._remove_data_input(obj)
+            self._last_index = None
+
     def __delitem__(self, idx):
         if not isinstance(idx, int):
             raise TypeError("index must be an int")
         obj = self[idx]
         super().__delitem__(idx)
-        if self._problem:
-            self._problem.data_inputs.remove(obj)
+        self.__remove_from_data(obj)
 
     def remove(self, delete):
         """
@@ -583,8 +1695,7 @@ class NumberedDataObjectCollection(NumberedObjectCollection):
         :type delete: Numbered_MCNP_Object
         """
         super().remove(delete)
-        if self._problem:
-            self._problem.data_inputs.remove(delete)
+        self.__remove_from_data(delete)
 
     def pop(self, pos=-1):
         """
@@ -597,10 +1708,8 @@ class NumberedDataObjectCollection(NumberedObjectCollection):
         """
         if not isinstance(pos, int):
             raise TypeError("The index for popping must be an int")
-        obj = self._objects.pop(pos)
-        super().pop(pos)
-        if self._problem:
-            self._problem.data_inputs.remove(obj)
+        obj = super().pop(pos)
+        self.__remove_from_data(obj)
         return obj
 
     def clear(self):
@@ -608,7 +1717,11 @@ class NumberedDataObjectCollection(NumberedObjectCollection):
         Removes all objects from this collection.
         """
         if self._problem:
-            for obj in self._objects:
-                self._problem.data_inputs.remove(obj)
+            removed = {id(obj) for obj in self._objects.values()}
+            self._problem._data_inputs[:] = [
+                data_input
+                for data_input in self._problem._data_inputs
+                if id(data_input) not in removed
+            ]
         self._last_index = None
         super().clear()
@@ -0,0 +1,217 @@
+# Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
+import collections.abc
+import concurrent.futures
+import multiprocessing
+import os
+import tempfile
+import warnings
+
+from montepy.mcnp_problem import MCNP_Problem
+
+
+def sweep(
+    problem,
+    mutator,
+    params,
+    out_dir,
+    workers=1,
+    name="variant_{index}.imcnp",
+    overwrite=False,
+):
+    """
+    Writes a variant of a problem for every set of parameters, e.g., for a parameter study.
+
+    Every variant is a copy-on-write clone of ``problem`` (see :func:`~montepy.mcnp_problem.MCNP_Problem.clone`),
+    which is changed by calling ``mutator(variant, param)``.
+    ``problem`` itself is never changed.
+
+    .. code-block:: python
+
+        def set_density(variant, density):
+            variant.cells[5].mass_density = density
+
+        paths = montepy.sweep(problem, set_density, [8.0, 9.0, 10.0], "densities", workers=4)
+
+    ``problem`` is written to a file once first, unless it has already been written, and that file is unchanged.
+    Every variant is written with :func:`~montepy.mcnp_problem.MCNP_Problem.write_patch` from that file,
+    so only the objects that the mutator changed are formatted again,
+    and the lines of all other objects are copied.
+    The files are the same as the ones :func:`~montepy.mcnp_problem.MCNP_Problem.write_problem` would write.
+
+    With more than one worker the variants are made, and written in a pool of processes.
+    The workers are forked from this process when possible,
+    so ``problem``, and ``mutator`` don't need to be pickled.
+    Otherwise they must be picklable, e.g., ``mutator`` can't be a ``lambda``.
+    ``params`` are always sent to the workers, so they must be picklable.
+    Warnings from the workers, e.g., :class:`~montepy.errors.LineExpansionWarning`, are raised in this process.
+
+    .. versionadded:: 0.5.4
+
+    :param problem: the problem to make the variants of.
+    :type problem: MCNP_Problem
+    :param mutator: the function that changes a variant for one set of parameters.
+        It is called as ``mutator(variant, param)``, and what it returns is ignored.
+    :type mutator: callable
+    :param params: the sets of parameters, one for every variant.
+    :type params: iterable
+    :param out_dir: the directory to write the variants to.
+        It is made if it doesn't exist.
+    :type out_dir: str, os.PathLike
+    :param workers: how many processes to make the variants in.
+    :type workers: int
+    :param name: the file name for every variant. This is formatted with ``index``,
+        the position of the variant in ``params``, and the items of ``param`` if it is a mapping,
+        e.g., ``"density_{density}.imcnp"`` for ``params=[{"density": 8.0}]``.
+    :type name: str
+    :param overwrite: Whether to overwrite the files of the variants if they already exist.
+    :type overwrite: bool
+    :returns: the paths of the variants that were written in the order of ``params``.
+    :rtype: list
+    :raises TypeError: if any argument is the wrong type.
+    :raises ValueError: if workers is not positive, or if two variants have the same file name.
+    :raises FileExistsError: if the file of a variant already exists, and overwrite is not set.
+    """
+    if not isinstance(problem, MCNP_Problem):
+        raise TypeError(f"problem must be an MCNP_Problem. {problem} given.")
+    if not callable(mutator):
+        raise TypeError(f"mutator must be callable. {mutator} given.")
+    if not isinstance(out_dir, (str, os.PathLike)):
+        raise TypeError(f"out_dir must be a path. {out_dir} given.")
+    if not isinstance(workers, int):
+        raise TypeError(f"workers must be an int. {workers} given.")
+    if workers < 1:
+        raise ValueError(f"workers must be positive. {workers} given.")
+    if not isinstance(name, str):
+        raise TypeError(f"name must be a str. {name} given.")
+    if not isinstance(overwrite, bool):
+        raise TypeError(f"overwrite must be a bool. {overwrite} given.")
+    params = list(params)
+    paths = [
+        os.path.join(out_dir, _format_name(name, index, param))
+        for index, param in enumerate(params)
+    ]
+    if len(set(paths)) != len(paths):
+        raise ValueError(f"Every variant must have its own file name. {name} given.")
+    if not overwrite:
+        for path in paths:
+            if os.path.exists(path):
+                raise FileExistsError(
+                    f"Variant file: {path} already exists, and overwrite is not set."
+                )
+    os.makedirs(out_dir, exist_ok=True)
+    record = problem._write_record
+    base_path = None
+    if record is None or not record.is_current(problem.mcnp_version):
+        # the variants are patched from this, so it is kept on the same file system
+        fd, base_path = tempfile.mkstemp(suffix=".imcnp", dir=out_dir)
+        os.close(fd)
+    try:
+        if base_path is not None:
+            problem.write_problem(base_path, overwrite=True)
+        if workers == 1 or len(params) < 2:
+            for param, path in zip(params, paths):
+                _write_variant(problem, mutator, param, path, overwrite)
+        else:
+            _write_in_workers(problem, mutator, params, paths, workers, overwrite)
+    finally:
+        if base_path is not None:
+            problem._write_record = record
+            os.remove(base_path)
+    return paths
+
+
+def _format_name(name, index, param):
+    """
+    Makes the file name for one variant.
+
+    :param name: the file name pattern given to :func:`sweep`.
+    :type name: str
+    :param index: the position of the variant.
+    :type index: int
+    :param param: the parameters of the variant.
+    :returns: the file name.
+    :rtype: str
+    """
+    fields = dict(param) if isinstance(param, collections.abc.Mapping) else {}
+    fields["index"] = index
+    return name.format(**fields)
+
+
+def _write_variant(problem, mutator, param, path, overwrite):
+    """
+    Makes, and writes one variant of the problem.
+
+    :param problem: the problem to make the variant of.
+    :type problem: MCNP_Problem
+    :param mutator: the function that changes the variant.
+    :type mutator: callable
+    :param param: the parameters of the variant.
+    :param path: where to write the variant.
+    :type path: str
+    :param overwrite: Whether to overwrite the file if it already exists.
+    :type overwrite: bool
+    """
+    variant = problem.clone(copy_on_write=True)
+    mutator(variant, param)
+    variant.write_patch(path, overwrite=overwrite)
+
+
+def _write_in_workers(problem, mutator, params, paths, workers, overwrite):
+    """
+    Makes, and writes the variants in worker processes.
+
+    The workers are forked from this process when possible,
+    so the problem, and mutator don't need to be pickled.
+    The warnings from every variant are raised in this process in order.
+
+    :param problem: the problem to make the variants of.
+    :type problem: MCNP_Problem
+    :param mutator: the function that changes a variant.
+    :type mutator: callable
+    :param params: the parameters of every variant.
+    :type params: list
+    :param paths: where to write every variant.
+    :type paths: list
+    :param workers: how many processes to use.
+    :type workers: int
+    :param overwrite: Whether to overwrite the files if they already exist.
+    :type overwrite: bool
+    """
+    if "fork" in multiprocessing.get_all_start_methods():
+        context = multiprocessing.get_context("fork")
+    else:
+        context = None
+    with concurrent.futures.ProcessPoolExecutor(
+        max_workers=min(workers, len(params)),
+        mp_context=context,
+        initializer=_init_sweep_worker,
+        initargs=(problem, mutator, overwrite),
+    ) as executor:
+        for caught in executor.map(_write_variant_in_worker, params, paths):
+            for warning in caught:
+                warnings.warn(warning, stacklevel=3)
+
+
+_SWEEP_WORKER_STATE = {}
+"""
+The problem, mutator, and whether to overwrite files in a worker process for :func:`sweep`.
+"""
+
+
+def _init_sweep_worker(problem, mutator, overwrite):
+    _SWEEP_WORKER_STATE["problem"] = problem
+    _SWEEP_WORKER_STATE["mutator"] = mutator
+    _SWEEP_WORKER_STATE["overwrite"] = overwrite
+
+
+def _write_variant_in_worker(param, path):
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        _write_variant(
+            _SWEEP_WORKER_STATE["problem"],
+            _SWEEP_WORKER_STATE["mutator"],
+            param,
+            path,
+            _SWEEP_WORKER_STATE["overwrite"],
+        )
+    return [warning.message for warning in caught]
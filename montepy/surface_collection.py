@@ -12,12 +12,14 @@ def __create_surface_generator(surf_type):
 
     This works by creating a closure that is a generator.
     This closure is then passed to ``property()`` to create a property
+
+    .. versionchanged:: 0.5.4
+        The surfaces are found with an index of the surface types,
+        instead of checking every surface.
     """
 
     def closure(obj):
-        for surf in obj.objects:
-            if surf.surface_type == surf_type:
-                yield surf
+        yield from obj._query(surface_type=surf_type)
 
     return closure
 
@@ -40,6 +42,8 @@ class Surfaces(NumberedObjectCollection):
     :type surfaces: list
     """
 
+    _ARRAY_POINTERS = {"transform": "transforms", "periodic_surface": "surfaces"}
+
     def __init__(self, surfaces=None, problem=None):
         super().__init__(Surface, surfaces, problem)
 
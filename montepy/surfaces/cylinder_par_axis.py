@@ -3,6 +3,7 @@ from .surface_type import SurfaceType
 from .surface import Surface
 from montepy.errors import *
 from montepy.utilities import *
+from montepy.utilities import _mark_modified
 
 
 def _enforce_positive_radius(self, value):
@@ -66,6 +67,7 @@ class CylinderParAxis(Surface):
         for val in coordinates:
             if not isinstance(val, (float, int)):
                 raise TypeError(f"Coordinate must be a number. {val} given.")
+        _mark_modified(self)
         for i, val in enumerate(coordinates):
             self._coordinates[i].value = val
 
@@ -9,6 +9,7 @@ from montepy.input_parser.syntax_node import (
     CommentNode,
 )
 from montepy.utilities import *
+from montepy.utilities import _claim, _deepcopy_state, _mark_modified
 
 
 class HalfSpace:
@@ -84,6 +85,19 @@ class HalfSpace:
         self._node = node
         self._cell = None
 
+    def __deepcopy__(self, memo):
+        """
+        Copies the tree structure of this HalfSpace.
+
+        The linked cell and dividers are copied through ``memo``,
+        so a caller may pre-populate ``memo`` to share them instead.
+        """
+        cls = type(self)
+        result = cls.__new__(cls)
+        memo[id(self)] = result
+        result.__dict__.update(_deepcopy_state(self.__dict__, memo))
+        return result
+
     @make_prop_pointer("_left", ())
     def left(self):
         """
@@ -187,20 +201,22 @@ class HalfSpace:
         if self._cell is None:
             return
         cells, surfaces = other._get_leaf_objects()
-        for container, parent in zip(
-            (cells, surfaces), (self._cell.complements, self._cell.surfaces)
-        ):
-            for item in container:
-                if not isinstance(
-                    item, (montepy.surfaces.surface.Surface, montepy.Cell)
-                ):
-                    raise IllegalState(
-                        f"The geometry was not fully initialized, and cannot be changed. "
-                        f"The offending cell is {self._cell}. "
-                        f"Run cell.update_pointers."
-                    )
-                if item not in parent:
-                    parent.append(item)
+        with montepy.cells._CellLinks.track_changes(self._cell):
+            for container, parent in zip(
+                (cells, surfaces), (self._cell.complements, self._cell.surfaces)
+            ):
+                for item in container:
+                    if not isinstance(
+                        item, (montepy.surfaces.surface.Surface, montepy.Cell)
+                    ):
+                        raise IllegalState(
+                            f"The geometry was not fully initialized, and cannot be changed. "
+                            f"The offending cell is {self._cell}. "
+                            f"Run cell.update_pointers."
+                        )
+                    # an equal object may already be there with the same number
+                    if item not in parent and parent.get(item.number) != item:
+                        parent.append(item)
 
     def remove_duplicate_surfaces(self, deleting_dict):
         """Updates old surface numbers to prepare for deleting surfaces.
@@ -238,14 +254,31 @@ class HalfSpace:
             surfaces |= new_surfaces
         return cells, surfaces
 
+    @property
+    def _owner(self):
+        """
+        The cell whose geometry this is a part of, which counts the changes to this.
+
+        .. versionadded:: 0.5.4
+
+        :rtype: Cell
+        """
+        return self._cell
+
+    @_owner.setter
+    def _owner(self, cell):
+        self._cell = cell
+
     def _update_values(self):
         self._ensure_has_nodes()
         self._update_node()
         if isinstance(self, UnitHalfSpace):
             return
-        self.left._update_values()
-        if self.right:
-            self.right._update_values()
+        for side in (self._left, self._right):
+            if side is not None:
+                if self._cell is not None:
+                    _claim(side, self._cell)
+                side._update_values()
 
     def _ensure_has_nodes(self):
         """
@@ -546,6 +579,7 @@ class UnitHalfSpace(HalfSpace):
             raise TypeError("Divider must be a Cell or Surface")
         if self.is_cell != isinstance(div, montepy.Cell):
             raise TypeError("Divider type must match with is_cell")
+        _mark_modified(self)
         self._divider = div
         if self._cell is not None:
             if self.is_cell:
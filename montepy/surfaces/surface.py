@@ -8,6 +8,7 @@ from montepy.numbered_mcnp_object import Numbered_MCNP_Object
 from montepy.surfaces import half_space
 from montepy.surfaces.surface_type import SurfaceType
 from montepy.utilities import *
+from montepy.utilities import _mark_modified
 import re
 
 
@@ -101,6 +102,7 @@ class Surface(Numbered_MCNP_Object):
     def is_reflecting(self, reflect):
         if not isinstance(reflect, bool):
             raise TypeError("is_reflecting must be set to a bool")
+        _mark_modified(self)
         self._is_reflecting = reflect
 
     @property
@@ -116,6 +118,7 @@ class Surface(Numbered_MCNP_Object):
     def is_white_boundary(self, white):
         if not isinstance(white, bool):
             raise TypeError("is_white_boundary must be set to a bool")
+        _mark_modified(self)
         self._is_white_boundary = white
 
     @property
@@ -141,6 +144,7 @@ class Surface(Numbered_MCNP_Object):
                 raise TypeError(
                     f"The surface constant provided: {constant} must be a float"
                 )
+        _mark_modified(self)
         for i, value in enumerate(constants):
             self._surface_constants[i].value = value
 
@@ -197,9 +201,7 @@ class Surface(Numbered_MCNP_Object):
         :rtype: generator
         """
         if self._problem:
-            for cell in self._problem.cells:
-                if self in cell.surfaces:
-                    yield cell
+            yield from self._problem.cells._get_cells_linked_to("surfaces", self)
 
     def __str__(self):
         return f"SURFACE: {self.number}, {self.surface_type}"
@@ -224,6 +226,7 @@ class Surface(Numbered_MCNP_Object):
         :param data_cards: the data_cards in the problem.
         :type data_cards: list
         """
+        _mark_modified(self)
         if self.old_periodic_surface:
             try:
                 self._periodic_surface = surfaces[self.old_periodic_surface]
@@ -235,10 +238,16 @@ class Surface(Numbered_MCNP_Object):
                     self.old_periodic_surface,
                 )
         if self.old_transform_number:
-            for input in data_inputs:
-                if isinstance(input, transform.Transform):
-                    if input.number == self.old_transform_number:
-                        self._transform = input
+            # use the problem's transforms first
+            if self._problem:
+                self._transform = self._problem.transforms.get(
+                    self.old_transform_number
+                )
+            else:
+                for input in data_inputs:
+                    if isinstance(input, transform.Transform):
+                        if input.number == self.old_transform_number:
+                            self._transform = input
             if not self.transform:
                 raise BrokenObjectLinkError(
                     "Surface",
@@ -7,6 +7,17 @@ from montepy.input_parser import syntax_node
 from montepy.numbered_mcnp_object import Numbered_MCNP_Object
 
 
+class _UniverseParser:
+    """
+    A fake parser for universes, as they don't have their own inputs.
+
+    .. versionadded:: 0.5.4
+    """
+
+    def parse(self, token_gen, input):
+        return syntax_node.SyntaxNode("fake universe", {})
+
+
 class Universe(Numbered_MCNP_Object):
     """
     Class to represent an MCNP universe, but not handle the input
@@ -16,6 +27,13 @@ class Universe(Numbered_MCNP_Object):
     :type number: int
     """
 
+    _BLANK_INPUT = Input(["U"], BlockType.DATA)
+    """
+    The input shared by all universes, as they don't have their own inputs.
+    """
+
+    _parser = _UniverseParser()
+
     def __init__(self, number):
         self._number = self._generate_default_node(int, -1)
         if not isinstance(number, int):
@@ -23,12 +41,11 @@ class Universe(Numbered_MCNP_Object):
         if number < 0:
             raise ValueError(f"Universe number must be ≥ 0. {number} given.")
         self._number = self._generate_default_node(int, number)
+        super().__init__(self._BLANK_INPUT, self._parser)
 
-        class Parser:
-            def parse(self, token_gen, input):
-                return syntax_node.SyntaxNode("fake universe", {})
-
-        super().__init__(Input(["U"], BlockType.DATA), Parser())
+    @classmethod
+    def _create_many(cls, numbers):
+        return [cls(number) for number in numbers]
 
     @property
     def cells(self):
@@ -39,9 +56,7 @@ class Universe(Numbered_MCNP_Object):
         :rtype: Generator
         """
         if self._problem:
-            for cell in self._problem.cells:
-                if cell.universe == self:
-                    yield cell
+            yield from self._problem.cells._get_cells_linked_to("universe", self)
 
     def claim(self, cells):
         """
@@ -1,7 +1,12 @@
 # Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
 from montepy.constants import BLANK_SPACE_CONTINUE
+import montepy
+import copy
+import dis
+import enum
 import functools
 import re
+import weakref
 
 """
 A package for helper universal utility functions
@@ -32,6 +37,131 @@ def fortran_float(number_string):
             raise ValueError(f"Value Not parsable as float: {number_string}") from e
 
 
+class _ValueChanges:
+    """
+    Counts how many times a value, or pointer of any MontePy object has been set.
+
+    Caches of values, e.g., :func:`~montepy.numbered_object_collection.NumberedObjectCollection.to_arrays`,
+    may be stale when this count changes.
+
+    .. versionadded:: 0.5.4
+    """
+
+    count = 0
+
+
+class _SharedObjects:
+    """
+    Counts the copy-on-write clones of problems that are alive.
+
+    While there are any, changes to MontePy objects are checked with :func:`_unshare`,
+    so that a clone never sees the changes made to the problem that it was cloned from.
+
+    .. versionadded:: 0.5.4
+    """
+
+    clones = 0
+
+    reading = 0
+    """
+    How many problems are being written, which only reads the objects, so nothing is copied.
+    """
+
+
+def _unshare(obj, while_reading=False):
+    """
+    Copies an object for the copy-on-write clones that share it, before it is changed.
+
+    This is only needed while :class:`_SharedObjects` counts any clones.
+
+    .. versionadded:: 0.5.4
+
+    :param obj: the object that is about to be changed.
+        This may be a helper object, which is copied with the object that owns it.
+    :param while_reading: Whether to copy the object even while a problem is being written,
+        for objects that change what they hold when they are formatted.
+    :type while_reading: bool
+    """
+    montepy.mcnp_problem._CopyOnWrite.unshare(obj, while_reading)
+
+
+_IMMUTABLE_TYPES = frozenset({str, int, float, bool, type(None), type, weakref.ref})
+"""
+Types that never need to be copied when deep copying.
+"""
+
+
+def _mark_modified(obj):
+    """
+    Records that an object may have been modified.
+
+    Objects that count their own modifications, i.e., :class:`~montepy.mcnp_object.MCNP_Object`,
+    have their ``_modifications`` increased.
+    Helper objects, e.g., :class:`~montepy.surfaces.half_space.HalfSpace`,
+    increase the ``_modifications`` of the object that owns them, as found by :func:`_claim`.
+    The change is counted in :class:`_ValueChanges` as well.
+    This must be called by every setter, and method that changes an object, before it is changed,
+    so that the copy-on-write clones that share it can copy it first.
+
+    .. versionadded:: 0.5.4
+
+    :param obj: the object that was modified.
+    """
+    _ValueChanges.count += 1
+    try:
+        obj._modifications += 1
+    except AttributeError:
+        owner = getattr(obj, "_owner", None)
+        if owner is not None:
+            owner._modifications += 1
+    if _SharedObjects.clones:
+        _unshare(obj)
+
+
+def _claim(helper, owner):
+    """
+    Records that a helper object is part of the formatted lines of an owner.
+
+    Changing the helper then marks the owner as modified with :func:`_mark_modified`.
+    If the helper belonged to another object, that object is marked as modified,
+    as it can no longer tell when the helper is changed.
+
+    .. versionadded:: 0.5.4
+
+    :param helper: the helper object, which has an ``_owner`` attribute.
+    :param owner: the object that formats the helper.
+    :type owner: MCNP_Object
+    """
+    previous = helper._owner
+    if previous is not owner:
+        if previous is not None:
+            previous._modifications += 1
+        helper._owner = owner
+
+
+def _deepcopy_state(state, memo):
+    """
+    Deep copies the values of an object's state dictionary.
+
+    Immutable values, and enums are shared instead of going through :func:`copy.deepcopy`.
+
+    .. versionadded:: 0.5.4
+
+    :param state: the ``__dict__`` or the result of ``__getstate__`` for the object.
+    :type state: dict
+    :param memo: the memo dictionary from ``__deepcopy__``.
+    :type memo: dict
+    :returns: a new state dictionary.
+    :rtype: dict
+    """
+    new_state = {}
+    for key, value in state.items():
+        if type(value) not in _IMMUTABLE_TYPES and not isinstance(value, enum.Enum):
+            value = copy.deepcopy(value, memo)
+        new_state[key] = value
+    return new_state
+
+
 def is_comment(line):
     """
     Determines if the line is a ``C comment`` style comment.
@@ -51,6 +181,166 @@ def is_comment(line):
     return blank_comment
 
 
+def _add_exception_context(error, obj):
+    """
+    Adds the input file context to an error, like :class:`~montepy.mcnp_object._ExceptionContextAdder` does.
+
+    :param error: the error that was raised.
+    :type error: Exception
+    :param obj: the object whose property raised the error.
+    :raises Exception: the error with context if ``obj`` is an ``MCNP_Object``.
+    """
+    if isinstance(obj, montepy.mcnp_object.MCNP_Object):
+        montepy.errors.add_line_number_to_exception(error, obj)
+    raise error
+
+
+def _is_empty_function(func):
+    """
+    Checks if the function does nothing, i.e., it only has a docstring, and ``pass``.
+
+    :param func: the function to check.
+    :type func: function
+    :returns: True if calling the function can only return None.
+    :rtype: bool
+    """
+    try:
+        instructions = list(dis.get_instructions(func))
+    except TypeError:
+        return False
+    for instruction in instructions:
+        if instruction.opname in {"RESUME", "NOP", "RETURN_VALUE"}:
+            continue
+        if instruction.opname in {"LOAD_CONST", "RETURN_CONST"}:
+            if instruction.argval is None:
+                continue
+        return False
+    return True
+
+
+def _only_returns_attribute(func):
+    """
+    Checks if the function only returns an attribute of its first argument, e.g., ``return self._x``.
+
+    :param func: the function to check.
+    :type func: function
+    :returns: True if calling the function can only get an attribute.
+    :rtype: bool
+    """
+    try:
+        instructions = [
+            instruction
+            for instruction in dis.get_instructions(func)
+            if instruction.opname not in {"RESUME", "NOP"}
+        ]
+    except TypeError:
+        return False
+    return [instruction.opname for instruction in instructions] == [
+        "LOAD_FAST",
+        "LOAD_ATTR",
+        "RETURN_VALUE",
+    ] and instructions[0].arg == 0
+
+
+def _find_property_owner(obj, name, setter):
+    """
+    Finds the class that defined the property with the given setter.
+
+    :param obj: the object the property was used on.
+    :param name: the name of the property.
+    :type name: str
+    :param setter: the setter function of the property.
+    :type setter: function
+    :returns: the class that defined the property.
+    :rtype: type
+    """
+    for owner in type(obj).__mro__:
+        prop = owner.__dict__.get(name)
+        if isinstance(prop, property) and prop.fset is setter:
+            return owner
+    return type(obj)
+
+
+def _make_prop_setter(
+    func, hidden_param, types, base_type, validator, value_node, message
+):
+    """
+    Makes the setter for a property made by :func:`make_prop_val_node` or :func:`make_prop_pointer`.
+
+    The type checks, and conversion are all worked out before hand,
+    so setting only does the work needed for this property.
+
+    :param func: the function that was decorated.
+    :type func: function
+    :param hidden_param: the name of the attribute the value is stored in.
+    :type hidden_param: str
+    :param types: the acceptable types for the value. An empty tuple means the class that defines the property.
+    :type types: Class, tuple
+    :param base_type: the type to convert values to.
+    :type base_type: Class
+    :param validator: the function to validate values with.
+    :type validator: function
+    :param value_node: whether the value is stored in a ValueNode, instead of directly.
+        ``None`` values are not converted to the ``base_type`` for ValueNodes.
+    :type value_node: bool
+    :param message: the message for type errors, formatted with ``types``, and ``value``.
+    :type message: str
+    :returns: the setter
+    :rtype: function
+    """
+    name = func.__name__
+    allowed = types
+    if isinstance(types, tuple) and len(types) == 0:
+        # found the first time this is set
+        allowed = None
+
+    def setter(self, value):
+        nonlocal allowed
+        try:
+            if allowed is None:
+                allowed = _find_property_owner(self, name, setter)
+            if not isinstance(value, allowed):
+                raise TypeError(message.format(types=allowed, value=value))
+            if base_type is not None and not isinstance(value, base_type):
+                if value is not None or not value_node:
+                    value = base_type(value)
+            if validator is not None:
+                validator(self, value)
+            _mark_modified(self)
+            if value_node:
+                getattr(self, hidden_param).value = value
+            else:
+                setattr(self, hidden_param, value)
+        except Exception as e:
+            _add_exception_context(e, self)
+
+    return setter
+
+
+def _finish_property(getter, setter, hidden_param, deletable):
+    """
+    Marks the accessors as adding their own error context, and builds the property.
+
+    :returns: the property.
+    :rtype: property
+    """
+    deleter = None
+    if deletable:
+
+        def deleter(self):
+            try:
+                _mark_modified(self)
+                setattr(self, hidden_param, None)
+            except Exception as e:
+                _add_exception_context(e, self)
+
+    accessors = [getter, setter, deleter]
+    for accessor in accessors:
+        if accessor is not None:
+            accessor._adds_exception_context = True
+    return property(*accessors)
+
+
 def make_prop_val_node(
     hidden_param, types=None, base_type=None, validator=None, deletable=False
 ):
@@ -61,6 +351,10 @@ def make_prop_val_node(
     set the value property of the underlying ValueNode.
     By default the property is not settable unless types is set.
 
+    .. versionchanged:: 0.5.4
+        The decorated function is no longer called if it only has a docstring, and ``pass``.
+        Everything needed to get and set values is worked out once when the property is made.
+
     :param hidden_param: The string representing the parameter name of the internally stored ValueNode.
     :type hidden_param: str
     :param types: the acceptable types for the settable, which is passed to isinstance. If an empty tuple will be
@@ -73,48 +367,45 @@ def make_prop_val_node(
     """
 
     def decorator(func):
-        @property
-        @functools.wraps(func)
-        def getter(self):
-            result = func(self)
-            if result:
-                return result
-            else:
-                val = getattr(self, hidden_param)
-                if val is None:
-                    return None
-                return val.value
-
+        if _is_empty_function(func):
+
+            @functools.wraps(func)
+            def getter(self):
+                try:
+                    val = getattr(self, hidden_param)
+                    if val is None:
+                        return None
+                    return val.value
+                except Exception as e:
+                    _add_exception_context(e, self)
+
+        else:
+
+            @functools.wraps(func)
+            def getter(self):
+                try:
+                    result = func(self)
+                    if result:
+                        return result
+                    val = getattr(self, hidden_param)
+                    if val is None:
+                        return None
+                    return val.value
+                except Exception as e:
+                    _add_exception_context(e, self)
+
+        setter = None
         if types is not None:
-
-            def setter(self, value):
-                nonlocal types
-                if isinstance(types, tuple) and len(types) == 0:
-                    types = type(self)
-                if not isinstance(value, types):
-                    raise TypeError(
-                        f"{func.__name__} must be of type: {types}. {value} given."
-                    )
-                if (
-                    base_type is not None
-                    and value is not None
-                    and not isinstance(value, base_type)
-                ):
-                    value = base_type(value)
-                if validator:
-                    validator(self, value)
-                node = getattr(self, hidden_param)
-                node.value = value
-
-            getter = getter.setter(setter)
-
-        if deletable:
-
-            def deleter(self):
-                setattr(self, hidden_param, None)
-
-            getter = getter.deleter(deleter)
-        return getter
+            setter = _make_prop_setter(
+                func,
+                hidden_param,
+                types,
+                base_type,
+                validator,
+                True,
+                f"{func.__name__} must be of type: {{types}}. {{value}} given.",
+            )
+        return _finish_property(getter, setter, hidden_param, deletable)
 
     return decorator
 
@@ -127,6 +418,10 @@ def make_prop_pointer(
 
     Note this can also be used for almost any circumstance as everything in python is a pointer.
 
+    .. versionchanged:: 0.5.4
+        The decorated function is no longer called if it only has a docstring, and ``pass``.
+        Everything needed to get and set values is worked out once when the property is made.
+
     :param hidden_param: The string representing the parameter name of the internally stored ValueNode.
     :type hidden_param: str
     :param types: the acceptable types for the settable, which is passed to isinstance, if an empty tuple is provided the type will be self.
@@ -138,35 +433,38 @@ def make_prop_pointer(
     """
 
     def decorator(func):
-        @property
-        @functools.wraps(func)
-        def getter(self):
-            result = func(self)
-            if result:
-                return result
-            return getattr(self, hidden_param)
-
+        if _is_empty_function(func):
+
+            @functools.wraps(func)
+            def getter(self):
+                try:
+                    return getattr(self, hidden_param)
+                except Exception as e:
+                    _add_exception_context(e, self)
+
+        else:
+
+            @functools.wraps(func)
+            def getter(self):
+                try:
+                    result = func(self)
+                    if result:
+                        return result
+                    return getattr(self, hidden_param)
+                except Exception as e:
+                    _add_exception_context(e, self)
+
+        setter = None
         if types is not None:
-
-            def setter(self, value):
-                nonlocal types
-                if isinstance(types, tuple) and len(types) == 0:
-                    types = type(self)
-                if not isinstance(value, types):
-                    raise TypeError(f"{func.__name__} must be of type: {types}")
-                if base_type is not None and not isinstance(value, base_type):
-                    value = base_type(value)
-                if validator:
-                    validator(self, value)
-                setattr(self, hidden_param, value)
-
-            getter = getter.setter(setter)
-        if deletable:
-
-            def deleter(self):
-                setattr(self, hidden_param, None)
-
-            getter = getter.deleter(deleter)
-        return getter
+            setter = _make_prop_setter(
+                func,
+                hidden_param,
+                types,
+                base_type,
+                validator,
+                False,
+                f"{func.__name__} must be of type: {{types}}",
+            )
+        return _finish_property(getter, setter, hidden_param, deletable)
 
     return decorator
@@ -6,7 +6,7 @@ import pytest
 import montepy
 from montepy.cell import Cell
 from montepy.input_parser.block_type import BlockType
-from montepy.input_parser.mcnp_input import Input
+from montepy.input_parser.mcnp_input import Input, Jump
 
 
 class TestCellClass(TestCase):
@@ -298,6 +298,69 @@ def test_cell_clone_default():
         assert new_cell.number != cell.number
 
 
+def test_cell_clone_shares_links():
+    problem = montepy.read_input("tests/inputs/test_universe.imcnp")
+    for number in (1, 5):
+        cell = problem.cells[number]
+        new_cell = cell.clone()
+        assert new_cell.geometry._cell is new_cell
+        assert new_cell.universe is cell.universe
+        assert new_cell.fill.universe is cell.fill.universe
+        assert new_cell.material is cell.material
+        for old_surf, new_surf in zip(cell.surfaces, new_cell.surfaces):
+            assert old_surf is new_surf
+        cells, surfaces = new_cell.geometry._get_leaf_objects()
+        for leaf in cells:
+            assert leaf is problem.cells[leaf.number]
+        for leaf in surfaces:
+            assert leaf is problem.surfaces[leaf.number]
+    cell = problem.cells[1]
+    new_cell = cell.clone(clone_material=True)
+    assert new_cell.material is not cell.material
+    assert new_cell.material.number in problem.materials.numbers
+    assert new_cell.universe is cell.universe
+
+
+def test_blank_cell_independent():
+    cells = [Cell(), Cell()]
+    cells[0].number = 1
+    cells[0].importance.neutron = 2.0
+    cells[0].volume = 5.0
+    assert cells[1].number is None
+    assert cells[1].importance.neutron == 0.0
+    assert cells[1].volume is None
+    assert cells[0]._number is not cells[1]._number
+    assert cells[0]._number.padding is not cells[1]._number.padding
+
+
+def test_default_node_templates_bounded():
+    montepy.Universe(1)
+    templates = len(montepy.mcnp_object.MCNP_Object._DEFAULT_NODES)
+    universes = [montepy.Universe(number) for number in range(2, 2000)]
+    assert len(montepy.mcnp_object.MCNP_Object._DEFAULT_NODES) == templates
+    assert [universe.number for universe in universes[:3]] == [2, 3, 4]
+    node = montepy.mcnp_object.MCNP_Object._generate_default_node(float, 1.5)
+    assert node.value == 1.5
+    assert node.format() == "1.5 "
+    node = montepy.mcnp_object.MCNP_Object._generate_default_node(int, Jump())
+    assert node.value is None
+    assert isinstance(node.token, Jump)
+
+
+def test_cells_lazy_blank_modifiers():
+    cells = montepy.cells.Cells()
+    assert "_volume" not in cells.__dict__
+    assert isinstance(cells._volume, montepy.data_inputs.volume.Volume)
+    assert "_volume" in cells.__dict__
+    assert cells._volume is cells._volume
+    with pytest.raises(AttributeError):
+        cells._foo
+    problem = montepy.MCNP_Problem("")
+    cells = montepy.cells.Cells()
+    cells.link_to_problem(problem)
+    assert cells._importance._problem is problem
+
+
 @pytest.mark.parametrize(
     "args, error",
     [
@@ -0,0 +1,160 @@
+# Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
+import io
+import pytest
+
+import montepy
+from montepy.data_inputs.material import Material
+from montepy.data_inputs.mode import Mode
+from montepy.data_inputs.volume import Volume
+from montepy.errors import IllegalState, NumberConflictError
+from montepy.input_parser import block_type
+from montepy.input_parser.mcnp_input import Input
+from montepy.surfaces.surface_builder import surface_builder
+
+
+def _make_model(size):
+    surfaces = [
+        surface_builder(Input([f"{i} so {i}"], block_type.BlockType.SURFACE))
+        for i in range(1, size + 1)
+    ]
+    material = Material(Input(["m1 1001.80c 1.0"], block_type.BlockType.DATA))
+    mode = Mode(Input(["mode n p"], block_type.BlockType.DATA))
+    cells = []
+    for i in range(1, size + 1):
+        cell = montepy.Cell()
+        cell.number = i
+        if i == 1:
+            cell.geometry = -surfaces[0]
+        else:
+            cell.geometry = +surfaces[i - 2] & -surfaces[i - 1]
+        if i % 2:
+            cell.material = material
+            cell.mass_density = 1.0 + i
+        cell.importance.neutron = 0.0 if i == size else 1.0
+        cell.importance.photon = 0.5
+        cell.volume = float(i)
+        cells.append(cell)
+    return cells, surfaces, material, mode
+
+
+def _write_problem(print_in_data_block):
+    cells, surfaces, material, mode = _make_model(5)
+    problem = montepy.MCNP_Problem(None)
+    problem.title = "streamed"
+    for cls in montepy.Cell._INPUTS_TO_PROPERTY:
+        prefix = cls._class_prefix()
+        problem.print_in_data_block[prefix] = prefix in print_in_data_block
+    problem._mode = mode
+    problem.data_inputs.append(mode)
+    problem.materials.append(material)
+    problem.surfaces.extend(surfaces)
+    problem.cells.extend(cells)
+    with io.StringIO() as fh:
+        problem.write_problem(fh)
+        return fh.getvalue()
+
+
+@pytest.mark.parametrize("print_in_data_block", [[], ["imp"], ["IMP", "vol"]])
+def test_deck_writer_matches_problem(print_in_data_block):
+    cells, surfaces, material, mode = _make_model(5)
+    with io.StringIO() as fh:
+        with montepy.DeckWriter(
+            fh, title="streamed", mode=mode, print_in_data_block=print_in_data_block
+        ) as writer:
+            writer.add_cells(cell for cell in cells)
+            writer.add_surfaces(surfaces)
+            writer.add_data_input(material)
+        output = fh.getvalue()
+    assert output == _write_problem([key.lower() for key in print_in_data_block])
+    if print_in_data_block:
+        assert "IMP:n 1.0 1.0 1.0 1.0 0.0" in output
+    else:
+        assert "IMP:n=0.0" in output
+
+
+def test_deck_writer_file(tmp_path):
+    cells, surfaces, material, mode = _make_model(2)
+    out_file = tmp_path / "out.imcnp"
+    with montepy.DeckWriter(
+        out_file, title="hi", message="a message", mode=mode
+    ) as writer:
+        assert writer.mcnp_version == montepy.constants.DEFAULT_VERSION
+        writer.add_cells(cells)
+        assert writer.lineno == 6
+        writer.add_surfaces(surfaces)
+        writer.add_data_input(material)
+        # the lines are only written in large chunks
+        assert out_file.read_text() == ""
+    problem = montepy.read_input(out_file)
+    assert problem.title.title == "hi"
+    assert problem.message.lines == ["a message"]
+    assert [cell.number for cell in problem.cells] == [1, 2]
+    assert [surface.number for surface in problem.surfaces] == [1, 2]
+    assert problem.cells[1].material.number == 1
+    assert problem.cells[2].importance.photon == 0.5
+    with pytest.raises(FileExistsError):
+        montepy.DeckWriter(out_file)
+    with montepy.DeckWriter(out_file, overwrite=True) as writer:
+        writer.add_cell(cells[0])
+
+
+def test_deck_writer_block_order():
+    cells, surfaces, material, mode = _make_model(2)
+    writer = montepy.DeckWriter(io.StringIO())
+    writer.add_cell(cells[0])
+    writer.add_surface(surfaces[0])
+    with pytest.raises(IllegalState):
+        writer.add_cell(cells[1])
+    writer.add_data_input(material)
+    with pytest.raises(IllegalState):
+        writer.add_surface(surfaces[1])
+    writer.close()
+    writer.close()
+    with pytest.raises(IllegalState):
+        writer.add_data_input(mode)
+
+
+def test_deck_writer_bad_inputs():
+    cells, surfaces, material, mode = _make_model(2)
+    with pytest.raises(TypeError):
+        montepy.DeckWriter(object())
+    with pytest.raises(TypeError):
+        montepy.DeckWriter(io.StringIO(), title=5)
+    with pytest.raises(TypeError):
+        montepy.DeckWriter(io.StringIO(), mode="n")
+    with pytest.raises(KeyError):
+        montepy.DeckWriter(io.StringIO(), print_in_data_block=["foo"])
+    writer = montepy.DeckWriter(io.StringIO(), mode=mode)
+    with pytest.raises(TypeError):
+        writer.add_cell(surfaces[0])
+    with pytest.raises(TypeError):
+        writer.add_surface(cells[0])
+    with pytest.raises(TypeError):
+        writer.add_data_input(cells[0])
+    with pytest.raises(TypeError):
+        writer.add_data_input(Volume())
+    with pytest.raises(IllegalState):
+        writer.add_data_input(Mode())
+
+
+def test_deck_writer_number_conflict():
+    cells, _, _, _ = _make_model(2)
+    cells[1].number = 1
+    writer = montepy.DeckWriter(io.StringIO(), print_in_data_block="imp")
+    writer.add_cell(cells[0])
+    with pytest.raises(NumberConflictError):
+        writer.add_cell(cells[1])
+
+
+def test_deck_writer_expansion_warning():
+    cell = montepy.Cell(Input(["1 0 -1 imp:n=1"], block_type.BlockType.CELL))
+    cell.number = 123456
+    with io.StringIO() as fh:
+        writer = montepy.DeckWriter(fh, title="hi")
+        with pytest.warns(montepy.errors.LineExpansionWarning) as record:
+            writer.add_cell(cell)
+        writer.close()
+        lines = fh.getvalue().splitlines()
+    assert len(record) == 1
+    assert "Line 2 " in record[0].message.message
+    assert lines[1].startswith("123456 0 -1")
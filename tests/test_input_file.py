@@ -71,6 +71,27 @@ class testInputFileWrapper(unittest.TestCase):
             if os.path.exists(out):
                 os.remove(out)
 
+    def test_write_lines(self):
+        out = "bar.imcnp"
+        try:
+            test = MCNP_InputFile(out)
+            test.BUFFER_SIZE = 10
+            with test.open("w") as fh:
+                fh.write_lines(["hi", "bar"])
+                self.assertEqual(test.lineno, 3)
+                # not enough to be written yet
+                self.assertEqual(os.path.getsize(out), 0)
+                fh.write("foo\n")
+                fh.write_lines(["a" * 20])
+                fh.write_lines(["end"])
+                self.assertEqual(test.lineno, 6)
+            with test.open("r") as fh:
+                contents = fh.read()
+            self.assertEqual(contents, "hi\nbar\nfoo\n" + "a" * 20 + "\nend\n")
+        finally:
+            if os.path.exists(out):
+                os.remove(out)
+
 
 def _write_file(out_file):
     with open(out_file, "w") as fh:
@@ -101,3 +122,36 @@ def test_write_guardrails(writer, exception, clearer):
             clearer(out_file)
         except FileNotFoundError:
             pass
+
+
+@pytest.mark.parametrize(
+    "module, extension", (("gzip", ".gz"), ("bz2", ".bz2"), ("lzma", ".xz"))
+)
+def test_compressed_round_trip(tmp_path, module, extension):
+    out_file = tmp_path / f"out.imcnp{extension}"
+    test = MCNP_InputFile(out_file)
+    assert test.compression == module
+    with test.open("w") as fh:
+        fh.write_lines(["hi", "bar"])
+    with open(out_file, "rb") as fh:
+        assert not fh.read().startswith(b"hi")
+    # the magic bytes are found without the extension
+    renamed = tmp_path / "out.imcnp"
+    os.rename(out_file, renamed)
+    test = MCNP_InputFile(renamed)
+    assert test.compression == module
+    with test.open("r") as fh:
+        assert list(fh) == ["hi\n", "bar\n"]
+
+
+def test_compressed_replace(tmp_path):
+    import gzip
+
+    with gzip.open(tmp_path / "in.imcnp.gz", "wb") as fh:
+        fh.write("hi ☢\r\nbar\n".encode("utf-8"))
+    # the compressed file is found from the name without the extension
+    test = MCNP_InputFile(tmp_path / "in.imcnp")
+    assert test.compression == "gzip"
+    with test.open("rb") as fh:
+        assert list(fh) == ["hi    \n", "bar\n"]
+    assert MCNP_InputFile(tmp_path / "nothing.imcnp").compression is None
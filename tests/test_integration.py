@@ -361,6 +361,73 @@ def test_reverse_pointers(simple_problem):
     assert len(cells) == 2
 
 
+def _check_reverse_pointers(problem):
+    for surf in problem.surfaces:
+        answer = [cell for cell in problem.cells if surf in cell.surfaces]
+        assert list(surf.cells) == answer
+    for mat in problem.materials:
+        answer = [cell for cell in problem.cells if cell.material is mat]
+        assert list(mat.cells) == answer
+    for universe in problem.universes:
+        answer = [cell for cell in problem.cells if cell.universe is universe]
+        assert list(universe.cells) == answer
+    for comp_cell in problem.cells:
+        answer = [
+            cell
+            for cell in problem.cells
+            if cell is not comp_cell and comp_cell in cell.complements
+        ]
+        assert list(comp_cell.cells_complementing_this) == answer
+
+
+def test_reverse_pointers_updated():
+    problem = montepy.read_input(os.path.join("tests", "inputs", "test.imcnp"))
+    _check_reverse_pointers(problem)
+    links = problem.cells._current_links()
+    assert links is not None
+    # tracked changes keep the index up to date
+    cell = problem.cells[2]
+    cell.material = problem.materials[1]
+    _check_reverse_pointers(problem)
+    del cell.material
+    _check_reverse_pointers(problem)
+    universe = montepy.Universe(5)
+    problem.universes.append(universe)
+    cell.universe = universe
+    _check_reverse_pointers(problem)
+    cell.geometry &= +problem.surfaces[1000] | ~problem.cells[99]
+    _check_reverse_pointers(problem)
+    assert problem.cells._current_links() is links
+    # so do changes to the surfaces, complements, and cells
+    problem.cells[1].surfaces.append(problem.surfaces[1010])
+    _check_reverse_pointers(problem)
+    problem.cells[1].complements.append(problem.cells[3])
+    _check_reverse_pointers(problem)
+    problem.cells.remove(problem.cells[5])
+    _check_reverse_pointers(problem)
+    new_cell = montepy.Cell()
+    new_cell.number = 500
+    new_cell.geometry = -problem.surfaces[1000]
+    problem.cells.append(new_cell)
+    _check_reverse_pointers(problem)
+    new_cell.surfaces.append(problem.surfaces[1010])
+    _check_reverse_pointers(problem)
+    problem.cells.pop()
+    _check_reverse_pointers(problem)
+    # changes to other problems don't matter
+    other = montepy.read_input(os.path.join("tests", "inputs", "test.imcnp"))
+    other_cell = montepy.Cell()
+    other_cell.number = 500
+    other_cell.geometry = -other.surfaces[1000]
+    other.cells.append(other_cell)
+    other.cells[1].surfaces.append(other.surfaces[1010])
+    assert problem.cells._current_links() is links
+    _check_reverse_pointers(problem)
+    _check_reverse_pointers(other)
+    new_prob = copy.deepcopy(problem)
+    _check_reverse_pointers(new_prob)
+
+
 def test_surface_card_pass_through():
     problem = montepy.read_input("tests/inputs/test_surfaces.imcnp")
     surf = problem.surfaces[1]
@@ -981,6 +1048,22 @@ def test_fill_cell_format(simple_problem, universe_problem):
     assert output == ["FILL 4J 350 "]
 
 
+@pytest.mark.parametrize("source, target", [(1, 0), (3, 2), (0, 3)])
+def test_fill_lattice_edit_round_trip(universe_problem, source, target):
+    problem = copy.deepcopy(universe_problem)
+    universes = problem.cells[2].fill.universes.flat
+    universes[target] = universes[source]
+    numbers = [universe.number for universe in universes]
+    output = problem.cells[2].fill.format_for_mcnp_input((6, 2, 0))
+    # the bounds of the ranges are never in a shortcut
+    assert output[0].startswith("fill= 0:1 0:1 0:0 ")
+    if (source, target) == (1, 0):
+        assert output == ["fill= 0:1 0:1 0:0 0 2R 1 (5)"]
+    new_problem = montepy.read_input(io.StringIO(_write_to_string(problem)))
+    new_numbers = [u.number for u in new_problem.cells[2].fill.universes.flat]
+    assert new_numbers == numbers
+
+
 def test_universe_cells_claim(universe_problem):
     problem = copy.deepcopy(universe_problem)
     universe = problem.universes[1]
@@ -1067,6 +1150,30 @@ def test_parsing_error():
         problem = montepy.read_input(in_file)
 
 
+def test_error_context(simple_problem):
+    cell = simple_problem.cells[1]
+    context = r"test\.imcnp, line \d+\n(.|\n)*imp:n,p=1 U=350 trcl=5"
+    # property getter
+    with pytest.raises(AttributeError, match=context) as excinfo:
+        cell.mass_density
+    assert excinfo.value.args[0].endswith("Cell 1 is in atom density.")
+    # property setter
+    with pytest.raises(ValueError, match=context):
+        cell.number = -1
+    # method
+    with pytest.raises(TypeError, match=context):
+        cell.clone(clone_material="hi")
+    # the context is only added once
+    with pytest.raises(TypeError) as excinfo:
+        cell.clone(clone_material="hi")
+    assert excinfo.value.args[0].count("imp:n,p=1") == 1
+    # objects not from a file
+    with pytest.raises(TypeError, match="from an unknown file"):
+        montepy.Cell().material = "hi"
+    assert type(cell).clone.__name__ == "clone"
+    assert type(cell).material.fget.__name__ == "material"
+
+
 def test_leading_comments(simple_problem):
     cell = copy.deepcopy(simple_problem.cells[1])
     leading_comments = cell.leading_comments
@@ -1087,6 +1194,46 @@ def test_wrap_warning(simple_problem):
     assert len(output) == 1
 
 
+@pytest.mark.parametrize(
+    "line",
+    [
+        "",
+        "   ",
+        "1 2 3",
+        "h" * 122,
+        "h" * 123,
+        "h" * 300,
+        "1 -2 " * 40,
+        "imp:n=1  " * 20 + "h" * 200,
+        "1e-5 " * 30,
+        "c a well-known " * 10,
+        "c -- " * 30,
+        "-" * 100 + "h" * 100,
+        "h" * 100 + "-" * 100,
+        "1\t2\t3 " * 20,
+    ],
+)
+@pytest.mark.parametrize("is_first_line", [True, False])
+@pytest.mark.parametrize("version", [(6, 2, 0), (5, 1, 60)])
+@pytest.mark.filterwarnings("ignore::montepy.errors.LineExpansionWarning")
+def test_wrap_matches_textwrap(line, is_first_line, version):
+    import textwrap
+
+    width = montepy.constants.get_max_line_length(version)
+    wrapper = textwrap.TextWrapper(
+        width=width,
+        initial_indent="" if is_first_line else " " * 5,
+        subsequent_indent=" " * 5,
+        drop_whitespace=False,
+    )
+    expected = [s for s in wrapper.wrap(line) if s.strip()]
+    output = montepy.mcnp_object.MCNP_Object.wrap_string_for_mcnp(
+        line, version, is_first_line
+    )
+    assert output == expected
+    assert all(len(s) <= width for s in output)
+
+
 def test_expansion_warning_crash(simple_problem):
     problem = copy.deepcopy(simple_problem)
     cell = problem.cells[99]
@@ -1099,6 +1246,211 @@ def test_expansion_warning_crash(simple_problem):
             problem.write_problem(fh)
 
 
+def test_expansion_warning_line(simple_problem):
+    problem = copy.deepcopy(simple_problem)
+    problem.cells[3].mass_density = 123456789.0
+    with io.StringIO() as fh:
+        with pytest.warns(montepy.errors.LineExpansionWarning) as record:
+            problem.write_problem(fh)
+        lines = fh.getvalue().splitlines()
+    assert len(record) == 1
+    message = record[0].message.message
+    line_number = int(message.split("Line ")[1].split()[0])
+    assert lines[line_number - 1] == "3 3 -123456789"
+    assert f"{line_number:5g}| 3 3 -123456789" in message
+
+
+def _write_to_string(problem):
+    with io.StringIO() as fh:
+        problem.write_problem(fh)
+        return fh.getvalue()
+
+
+def _set_geometry(problem):
+    surfs = problem.surfaces
+    problem.cells[3].geometry = -surfs[1015] & +surfs[1020]
+
+
+def _change_geometry_in_place(problem):
+    geometry = problem.cells[2].geometry
+    problem.write_problem(io.StringIO())
+    geometry.right.side = not geometry.right.side
+
+
+def _change_new_geometry_in_place(problem):
+    geometry = problem.cells[3].geometry
+    geometry.left = -problem.surfaces[1000]
+    problem.write_problem(io.StringIO())
+    geometry.left.side = True
+
+
+def _change_fraction_in_place(problem):
+    with pytest.warns(DeprecationWarning):
+        components = problem.materials[2].material_components
+    problem.write_problem(io.StringIO())
+    next(iter(components.values())).fraction = 50.0
+
+
+def _change_library_in_place(problem):
+    with pytest.warns(DeprecationWarning):
+        isotope = next(iter(problem.materials[2].material_components))
+    problem.write_problem(io.StringIO())
+    isotope.library = "70c"
+
+
+@pytest.mark.parametrize(
+    "edit",
+    [
+        lambda problem: None,
+        lambda problem: setattr(problem.cells[3], "mass_density", 5.0),
+        lambda problem: setattr(problem.cells[3], "material", problem.materials[2]),
+        lambda problem: setattr(problem.materials[1], "number", 50),
+        lambda problem: setattr(problem.surfaces[1010], "number", 1011),
+        lambda problem: problem.renumber(surfaces=5),
+        lambda problem: setattr(problem.cells[5].importance, "neutron", 2.0),
+        lambda problem: setattr(problem.cells[1], "universe", problem.universes[0]),
+        lambda problem: setattr(problem.universes[350], "number", 351),
+        lambda problem: problem.print_in_data_block.__setitem__("imp", True),
+        lambda problem: problem.print_in_data_block.__setitem__("vol", False),
+        lambda problem: setattr(problem.surfaces[1020], "location", 12.0),
+        lambda problem: setattr(problem.cells[5].fill.transform, "is_in_degrees", True),
+        lambda problem: setattr(
+            problem.materials[3].thermal_scattering,
+            "thermal_scattering_laws",
+            ["lwtr.20t"],
+        ),
+        lambda problem: problem.materials[3].thermal_scattering.add_scattering_law(
+            "lwtr.20t"
+        ),
+        lambda problem: setattr(problem, "mcnp_version", (5, 1, 60)),
+        lambda problem: setattr(problem.cells[2], "leading_comments", []),
+        _set_geometry,
+        _change_geometry_in_place,
+        _change_new_geometry_in_place,
+        _change_fraction_in_place,
+        _change_library_in_place,
+    ],
+)
+@pytest.mark.filterwarnings("ignore::montepy.errors.LineExpansionWarning")
+def test_rewrite_after_edit(simple_problem, edit, monkeypatch):
+    problem = copy.deepcopy(simple_problem)
+    _write_to_string(problem)
+    edit(problem)
+    output = _write_to_string(problem)
+    # nothing is reused when every key is new.
+    monkeypatch.setattr(
+        montepy.mcnp_object.MCNP_Object, "_format_key", lambda self, version: object()
+    )
+    assert output == _write_to_string(problem)
+
+
+def _change_operator_in_place(problem):
+    geometry = problem.cells[3].geometry
+    problem.write_problem(io.StringIO())
+    geometry.operator = montepy.Operator.UNION
+    return problem.cells[3]
+
+
+def _change_fraction_only(problem):
+    with pytest.warns(DeprecationWarning):
+        components = problem.materials[2].material_components
+    problem.write_problem(io.StringIO())
+    next(iter(components.values())).fraction = 5.0
+    return problem.materials[2]
+
+
+def _change_thermal_scattering_only(problem):
+    problem.write_problem(io.StringIO())
+    problem.materials[3].thermal_scattering.add_scattering_law("lwtr.20t")
+    return problem.materials[3]
+
+
+@pytest.mark.parametrize(
+    "edit",
+    [_change_operator_in_place, _change_fraction_only, _change_thermal_scattering_only],
+)
+def test_rewrite_helper_edit_reuses_lines(simple_problem, edit):
+    problem = copy.deepcopy(simple_problem)
+    changed = edit(problem)
+    objects = list(problem.cells) + list(problem.materials)
+    caches = {id(obj): obj._format_cache for obj in objects}
+    _write_to_string(problem)
+    # only the owner of the helper is formatted again
+    for obj in objects:
+        if obj is changed:
+            assert obj._format_cache is not caches[id(obj)]
+        else:
+            assert obj._format_cache is caches[id(obj)]
+
+
+def test_rewrite_reuses_lines(simple_problem):
+    problem = copy.deepcopy(simple_problem)
+    _write_to_string(problem)
+    caches = {cell.number: cell._format_cache for cell in problem.cells}
+    problem.cells[3].mass_density = 5.0
+    output = _write_to_string(problem)
+    for cell in problem.cells:
+        if cell.number == 3:
+            assert cell._format_cache is not caches[cell.number]
+        else:
+            assert cell._format_cache is caches[cell.number]
+    assert "3 3 -5" in output
+
+
+def _write_with_warnings(problem, workers):
+    with io.StringIO() as fh:
+        with pytest.warns(montepy.errors.LineExpansionWarning) as record:
+            problem.write_problem(fh, workers=workers)
+        return fh.getvalue(), [str(warning.message) for warning in record]
+
+
+@pytest.mark.parametrize("workers", [2, 3])
+def test_write_in_workers(simple_problem, workers):
+    problem = copy.deepcopy(simple_problem)
+    problem.renumber(cells=100, surfaces=5)
+    for cell in problem.cells:
+        cell.importance.neutron = 3.0
+    problem.print_in_data_block["imp"] = True
+    output, record = _write_with_warnings(problem, workers)
+    assert (output, record) == _write_with_warnings(problem, 1)
+    assert "101 1 20" in output
+
+
+@pytest.mark.filterwarnings("ignore::montepy.errors.LineExpansionWarning")
+def test_write_in_workers_keeps_lines(simple_problem):
+    problem = copy.deepcopy(simple_problem)
+    problem.write_problem(io.StringIO(), workers=2)
+    # the lines formatted in the workers are reused here
+    caches = {id(cell): cell._format_cache for cell in problem.cells}
+    assert all(cache is not None for cache in caches.values())
+    _write_to_string(problem)
+    for cell in problem.cells:
+        assert cell._format_cache is caches[id(cell)]
+    # the workers write the objects they are given
+    sequence = [problem.title, None] + list(problem.surfaces)
+    with io.StringIO() as fh:
+        problem._write_to_stream(
+            montepy.input_parser.input_file.MCNP_InputFile.from_open_stream(fh),
+            2,
+            sequence=sequence,
+        )
+        output = fh.getvalue().splitlines()
+    assert output[0] == problem.title.title
+    assert output[2:4] == ["C surfaces", "1000 SO 1"]
+    assert len(output) == 2 + sum(
+        len(surface.format_for_mcnp_input(problem.mcnp_version))
+        for surface in problem.surfaces
+    )
+
+
+@pytest.mark.parametrize(
+    "workers, error", [(0, ValueError), (-1, ValueError), (2.0, TypeError)]
+)
+def test_write_bad_workers(simple_problem, workers, error):
+    with pytest.raises(error):
+        simple_problem.write_problem(io.StringIO(), workers=workers)
+
+
 def test_alternate_encoding():
     with pytest.raises(UnicodeDecodeError):
         montepy.read_input(
@@ -1166,3 +1518,284 @@ def test_read_write_cycle(file):
                     )
                 else:
                     raise e
+
+
+def _edit_densities(problem, density):
+    for cell in problem.cells:
+        if cell.material is not None:
+            cell.atom_density = density
+            return
+
+
+@pytest.mark.filterwarnings("ignore::montepy.errors.LineExpansionWarning")
+def test_write_patch(simple_problem, tmp_path):
+    problem = copy.deepcopy(simple_problem)
+    base = tmp_path / "base.imcnp"
+    patched = tmp_path / "patched.imcnp"
+    full = tmp_path / "full.imcnp"
+    problem.write_problem(base)
+    problem.cells[3].number = 30
+    for density in [0.5, 0.25]:
+        _edit_densities(problem, density)
+        problem.write_patch(patched, overwrite=True)
+        problem.write_problem(full, overwrite=True)
+        assert patched.read_bytes() == full.read_bytes()
+        assert f"{density}" in patched.read_text()
+        # chain the patches
+        problem.write_patch(patched, overwrite=True)
+    new_problem = montepy.read_input(patched)
+    assert new_problem.cells[30].number == 30
+    with pytest.raises(FileExistsError):
+        problem.write_patch(full)
+
+
+def _add_thermal_scattering_law(problem):
+    problem.materials[3].thermal_scattering.add_scattering_law("lwtr.20t")
+
+
+def _set_thermal_scattering_laws(problem):
+    problem.materials[3].thermal_scattering.thermal_scattering_laws = ["grph.20t"]
+
+
+def _change_fraction(problem):
+    with pytest.warns(DeprecationWarning):
+        components = problem.materials[2].material_components
+    next(iter(components.values())).fraction = 50.0
+
+
+@pytest.mark.filterwarnings("ignore::montepy.errors.LineExpansionWarning")
+@pytest.mark.parametrize(
+    "edit",
+    [
+        _add_thermal_scattering_law,
+        _set_thermal_scattering_laws,
+        _change_fraction,
+        lambda problem: setattr(problem.cells[5].importance, "neutron", 2.0),
+        lambda problem: setattr(problem.cells[2].geometry.right, "side", True),
+    ],
+)
+def test_write_patch_helper_edits(simple_problem, tmp_path, edit):
+    problem = copy.deepcopy(simple_problem)
+    problem.write_problem(tmp_path / "base.imcnp")
+    edit(problem)
+    problem.write_patch(tmp_path / "patched.imcnp")
+    problem.write_problem(tmp_path / "full.imcnp")
+    assert (tmp_path / "patched.imcnp").read_text() == (
+        tmp_path / "full.imcnp"
+    ).read_text()
+
+
+@pytest.mark.filterwarnings("ignore::montepy.errors.LineExpansionWarning")
+def test_write_patch_in_place(simple_problem, tmp_path):
+    problem = copy.deepcopy(simple_problem)
+    base = tmp_path / "base.imcnp"
+    full = tmp_path / "full.imcnp"
+    problem.write_problem(base)
+    _edit_densities(problem, 0.5)
+    problem.write_patch(base, overwrite=True)
+    problem.write_problem(full)
+    assert base.read_bytes() == full.read_bytes()
+    assert [path.name for path in tmp_path.iterdir()] == ["base.imcnp", "full.imcnp"]
+
+
+@pytest.mark.filterwarnings("ignore::montepy.errors.LineExpansionWarning")
+@pytest.mark.parametrize("copier", ["missing", "unsupported"])
+def test_write_patch_without_copy_file_range(
+    simple_problem, tmp_path, monkeypatch, copier
+):
+    def unsupported(*args):
+        raise OSError("copy_file_range isn't supported")
+
+    if copier == "missing":
+        monkeypatch.delattr(os, "copy_file_range", raising=False)
+    else:
+        monkeypatch.setattr(os, "copy_file_range", unsupported, raising=False)
+    problem = copy.deepcopy(simple_problem)
+    problem.write_problem(tmp_path / "base.imcnp")
+    _edit_densities(problem, 0.5)
+    problem.write_patch(tmp_path / "patched.imcnp")
+    problem.write_problem(tmp_path / "full.imcnp")
+    assert (tmp_path / "patched.imcnp").read_bytes() == (
+        tmp_path / "full.imcnp"
+    ).read_bytes()
+
+
+@pytest.mark.filterwarnings("ignore::montepy.errors.LineExpansionWarning")
+def test_write_patch_full_write(simple_problem, tmp_path):
+    problem = copy.deepcopy(simple_problem)
+    # never written
+    problem.write_patch(tmp_path / "first.imcnp")
+    problem.write_problem(tmp_path / "full.imcnp")
+    assert (tmp_path / "first.imcnp").read_bytes() == (
+        tmp_path / "full.imcnp"
+    ).read_bytes()
+    # the last file was changed
+    with open(tmp_path / "full.imcnp", "a") as fh:
+        fh.write("c changed\n")
+    problem.write_patch(tmp_path / "second.imcnp")
+    assert (tmp_path / "second.imcnp").read_bytes() == (
+        tmp_path / "first.imcnp"
+    ).read_bytes()
+    with pytest.raises(TypeError):
+        problem.write_patch(io.StringIO())
+
+
+def _make_tree(directory):
+    files = {
+        "top.imcnp": """A tree
+1 1 -1.0 -1 imp:n=1
+read file=sub/cells.imcnp
+3 0 1 imp:n=0
+
+1 so 1.0
+read file=surfs.imcnp
+
+m1 1001.80c 1.0
+read file=sub/data.imcnp
+""",
+        "sub/cells.imcnp": "2 1 -2.0 1 -2 imp:n=1\n",
+        "surfs.imcnp": "2 so 2.0\n",
+        "sub/data.imcnp": "m2 8016.80c 1.0\nmode n\n",
+    }
+    for name, contents in files.items():
+        path = directory / name
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(contents)
+    return files
+
+
+def test_write_tree(tmp_path):
+    files = _make_tree(tmp_path / "in")
+    top = tmp_path / "in" / "top.imcnp"
+    problem = montepy.read_input(top)
+    assert problem.write_tree(top, overwrite=True) == []
+    out = tmp_path / "out" / "top.imcnp"
+    written = problem.write_tree(out)
+    assert written == [str(tmp_path / "out" / name) for name in files]
+    for name, contents in files.items():
+        assert (tmp_path / "out" / name).read_text() == contents
+    problem.cells[2].mass_density = 3.0
+    assert problem.write_tree(out, overwrite=True) == [
+        str(tmp_path / "out" / "sub" / "cells.imcnp")
+    ]
+    assert "-3.0" in (tmp_path / "out" / "sub" / "cells.imcnp").read_text()
+    assert problem.write_tree(out, overwrite=True) == []
+    # the data block cell modifiers are printed in the top file
+    problem.print_in_data_block["imp"] = True
+    problem.cells[2].importance.neutron = 2.0
+    assert problem.write_tree(out, overwrite=True) == [
+        str(out),
+        str(tmp_path / "out" / "sub" / "cells.imcnp"),
+    ]
+    new_problem = montepy.read_input(out)
+    assert [cell.number for cell in new_problem.cells] == [1, 3, 2]
+    assert new_problem.cells[2].mass_density == 3.0
+    assert new_problem.cells[2].importance.neutron == 2.0
+    assert [surf.number for surf in new_problem.surfaces] == [1, 2]
+    assert [mat.number for mat in new_problem.materials] == [1, 2]
+
+
+def test_write_tree_thermal_scattering(tmp_path):
+    _make_tree(tmp_path / "in")
+    data = tmp_path / "in" / "sub" / "data.imcnp"
+    data.write_text("m2 1001.80c 1.0\nmt2 lwtr.20t\nmode n\n")
+    top = tmp_path / "in" / "top.imcnp"
+    problem = montepy.read_input(top)
+    problem.materials[2].thermal_scattering.add_scattering_law("grph.20t")
+    # the file that was read is changed in place
+    assert problem.write_tree(top, overwrite=True) == [str(data)]
+    new_problem = montepy.read_input(top)
+    assert new_problem.materials[2].thermal_scattering.thermal_scattering_laws == [
+        "lwtr.20t",
+        "grph.20t",
+    ]
+    out = tmp_path / "out" / "top.imcnp"
+    problem.write_tree(out)
+    problem.materials[2].thermal_scattering.thermal_scattering_laws = ["poly.20t"]
+    assert problem.write_tree(out, overwrite=True) == [
+        str(tmp_path / "out" / "sub" / "data.imcnp")
+    ]
+    assert "poly.20t" in (tmp_path / "out" / "sub" / "data.imcnp").read_text()
+
+
+def test_write_tree_moves_read(tmp_path):
+    _make_tree(tmp_path)
+    top = tmp_path / "top.imcnp"
+    problem = montepy.read_input(top)
+    del problem.cells[1]
+    cell = montepy.Cell()
+    cell.number = 4
+    cell.geometry = +problem.surfaces[2]
+    cell.importance.neutron = 0.0
+    problem.cells.append(cell)
+    problem.surfaces[2].number = 5
+    out = tmp_path / "out" / "top.imcnp"
+    assert len(problem.write_tree(out)) == 4
+    lines = out.read_text().splitlines()
+    assert lines[1] == "read file=sub/cells.imcnp"
+    assert lines[2].startswith("3 0")
+    assert lines[3].startswith("4 0")
+    assert "5 SO 2.0" in (tmp_path / "out" / "surfs.imcnp").read_text()
+    new_problem = montepy.read_input(out)
+    assert [cell.number for cell in new_problem.cells] == [3, 4, 2]
+    assert new_problem.cells[2].geometry.right.divider.number == 5
+
+
+def test_write_tree_guardrails(tmp_path):
+    _make_tree(tmp_path / "in")
+    problem = montepy.read_input(tmp_path / "in" / "top.imcnp")
+    (tmp_path / "out").mkdir()
+    (tmp_path / "out" / "surfs.imcnp").write_text("")
+    with pytest.raises(FileExistsError):
+        problem.write_tree(tmp_path / "out" / "top.imcnp")
+    # nothing is written if any file can't be
+    assert [path.name for path in (tmp_path / "out").iterdir()] == ["surfs.imcnp"]
+    with pytest.raises(TypeError):
+        problem.write_tree(io.StringIO())
+    # problems without READ inputs are written in one file
+    problem = montepy.read_input("tests/inputs/test.imcnp")
+    assert problem.write_tree(tmp_path / "flat.imcnp") == [str(tmp_path / "flat.imcnp")]
+    problem.write_problem(tmp_path / "full.imcnp")
+    assert (tmp_path / "flat.imcnp").read_text() == (
+        tmp_path / "full.imcnp"
+    ).read_text()
+
+
+@pytest.mark.parametrize("extension", [".gz", ".bz2", ".xz"])
+def test_compressed_problem(tmp_path, extension):
+    problem = montepy.read_input("tests/inputs/test.imcnp")
+    out = tmp_path / f"out.imcnp{extension}"
+    problem.write_problem(out)
+    problem.write_problem(tmp_path / "plain.imcnp")
+    new_problem = montepy.read_input(out)
+    with io.StringIO() as fh:
+        new_problem.write_problem(fh)
+        assert fh.getvalue() == (tmp_path / "plain.imcnp").read_text()
+    # the last file written can't be patched in place when it's compressed
+    problem.cells[1].mass_density = 3.0
+    problem.write_patch(out, overwrite=True)
+    assert montepy.read_input(out).cells[1].mass_density == 3.0
+    problem.write_problem(tmp_path / "plain.imcnp", overwrite=True)
+    problem.write_patch(tmp_path / f"patched.imcnp{extension}")
+    assert montepy.read_input(tmp_path / f"patched.imcnp{extension}").cells[
+        1
+    ].mass_density == pytest.approx(3.0)
+
+
+def test_compressed_read_target(tmp_path):
+    import gzip
+
+    _make_tree(tmp_path / "in")
+    surfs = tmp_path / "in" / "surfs.imcnp"
+    with open(surfs, "rb") as fh, gzip.open(f"{surfs}.gz", "wb") as out:
+        out.write(fh.read())
+    os.remove(surfs)
+    problem = montepy.read_input(tmp_path / "in" / "top.imcnp")
+    assert [surf.number for surf in problem.surfaces] == [1, 2]
+    problem.surfaces[2].number = 5
+    out = tmp_path / "out" / "top.imcnp"
+    assert str(tmp_path / "out" / "surfs.imcnp.gz") in problem.write_tree(out)
+    with gzip.open(tmp_path / "out" / "surfs.imcnp.gz", "rt") as fh:
+        assert "5 SO 2.0" in fh.read()
+    new_problem = montepy.read_input(out)
+    assert [surf.number for surf in new_problem.surfaces] == [1, 5]
@@ -1,4 +1,7 @@
 # Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
+import copy
+import io
+import pickle
 import pytest
 
 import montepy
@@ -47,3 +50,164 @@ def test_problem_clone(problem):
         ):
             assert old_obj is not new_obj
             assert new_obj._problem is new_problem
+
+
+@pytest.mark.filterwarnings("ignore::montepy.errors.LineExpansionWarning")
+@pytest.mark.parametrize(
+    "path",
+    [
+        "tests/inputs/test.imcnp",
+        "tests/inputs/test_importance.imcnp",
+        "tests/inputs/test_universe_data.imcnp",
+    ],
+)
+def test_problem_clone_copy_on_write_unchanged(path):
+    problem = montepy.read_input(path)
+    new_problem = problem.clone(copy_on_write=True)
+    assert new_problem.cells is not problem.cells
+    assert _write_to_string(new_problem).read() == _write_to_string(problem).read()
+    # the cells aren't copied by writing
+    for old_cell, new_cell in zip(
+        problem.cells._objects.values(), new_problem.cells._objects.values()
+    ):
+        assert old_cell is new_cell
+
+
+@pytest.mark.filterwarnings("ignore::montepy.errors.LineExpansionWarning")
+def test_problem_clone_copy_on_write_edits(problem_path):
+    problem = montepy.read_input(problem_path)
+    gold = _write_to_string(problem).read()
+    new_problem = problem.clone(copy_on_write=True)
+    full_problem = problem.clone()
+    for clone in (new_problem, full_problem):
+        cell = clone.cells[2]
+        cell.number = 20
+        cell.material.number = 20
+        cell.atom_density = 0.5
+        clone.surfaces[1005].number = 1007
+        clone.cells.allow_mcnp_volume_calc = True
+    assert _write_to_string(problem).read() == gold
+    assert _write_to_string(new_problem).read() == _write_to_string(full_problem).read()
+    cell = new_problem.cells[20]
+    assert cell is not problem.cells[2]
+    assert cell._problem is new_problem
+    assert 2 not in new_problem.cells.numbers
+    assert problem.cells[2].number == 2
+    assert not problem.cells.allow_mcnp_volume_calc
+    # the objects linked to a copy are copied with it
+    assert cell.material is new_problem.materials[20]
+    assert problem.materials[2].number == 2
+    assert [c.number for c in new_problem.materials[20].cells] == [20]
+    assert 1007 in new_problem.surfaces.numbers
+    assert 1005 in problem.surfaces.numbers
+    # the cells linked to a copy are found
+    assert 1 in [c.number for c in new_problem.surfaces[1000].cells]
+    assert new_problem.cells[1] in new_problem.cells
+    # getting the data inputs copies them
+    old_ids = {id(data_input) for data_input in problem.data_inputs}
+    for data_input in new_problem.data_inputs:
+        assert id(data_input) not in old_ids
+    assert new_problem.cells._volume is new_problem.data_inputs[-1]
+
+
+@pytest.mark.filterwarnings("ignore::montepy.errors.LineExpansionWarning")
+@pytest.mark.parametrize(
+    "path",
+    ["tests/inputs/test.imcnp", "tests/inputs/test_importance.imcnp"],
+)
+def test_problem_clone_copy_on_write_snapshot(path):
+    problem = montepy.read_input(path)
+    gold = _write_to_string(problem).read()
+    importance = problem.cells[2].importance
+    with pytest.warns(DeprecationWarning):
+        component = next(iter(problem.materials[1].material_components.values()))
+    volume_calc = problem.cells.allow_mcnp_volume_calc
+    new_problem = problem.clone(copy_on_write=True)
+    clone_of_clone = new_problem.clone(copy_on_write=True)
+    importance.neutron = 9.0
+    problem.materials[1].number = 88
+    component.fraction = 0.5
+    problem.surfaces[1000].number = 1999
+    problem.cells.allow_mcnp_volume_calc = not volume_calc
+    problem.cells[3].geometry &= -problem.surfaces[1999]
+    assert _write_to_string(problem).read() != gold
+    # the changes to the problem don't show up in its clones
+    for clone in (new_problem, clone_of_clone):
+        assert _write_to_string(clone).read() == gold
+        assert clone.cells[2].importance.neutron == 1.0
+        assert clone.materials[1].cells
+        assert 1000 in clone.surfaces.numbers
+        assert clone.cells.allow_mcnp_volume_calc == volume_calc
+
+
+@pytest.mark.filterwarnings("ignore::montepy.errors.LineExpansionWarning")
+def test_problem_clone_copy_on_write_copy(problem_path, tmp_path):
+    problem = montepy.read_input(problem_path)
+    new_problem = problem.clone(copy_on_write=True)
+    new_problem.cells[3].number = 30
+    gold = _write_to_string(new_problem).read()
+    assert _write_to_string(copy.deepcopy(new_problem)).read() == gold
+    assert _write_to_string(pickle.loads(pickle.dumps(new_problem))).read() == gold
+    # the unchanged inputs are copied from the file this problem was written to
+    problem.write_problem(tmp_path / "base.imcnp")
+    new_problem = problem.clone(copy_on_write=True)
+    new_problem.cells[3].number = 30
+    new_problem.write_patch(tmp_path / "patched.imcnp")
+    assert (tmp_path / "patched.imcnp").read_text() == gold
+    with pytest.raises(TypeError):
+        problem.clone(copy_on_write=1)
+
+
+def test_problem_renumber(problem_path):
+    problem = montepy.read_input(problem_path)
+    cells = list(problem.cells)
+    surfaces = list(problem.surfaces)
+    problem.renumber(
+        cells=10000, surfaces="compact", materials={1: 7, 2: 1}, transforms=5
+    )
+    assert list(problem.cells.numbers) == [10001, 10002, 10003, 10099, 10005]
+    for cell in cells:
+        assert problem.cells[cell.number] is cell
+    assert 1 not in problem.cells
+    assert list(problem.surfaces.numbers) == [1, 2, 3, 4, 5, 6]
+    assert problem.surfaces[1] is surfaces[0]
+    assert cells[0].surfaces[1] is surfaces[0]
+    assert list(problem.materials.numbers) == [7, 1, 3]
+    # the references are written with the new numbers
+    new_problem = problem.clone()
+    with pytest.warns(montepy.errors.LineExpansionWarning):
+        cell = montepy.read_input(_write_to_string(new_problem)).cells[10005]
+    assert cell.complements[10099]
+    # compact starts from the collection's starting number
+    problem.cells.starting_number = 10
+    problem.cells.step = 5
+    problem.renumber(cells="compact")
+    assert list(problem.cells.numbers) == [10, 15, 20, 30, 25]
+
+
+def _write_to_string(problem):
+    stream = io.StringIO()
+    problem.write_problem(stream)
+    stream.seek(0)
+    return stream
+
+
+@pytest.mark.parametrize(
+    "kwargs, error",
+    [
+        ({"cells": "foo"}, ValueError),
+        ({"cells": 1.5}, TypeError),
+        ({"cells": True}, TypeError),
+        ({"cells": -10}, ValueError),
+        ({"cells": {1: "a"}}, TypeError),
+        ({"cells": {1000: 5}}, KeyError),
+        ({"cells": {1: 2}}, montepy.errors.NumberConflictError),
+        ({"cells": 1, "surfaces": {1000: 1005}}, montepy.errors.NumberConflictError),
+    ],
+)
+def test_problem_renumber_bad(problem_path, kwargs, error):
+    problem = montepy.read_input(problem_path)
+    with pytest.raises(error):
+        problem.renumber(**kwargs)
+    # nothing is renumbered if anything is wrong
+    assert list(problem.cells.numbers) == [1, 2, 3, 99, 5]
@@ -2,6 +2,8 @@
 import hypothesis
 from hypothesis import given, settings, strategies as st
 import copy
+import gc
+import numpy as np
 import montepy
 import montepy.cells
 from montepy.errors import NumberConflictError
@@ -142,6 +144,39 @@ class TestNumberedObjectCollection(unittest.TestCase):
             cells.request_number("5")
         with self.assertRaises(TypeError):
             cells.request_number(1, "5")
+        with self.assertRaises(ValueError):
+            cells.request_number(1, 0)
+
+    def test_reserve_numbers(self):
+        cells = copy.deepcopy(self.simple_problem.cells)
+        self.assertEqual(cells.reserve_numbers(2), range(6, 8))
+        self.assertEqual(cells.request_number(1), 4)
+        self.assertEqual(cells.reserve_numbers(3, 1, 2), range(9, 15, 2))
+        self.assertEqual(cells.request_number(7, 2), 15)
+        self.assertEqual(cells.reserve_numbers(2, 98), range(100, 102))
+        self.assertEqual(cells.next_number(), 102)
+        # adding an object with a reserved number uses up the reservation
+        cell = copy.deepcopy(cells[1])
+        cell.number = 6
+        cells.append(cell)
+        cells.release_numbers([6, 7, 100, 101, 1000])
+        self.assertEqual(cells.request_number(6), 7)
+        self.assertEqual(cells.next_number(), 100)
+        cell.number = 9
+        cells.release_numbers(range(9, 15, 2))
+        self.assertEqual(cells.request_number(6), 6)
+        self.assertEqual(cells.request_number(7, 2), 7)
+        self.assertEqual(cells.request_number(9, 2), 11)
+        with self.assertRaises(TypeError):
+            cells.reserve_numbers("1")
+        with self.assertRaises(TypeError):
+            cells.reserve_numbers(1, "1")
+        with self.assertRaises(TypeError):
+            cells.reserve_numbers(1, 1, "1")
+        with self.assertRaises(ValueError):
+            cells.reserve_numbers(0)
+        with self.assertRaises(ValueError):
+            cells.reserve_numbers(1, 1, 0)
 
     def test_next_number(self):
         cells = self.simple_problem.cells
@@ -346,6 +381,22 @@ def test_data_append(cp_simple_problem):
     assert prob.data_inputs.count(new_mat) == 1
 
 
+def test_data_extend(cp_simple_problem):
+    prob = cp_simple_problem
+    data_len = len(prob.data_inputs)
+    last_mat = list(prob.materials)[-1]
+    new_mats = []
+    for number in [50, 51]:
+        new_mat = copy.deepcopy(last_mat)
+        new_mat.number = number
+        new_mats.append(new_mat)
+    prob.materials.extend(new_mats)
+    index = prob.data_inputs.index(new_mats[0])
+    assert prob.data_inputs[index : index + 2] == new_mats
+    assert len(prob.data_inputs) == data_len + 2
+    assert list(prob.materials)[-2:] == new_mats
+
+
 def test_data_append_renumber(cp_simple_problem):
     prob = cp_simple_problem
     new_mat = copy.deepcopy(next(iter(prob.materials)))
@@ -391,6 +442,35 @@ def test_data_pop(cp_simple_problem):
         cp_simple_problem.materials.pop("foo")
 
 
+def test_data_remove_identity(cp_simple_problem):
+    prob = cp_simple_problem
+    mats = list(prob.materials)
+    # an equal data input that isn't in the collection is kept
+    twin = copy.deepcopy(mats[0])
+    prob.data_inputs.insert(0, twin)
+    prob.materials.remove(mats[0])
+    assert prob.data_inputs[0] is twin
+    assert not any(data_input is mats[0] for data_input in prob.data_inputs)
+    popped = prob.materials.pop()
+    assert popped is mats[-1]
+    assert prob.materials._last_index is None
+    assert not any(data_input is popped for data_input in prob.data_inputs)
+    # new objects are still added right after the last object
+    new_mat = copy.deepcopy(mats[1])
+    new_mat.number = 50
+    prob.materials.append(new_mat)
+    index = prob.materials._last_index
+    assert prob.data_inputs[index] is new_mat
+    assert prob.data_inputs[index - 1] is mats[-2]
+    prob.materials.clear()
+    assert prob.data_inputs[0] is twin
+    assert not any(
+        data_input is mat for data_input in prob.data_inputs for mat in mats + [new_mat]
+    )
+    with pytest.raises(ValueError):
+        prob._remove_data_input(new_mat)
+
+
 # disable function scoped fixtures
 @settings(suppress_health_check=[hypothesis.HealthCheck.function_scoped_fixture])
 @given(start_num=st.integers(), step=st.integers())
@@ -437,3 +517,289 @@ def test_num_collect_clone_bad(cp_simple_problem, args, error):
     surfs = cp_simple_problem.surfaces
     with pytest.raises(error):
         surfs.clone(*args)
+
+
+@pytest.mark.parametrize(
+    "collection, numbers",
+    [
+        ("cells", range(100, 110)),
+        ("surfaces", [50, 70, 60]),
+        ("materials", range(20, 25)),
+        ("universes", [7, 8]),
+    ],
+)
+def test_num_collect_create_many(cp_simple_problem, collection, numbers):
+    collection = getattr(cp_simple_problem, collection)
+    old_len = len(collection)
+    new_objs = collection.create_many(numbers)
+    assert len(collection) == old_len + len(numbers)
+    assert [obj.number for obj in new_objs] == list(numbers)
+    for obj in new_objs:
+        assert isinstance(obj, collection._obj_class)
+        assert collection[obj.number] is obj
+        assert obj._problem is cp_simple_problem
+    if isinstance(collection, montepy.materials.Materials):
+        for obj in new_objs:
+            assert cp_simple_problem.data_inputs.count(obj) == 1
+
+
+def test_num_collect_create_many_format(cp_simple_problem):
+    problem = cp_simple_problem
+    surf = problem.surfaces[1000]
+    new_cells = problem.cells.create_many(range(100, 103))
+    for cell in new_cells:
+        cell.geometry = -surf
+        cell.importance.neutron = 1.0
+    output = problem.cells[101].format_for_mcnp_input((6, 2, 0))
+    assert output[0].split()[:3] == ["101", "0", "-1000"]
+    assert gc.isenabled()
+
+
+@pytest.mark.parametrize(
+    "numbers, error",
+    [
+        ([1], NumberConflictError),
+        ([100, 100], NumberConflictError),
+        (["a"], TypeError),
+        ([-1], ValueError),
+    ],
+)
+def test_num_collect_create_many_bad(cp_simple_problem, numbers, error):
+    cells = cp_simple_problem.cells
+    old_len = len(cells)
+    with pytest.raises(error):
+        cells.create_many(numbers)
+    assert len(cells) == old_len
+    assert gc.isenabled()
+
+
+@settings(max_examples=50, deadline=None)
+@given(
+    ops=st.lists(
+        st.tuples(
+            st.sampled_from(
+                ["append", "renumber", "remove", "pop", "delete", "get", "request"]
+            ),
+            st.integers(0, 30),
+            st.integers(0, 30),
+        ),
+        max_size=60,
+    ),
+    linked=st.booleans(),
+)
+def test_num_collect_index_consistent(ops, linked):
+    problem = montepy.MCNP_Problem("")
+    surfs = problem.surfaces if linked else montepy.surface_collection.Surfaces()
+    # a plain list that is searched by brute force
+    expected = []
+    for op, pos, number in ops:
+        if op == "append":
+            surf = montepy.surfaces.surface.Surface()
+            surf.number = number
+            if any(other.number == number for other in expected):
+                with pytest.raises(NumberConflictError):
+                    surfs.append(surf)
+                continue
+            surfs.append(surf)
+            expected.append(surf)
+        elif op == "request":
+            step = pos % 4 + 1
+            used = {other.number for other in expected}
+            free = number
+            while free in used:
+                free += step
+            assert surfs.request_number(number, step) == free
+            if expected:
+                assert surfs.next_number(step) == max(used) + step
+        elif not expected:
+            continue
+        else:
+            obj = expected[pos % len(expected)]
+            if op == "renumber":
+                if linked and any(other.number == number for other in expected):
+                    continue
+                obj.number = number
+            elif op == "remove":
+                surfs.remove(obj)
+                # surfaces with the same number are equal, so remove it by identity
+                del expected[pos % len(expected)]
+                assert obj not in surfs
+                with pytest.raises(ValueError):
+                    surfs.remove(obj)
+            elif op == "pop":
+                assert surfs.pop() is expected.pop()
+            elif op == "delete":
+                del surfs[obj.number]
+                first = next(
+                    i for i, other in enumerate(expected) if other.number == obj.number
+                )
+                del expected[first]
+        assert list(surfs) == expected
+        assert len(surfs) == len(expected)
+        for test_num in range(31):
+            first = next(
+                (other for other in expected if other.number == test_num), None
+            )
+            assert surfs.get(test_num) is first
+        for surf in expected:
+            assert surf in surfs
+        assert [surf.number for surf in surfs[0:30]] == sorted(
+            {surf.number for surf in expected}
+        )
+
+
+def test_num_collect_contains_identity(cp_simple_problem):
+    surfs = cp_simple_problem.surfaces
+    surf = surfs[1000]
+    surf_copy = copy.deepcopy(surf)
+    assert surf_copy == surf
+    assert surf in surfs
+    assert surf_copy not in surfs
+    with pytest.raises(ValueError):
+        surfs.remove(surf_copy)
+    assert surfs[1000] is surf
+
+
+@settings(max_examples=100, deadline=None)
+@given(
+    numbers=st.sets(st.integers(1, 200), max_size=40),
+    start=st.one_of(st.none(), st.integers(0, 210)),
+    stop=st.one_of(st.none(), st.integers(0, 210)),
+    step=st.one_of(st.none(), st.integers(-50, 50).filter(lambda x: x != 0)),
+)
+def test_num_collect_slice(numbers, start, stop, step):
+    surfs = montepy.surface_collection.Surfaces()
+    surfs.create_many(sorted(numbers))
+    # checks every number in turn
+    rstep = step if step is not None else 1
+    if rstep < 0:
+        rstart = max(numbers, default=0) if start is None else start
+        rstop = (min(numbers, default=0) if stop is None else stop) - 1
+    else:
+        rstart = 0 if start is None else start
+        rstop = (max(numbers, default=0) if stop is None else stop) + 1
+    expected = [num for num in range(rstart, rstop, rstep) if num in numbers]
+    assert [surf.number for surf in surfs[start:stop:step]] == expected
+    # the index must stay up to date
+    surfs.append_renumber(montepy.surfaces.surface.Surface(), 7)
+    numbers = set(surfs.numbers)
+    assert [surf.number for surf in surfs[::-1]] == sorted(numbers, reverse=True)
+
+
+def test_num_collect_to_arrays(cp_simple_problem):
+    cells = cp_simple_problem.cells
+    arrays = cells.to_arrays(
+        ["number", "material", "atom_density", "importance.neutron", "universe"]
+    )
+    assert arrays["number"].tolist() == [1, 2, 3, 99, 5]
+    assert arrays["material"].tolist() == [1, 2, 3, 0, 0]
+    # cell 3 is in mass density, and the void cells have no density
+    np.testing.assert_array_equal(
+        arrays["atom_density"], [20.0, 8.0, np.nan, np.nan, np.nan]
+    )
+    assert arrays["importance.neutron"].tolist() == [1.0, 1.0, 1.0, 0.0, 3.0]
+    assert arrays["universe"].tolist() == [350, 0, 0, 0, 0]
+    with pytest.raises(ValueError):
+        arrays["number"][0] = 5
+    # cached until something changes
+    assert cells.to_arrays(["number"])["number"] is arrays["number"]
+    cells[2].atom_density = 1.5
+    assert cells.to_arrays(["atom_density"])["atom_density"][1] == 1.5
+    cells[2].material = None
+    assert cells.to_arrays(["material"])["material"][1] == 0
+    new_cell = montepy.Cell()
+    new_cell.number = 6
+    cells.append(new_cell)
+    assert cells.to_arrays(["number"])["number"].tolist() == [1, 2, 3, 99, 5, 6]
+    surfs = cp_simple_problem.surfaces.to_arrays(["surface_type", "location"])
+    assert surfs["surface_type"].tolist() == ["SO", "RCC", "SO", "CZ", "PZ", "PZ"]
+    np.testing.assert_array_equal(
+        surfs["location"], [np.nan, np.nan, np.nan, np.nan, 10.0, 15.0]
+    )
+    with pytest.raises(AttributeError):
+        cells.to_arrays(["foo"])
+    with pytest.raises(TypeError):
+        cells.to_arrays("number")
+    with pytest.raises(TypeError):
+        cells.to_arrays([1])
+
+
+def test_num_collect_set_arrays(cp_simple_problem):
+    cells = cp_simple_problem.cells
+    cells.set_arrays(
+        {
+            "importance.neutron": np.arange(5, dtype=float),
+            "material": [0, 1, 2, 3, 1],
+        }
+    )
+    assert [cell.importance.neutron for cell in cells] == [0.0, 1.0, 2.0, 3.0, 4.0]
+    assert cells[1].material is None
+    assert cells[99].material is cp_simple_problem.materials[3]
+    assert cells.to_arrays(["material"])["material"].tolist() == [0, 1, 2, 3, 1]
+    cells.set_arrays({"atom_density": np.full(5, 0.1)})
+    assert [cell.atom_density for cell in cells] == [0.1] * 5
+    with pytest.raises(ValueError):
+        cells.set_arrays({"atom_density": [1.0]})
+    with pytest.raises(KeyError):
+        cells.set_arrays({"material": [0, 1, 2, 3, 1000]})
+    with pytest.raises(TypeError):
+        cells.set_arrays({"material": [0, 1, 2, 3, 1.5]})
+    with pytest.raises(TypeError):
+        cells.set_arrays([1, 2])
+    with pytest.raises(ValueError):
+        montepy.cells.Cells(list(cells)).set_arrays({"material": [0] * 5})
+    # nothing is set if any numbers are bad
+    assert cells.to_arrays(["material"])["material"].tolist() == [0, 1, 2, 3, 1]
+
+
+@pytest.mark.parametrize(
+    "collection, conditions, expected",
+    [
+        ("cells", {}, [1, 2, 3, 99, 5]),
+        ("cells", {"material__in": [1, 2, 3]}, [1, 2, 3]),
+        ("cells", {"universe": 0, "material": None}, [99, 5]),
+        ("cells", {"material__ne": 0}, [1, 2, 3]),
+        ("cells", {"atom_density__lt": 10}, [2]),
+        ("cells", {"atom_density__ge": 8, "number__ne": 1}, [2]),
+        ("cells", {"atom_density": None}, [3, 99, 5]),
+        ("cells", {"importance__neutron__gt": 0.5}, [1, 2, 3, 5]),
+        ("cells", {"universe__in": []}, []),
+        ("surfaces", {"surface_type": "PZ"}, [1020, 1025]),
+        ("surfaces", {"surface_type": montepy.SurfaceType.SO}, [1000, 1010]),
+        ("surfaces", {"location__gt": 10.0}, [1025]),
+        ("surfaces", {"surface_type": "PZ", "location__le": 10.0}, [1020]),
+        ("materials", {"number__le": 2}, [1, 2]),
+    ],
+)
+def test_num_collect_where(cp_simple_problem, collection, conditions, expected):
+    found = getattr(cp_simple_problem, collection).where(**conditions)
+    assert isinstance(found, type(getattr(cp_simple_problem, collection)))
+    assert [obj.number for obj in found] == expected
+
+
+def test_num_collect_where_updates(cp_simple_problem):
+    cells = cp_simple_problem.cells
+    mat = cp_simple_problem.materials[2]
+    assert [cell.number for cell in cells.where(material=mat)] == [2]
+    cells[5].material = mat
+    assert [cell.number for cell in cells.where(material=mat)] == [2, 5]
+    assert [cell.number for cell in cells.where(material=None)] == [99]
+    mat.number = 20
+    assert [cell.number for cell in cells.where(material=20)] == [2, 5]
+    cells.remove(cells[2])
+    assert [cell.number for cell in cells.where(material=20)] == [5]
+    cells[5].importance.neutron = 0.0
+    assert [cell.number for cell in cells.where(importance__neutron=0)] == [99, 5]
+    surfs = cp_simple_problem.surfaces
+    assert [surf.number for surf in surfs.pz] == [1020, 1025]
+    for surf in surfs.pz:
+        surf.location += 10
+    assert [surf.number for surf in surfs.where(location__gt=20.0)] == [1025]
+    with pytest.raises(AttributeError):
+        cells.where(foo=1)
+    with pytest.raises(TypeError):
+        cells.where(material__in=5)
+    with pytest.raises(TypeError):
+        cells.where(atom_density__lt=None)
+    with pytest.raises(TypeError):
+        surfs.where(surface_constants__lt=1)
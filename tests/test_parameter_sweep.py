@@ -0,0 +1,118 @@
+# Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
+import io
+import os
+import pytest
+
+import montepy
+
+
+@pytest.fixture
+def problem():
+    return montepy.read_input("tests/inputs/test.imcnp")
+
+
+def _set_density(problem, density):
+    problem.cells[2].atom_density = density
+
+
+def _renumber(problem, param):
+    problem.cells[3].number = param["number"]
+
+
+def _write_to_string(problem):
+    stream = io.StringIO()
+    problem.write_problem(stream)
+    return stream.getvalue()
+
+
+@pytest.mark.filterwarnings("ignore::montepy.errors.LineExpansionWarning")
+@pytest.mark.parametrize("workers", [1, 2])
+def test_sweep(problem, tmp_path, workers):
+    gold = _write_to_string(problem)
+    densities = [0.5, 0.25, 0.125]
+    paths = montepy.sweep(problem, _set_density, densities, tmp_path, workers)
+    assert paths == [
+        os.path.join(tmp_path, f"variant_{i}.imcnp") for i in range(len(densities))
+    ]
+    assert sorted(os.listdir(tmp_path)) == [os.path.basename(path) for path in paths]
+    for path, density in zip(paths, densities):
+        expected = problem.clone()
+        _set_density(expected, density)
+        with open(path) as fh:
+            assert fh.read() == _write_to_string(expected)
+    # the problem is unchanged, and its last written file is kept
+    assert _write_to_string(problem) == gold
+    assert problem._write_record is None
+
+
+def _set_thermal_scattering(problem, law):
+    problem.materials[3].thermal_scattering.add_scattering_law(law)
+
+
+@pytest.mark.filterwarnings("ignore::montepy.errors.LineExpansionWarning")
+@pytest.mark.parametrize("workers", [1, 2])
+def test_sweep_thermal_scattering(problem, tmp_path, workers):
+    laws = ["lwtr.20t", "grph.20t"]
+    paths = montepy.sweep(problem, _set_thermal_scattering, laws, tmp_path, workers)
+    for path, law in zip(paths, laws):
+        expected = problem.clone()
+        _set_thermal_scattering(expected, law)
+        with open(path) as fh:
+            written = fh.read()
+        assert written == _write_to_string(expected)
+        assert law in written
+    assert len(problem.materials[3].thermal_scattering.thermal_scattering_laws) == 3
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_sweep_warnings(problem, tmp_path, workers):
+    params = [{"number": 30}, {"number": 40}]
+    with pytest.warns(montepy.errors.LineExpansionWarning):
+        paths = montepy.sweep(
+            problem, _renumber, params, tmp_path, workers, name="cell_{number}.i"
+        )
+    assert [os.path.basename(path) for path in paths] == ["cell_30.i", "cell_40.i"]
+    for path, param in zip(paths, params):
+        assert param["number"] in montepy.read_input(path).cells.numbers
+    assert 3 in problem.cells.numbers
+
+
+@pytest.mark.filterwarnings("ignore::montepy.errors.LineExpansionWarning")
+def test_sweep_written_problem(problem, tmp_path):
+    base = tmp_path / "base.imcnp"
+    problem.write_problem(base)
+    record = problem._write_record
+    (tmp_path / "variants").mkdir()
+    montepy.sweep(problem, _set_density, [0.5], tmp_path / "variants")
+    assert problem._write_record is record
+    assert os.listdir(tmp_path / "variants") == ["variant_0.imcnp"]
+
+
+@pytest.mark.parametrize(
+    "args, kwargs, error",
+    [
+        (("foo", _set_density, [1.0]), {}, TypeError),
+        ((None, 5, [1.0]), {}, TypeError),
+        ((None, _set_density, [1.0]), {"workers": 1.5}, TypeError),
+        ((None, _set_density, [1.0]), {"workers": 0}, ValueError),
+        ((None, _set_density, [1.0]), {"name": 5}, TypeError),
+        ((None, _set_density, [1.0]), {"overwrite": 1}, TypeError),
+        ((None, _set_density, [1.0, 2.0]), {"name": "same.imcnp"}, ValueError),
+    ],
+)
+def test_sweep_bad(problem, tmp_path, args, kwargs, error):
+    args = tuple(problem if arg is None else arg for arg in args)
+    with pytest.raises(error):
+        montepy.sweep(*args, tmp_path, **kwargs)
+    with pytest.raises(TypeError):
+        montepy.sweep(problem, _set_density, [1.0], 5)
+
+
+@pytest.mark.filterwarnings("ignore::montepy.errors.LineExpansionWarning")
+def test_sweep_overwrite(problem, tmp_path):
+    (tmp_path / "variant_1.imcnp").write_text("foo")
+    with pytest.raises(FileExistsError):
+        montepy.sweep(problem, _set_density, [0.5, 0.25], tmp_path)
+    assert os.listdir(tmp_path) == ["variant_1.imcnp"]
+    montepy.sweep(problem, _set_density, [0.5, 0.25], tmp_path, overwrite=True)
+    assert "0.25" in (tmp_path / "variant_1.imcnp").read_text()
@@ -304,3 +304,24 @@ class testSurfaces(TestCase):
         # test length issues
         with self.assertRaises(ValueError):
             surf.coordinates = [3, 4, 5]
+
+    def test_surface_transform_linking(self):
+        transform = montepy.data_inputs.transform.Transform(
+            Input(["tr5 0.0 0.0 1.0"], BlockType.DATA)
+        )
+        surfs = montepy.surface_collection.Surfaces()
+        # brute force through the data inputs
+        surf = surface_builder(Input(["1 5 PZ 0"], BlockType.SURFACE))
+        surf.update_pointers(surfs, [transform])
+        self.assertIs(surf.transform, transform)
+        # use the problem's transforms
+        problem = montepy.MCNP_Problem(None)
+        problem.transforms.append(transform)
+        surf = surface_builder(Input(["2 5 PZ 0"], BlockType.SURFACE))
+        surf.link_to_problem(problem)
+        surf.update_pointers(surfs, [])
+        self.assertIs(surf.transform, transform)
+        surf = surface_builder(Input(["3 6 PZ 0"], BlockType.SURFACE))
+        surf.link_to_problem(problem)
+        with self.assertRaises(montepy.errors.BrokenObjectLinkError):
+            surf.update_pointers(surfs, [transform])
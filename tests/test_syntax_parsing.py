@@ -253,6 +253,23 @@ class TestValueNode(TestCase):
                 warnings.simplefilter("error")
                 self.assertEqual(node.format(), answer)
 
+    def test_value_format_shared(self):
+        nodes = [
+            syntax_node.ValueNode(token, float)
+            for token in ["1.23e-05", "4.56e-07", "9.87e-01"]
+        ]
+        for node, val in zip(nodes, [1.5, 2.5e10, 7.0]):
+            node.value = val
+        self.assertEqual(
+            [node.format() for node in nodes], ["1.50e+00", "2.50e+10", "7.00e+00"]
+        )
+        self.assertIs(nodes[0]._formatter, nodes[1]._formatter)
+        self.assertIs(nodes[0]._formatter, nodes[2]._formatter)
+        other = syntax_node.ValueNode("1.234e-05", float)
+        other.value = 1.5
+        self.assertEqual(other.format(), "1.500e+00")
+        self.assertIsNot(nodes[0]._formatter, other._formatter)
+
     def test_value_str_format(self):
         for input, val, answer, expand in [
             ("hi", "foo", "foo", True),
@@ -906,6 +923,50 @@ def test_shortcut_expansion_valid(test, answer):
     assert parsed.format() == test
 
 
+@pytest.mark.parametrize("test, answer", tests.items())
+def test_shortcut_values_lazy(test, answer):
+    parser = ShortcutTestFixture()
+    input = Input([test], BlockType.DATA)
+    parsed = parser.parse(input.tokenize())
+    values = []
+    for node in parsed.nodes:
+        if isinstance(node, syntax_node.ShortcutNode):
+            values += list(node.values)
+        else:
+            values.append(node.value)
+    for val, gold in zip(values, answer):
+        if val is None:
+            assert gold == montepy.Jump()
+        else:
+            assert val == pytest.approx(gold)
+    assert len(values) == len(answer)
+    assert parsed.format() == test
+
+
+def test_shortcut_lazy_expansion():
+    parser = ShortcutTestFixture()
+    input = Input(["1 99999r 0 99999i 1 50j"], BlockType.DATA)
+    parsed = parser.parse(input.tokenize())
+    repeat, interp, jump = [
+        node for node in parsed.nodes if isinstance(node, syntax_node.ShortcutNode)
+    ]
+    for shortcut in [repeat, interp, jump]:
+        assert shortcut._virtual_count > 0
+    assert len(repeat) == 100_000
+    assert len(interp) == 100_001
+    assert len(jump) == 50
+    assert repeat.values.sum() == pytest.approx(100_000)
+    assert interp.values[-2] == pytest.approx(1 - 1e-5)
+    assert parsed.format() == "1 99999r 0 99999i 1 50j"
+    assert repeat._virtual_count > 0
+    # editing forces the nodes to exist
+    nodes = list(repeat.nodes)
+    assert repeat._virtual_count == 0
+    assert len(nodes) == 100_000
+    nodes[5].value = 2.0
+    assert repeat.values[5] == pytest.approx(2.0)
+
+
 @pytest.mark.parametrize(
     "test",
     [
@@ -1154,6 +1215,25 @@ class TestShortcutListIntegration(TestCase):
         self.assertEqual(list(list_node), values)
         self.assertEqual(len(list_node._shortcuts[1].nodes), 1)
 
+    def test_shortcut_list_long_runs(self):
+        input = Input(["1 999R 0 998I 1 500J 2 2 ilog 2000"], BlockType.DATA)
+        list_node = self.parser.parse(input.tokenize())
+        values = list(list_node)
+        list_node.update_with_new_values(values)
+        self.assertEqual(list(list_node), values)
+        self.assertEqual(
+            [len(shortcut) for shortcut in list_node._shortcuts], [1000, 1000, 500, 3]
+        )
+        self.assertEqual(list_node.format(), "1 999R 0 998I 1 500J 2 2 ilog 2000")
+        # break a run in the middle, and add a value that can't be consumed
+        values[500].value = 5.0
+        values.insert(1000, syntax_node.ValueNode("1.0", float))
+        list_node.update_with_new_values(values)
+        self.assertEqual(list(list_node), values)
+        self.assertEqual(
+            [len(shortcut) for shortcut in list_node._shortcuts], [500, 1000, 500, 3]
+        )
+
     def test_shortcut_list_interpolate(self):
         # try with log interpolate
         input = Input(["1.0 0.01 2ILOG 10"], BlockType.DATA)
@@ -1620,3 +1700,16 @@ class DataInputTestFixture(montepy.data_inputs.data_input.DataInputAbstract):
 
     def _has_classifier(self):
         return self._has_classifier1
+
+
+def test_read_inputs_side_channel():
+    read_inputs = []
+    generator = input_syntax_reader.read_input_syntax(
+        MCNP_InputFile("tests/inputs/testReadRec1.imcnp"), read_inputs=read_inputs
+    )
+    inputs = list(generator)
+    assert inputs.count(None) == 2
+    assert [read_input.file_name for read_input in read_inputs] == [
+        "testReadRec2.imcnp",
+        "testReadRec3.imcnp",
+    ]
@@ -1,7 +1,8 @@
 # Copyright 2024, Battelle Energy Alliance, LLC All Rights Reserved.
 from unittest import TestCase
 
-from montepy.utilities import fortran_float
+from montepy.input_parser.syntax_node import ValueNode
+from montepy.utilities import fortran_float, make_prop_pointer, make_prop_val_node
 
 
 class testFortranFloat(TestCase):
@@ -18,3 +19,59 @@ class testFortranFloat(TestCase):
     def test_raise_error(self):
         with self.assertRaises(ValueError):
             fortran_float("Dog")
+
+
+class _PropHolder:
+    def __init__(self):
+        self._pointer = None
+        self._node = ValueNode("1.0", float)
+        self._computed = 5
+
+    @make_prop_pointer("_pointer", (), deletable=True)
+    def pointer(self):
+        """A pointer to another holder"""
+        pass
+
+    @make_prop_val_node("_node", (float, int), float)
+    def value(self):
+        """A float value"""
+        pass
+
+    @make_prop_pointer("_computed", int)
+    def computed(self):
+        return self._computed * 2
+
+
+class _SubPropHolder(_PropHolder):
+    pass
+
+
+class testPropertyFactories(TestCase):
+    def test_prop_pointer(self):
+        holder = _SubPropHolder()
+        self.assertIsNone(holder.pointer)
+        # the type is the class that defines the property
+        other = _PropHolder()
+        holder.pointer = other
+        self.assertIs(holder.pointer, other)
+        other.pointer = holder
+        with self.assertRaises(TypeError):
+            holder.pointer = "hi"
+        del holder.pointer
+        self.assertIsNone(holder.pointer)
+        self.assertEqual(_PropHolder.pointer.__doc__, "A pointer to another holder")
+
+    def test_prop_val_node(self):
+        holder = _PropHolder()
+        self.assertEqual(holder.value, 1.0)
+        holder.value = 2
+        self.assertIsInstance(holder.value, float)
+        self.assertEqual(holder._node.value, 2.0)
+        with self.assertRaisesRegex(TypeError, "value must be of type"):
+            holder.value = "hi"
+
+    def test_prop_function_body(self):
+        holder = _PropHolder()
+        self.assertEqual(holder.computed, 10)
+        holder.computed = 0
+        self.assertEqual(holder.computed, 0)